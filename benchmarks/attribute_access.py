@@ -0,0 +1,59 @@
+"""
+Latency of reading 'cfg.section.entry' from a filled config, compared to the
+same read from plain classes with '__slots__' (the fastest attribute access
+Python offers) and to reading only the section or the entry.
+
+Run with: python -m benchmarks.attribute_access
+"""
+
+from nx_config import Config, ConfigSection
+from benchmarks.helpers import best_time
+
+n_reads = 1_000_000
+
+
+class PlainSection:
+    __slots__ = ("price",)
+
+    def __init__(self):
+        self.price = 1.5
+
+
+class PlainConfig:
+    __slots__ = ("pricing",)
+
+    def __init__(self):
+        self.pricing = PlainSection()
+
+
+class PricingSection(ConfigSection):
+    price: float = 1.5
+
+
+class PricingConfig(Config):
+    pricing: PricingSection
+
+
+def main():
+    plain = PlainConfig()
+    cfg = PricingConfig()
+    plain_section = plain.pricing
+    section = cfg.pricing
+    # Code objects running the reads in a loop, so that the loop overhead is
+    # the same for all variants (and small compared to a function call):
+    loop = f"for _ in range({n_reads}): x"
+
+    for label, code, namespace in (
+        ("plain __slots__: cfg.section.entry", f"{loop}.pricing.price", {"x": plain}),
+        ("nx_config: cfg.section.entry", f"{loop}.pricing.price", {"x": cfg}),
+        ("plain __slots__: section.entry", f"{loop}.price", {"x": plain_section}),
+        ("nx_config: section.entry", f"{loop}.price", {"x": section}),
+        ("nx_config: cfg.section", f"{loop}.pricing", {"x": cfg}),
+    ):
+        compiled = compile(code, "<benchmark>", "exec")
+        seconds = best_time(lambda: exec(compiled, namespace), number=1)
+        print(f"{label:<48} {seconds / n_reads * 1e9:12.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Filling 1200 configs (20 sections of 10 entries each) from YAML files, serially
+with 'fill_config_from_path' and with 'fill_configs' on 1 to N processes
+(N = number of CPUs).
+
+Run with: python -m benchmarks.bulk_fill
+"""
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from nx_config import fill_config_from_path, fill_configs
+from benchmarks.helpers import make_config_class, report
+
+n_files = 1200
+n_sections = 20
+n_entries = 10
+
+# Worker processes unpickle configs by reference to their classes, so the
+# (dynamically created) classes must be reachable as globals of this module:
+BenchConfig = make_config_class(n_sections, n_entries)
+BenchSection = BenchConfig.__annotations__["section0"]
+BenchConfig.__module__ = BenchSection.__module__ = __name__
+
+
+def _timed(func) -> float:
+    start = perf_counter()
+    func()
+    return (perf_counter() - start) / n_files
+
+
+def main():
+    text = "\n".join(
+        f"section{sec_idx}:\n"
+        + "\n".join(f"  entry{idx}: {idx}" for idx in range(0, n_entries, 5))
+        for sec_idx in range(n_sections)
+    )
+
+    with TemporaryDirectory() as tmp_dir:
+        paths = [Path(tmp_dir) / f"config{idx}.yaml" for idx in range(n_files)]
+
+        for path in paths:
+            path.write_text(text)
+
+        def serial():
+            for p in paths:
+                fill_config_from_path(BenchConfig(), path=p)
+
+        report("serial, per config", _timed(serial))
+        n_workers = 1
+
+        while True:
+            duration = _timed(
+                lambda: fill_configs(
+                    BenchConfig, paths, max_workers=n_workers, chunksize=50
+                )
+            )
+            report(f"{n_workers} process(es), per config", duration)
+
+            if n_workers >= os.cpu_count():
+                break
+
+            n_workers = min(2 * n_workers, os.cpu_count())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Memory per config instance (measured with 'tracemalloc') for many tenant
+configs (10 sections of 20 entries each) filled from environment variables,
+with ordinary and with compact sections ('compact=True', without and with an
+'InternPool'). Each tenant config has a few values of its own (in the first
+section) and the same values as all other tenants for the rest, as in a
+multi-tenant process. Also shows the latency of reading an entry of each kind
+of section.
+
+Run with: python -m benchmarks.compact_sections
+"""
+
+import tracemalloc
+
+from nx_config import InternPool
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+from benchmarks.helpers import make_config_class, best_time
+
+n_configs = 5_000
+n_sections = 10
+n_entries = 20
+n_reads = 1_000_000
+
+
+def _env_map(tenant: int):
+    # Entries 3, 8, 13... are strings and entries 1, 6, 11... floats (see
+    # 'helpers'), all filled with values common to every tenant except for a
+    # tenant-specific name in the first section.
+    env_map = {}
+
+    for sec_idx in range(n_sections):
+        for entry_idx in range(1, n_entries, 5):
+            env_map[f"SECTION{sec_idx}__ENTRY{entry_idx}"] = "2.5"
+
+        for entry_idx in range(3, n_entries, 5):
+            env_map[f"SECTION{sec_idx}__ENTRY{entry_idx}"] = f"host{sec_idx}.example"
+
+    env_map["SECTION0__ENTRY3"] = f"tenant{tenant}"
+    return env_map
+
+
+def _bytes_per_config(config_t) -> float:
+    env_maps = [_env_map(x) for x in range(n_configs)]
+    tracemalloc.start()
+    configs = []
+
+    for env_map in env_maps:
+        cfg = config_t()
+        fill_config_w_oracles(cfg, None, None, None, env_map=env_map)
+        configs.append(cfg)
+
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / n_configs
+
+
+def _read_ns(config_t) -> float:
+    section = config_t().section0
+    code = compile(f"for _ in range({n_reads}): x.entry3", "<benchmark>", "exec")
+    namespace = {"x": section}
+    return best_time(lambda: exec(code, namespace), number=1) / n_reads * 1e9
+
+
+def main():
+    for label, compact, intern_pool in (
+        ("ordinary sections", False, None),
+        ("compact sections", True, None),
+        ("compact sections + pool", True, InternPool()),
+    ):
+        config_t = make_config_class(
+            n_sections, n_entries, compact=compact, intern_pool=intern_pool
+        )
+        # Warm-up (fill plan and generated code):
+        fill_config_w_oracles(config_t(), None, None, None, env_map=_env_map(0))
+        print(
+            f"{label:<24} {_bytes_per_config(config_t):10.0f} bytes per config"
+            f" {_read_ns(config_t):10.1f} ns per read"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Filling a config with 16 sections whose validators each wait 2 ms for
+(simulated) I/O, validating sequentially and on thread pools of different
+sizes.
+
+Run with: python -m benchmarks.concurrent_validation
+"""
+
+from time import sleep
+from types import new_class
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+from nx_config import Config, validate
+from benchmarks.helpers import make_section_class, best_time, report
+
+n_sections = 16
+n_entries = 10
+io_seconds = 0.002
+
+
+def _make_config_class() -> type:
+    section_t = make_section_class(n_entries, name="IOSection")
+
+    def wait_for_io(_section):
+        sleep(io_seconds)
+
+    # Validators are collected by the section metaclass, so they are added to
+    # a subclass rather than to the generated class.
+    io_section_t = new_class(
+        "ValidatedIOSection",
+        (section_t,),
+        exec_body=lambda ns: ns.update(wait_for_io=validate(wait_for_io)),
+    )
+
+    def body(ns):
+        ns["__annotations__"] = {
+            f"section{idx}": io_section_t for idx in range(n_sections)
+        }
+
+    return new_class("BenchConfig", (Config,), exec_body=body)
+
+
+def main():
+    config_t = _make_config_class()
+
+    for workers in (None, 1, 4, 16):
+
+        def fill():
+            fill_config_w_oracles(
+                config_t(),
+                None,
+                None,
+                None,
+                env_map={},
+                validation_workers=workers,
+            )
+
+        label = "sequential" if workers is None else f"{workers} validation workers"
+        report(label, best_time(fill, number=5))
+
+
+if __name__ == "__main__":
+    main()
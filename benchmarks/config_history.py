@@ -0,0 +1,80 @@
+"""
+Keeping a history of 16 configs (200 sections of 10 entries each, each config
+differing from the previous one in a single value) in a 'ConfigHolder':
+Publishing with and without history, rolling back, and the memory retained
+by the history with its shared sections versus 16 independent configs.
+
+Run with: python -m benchmarks.config_history
+"""
+
+import tracemalloc
+
+from nx_config import ConfigHolder
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+from benchmarks.helpers import make_config_class, best_time, report
+
+n_sections = 200
+n_entries = 10
+history = 16
+
+
+def _filled(config_t, version: int):
+    cfg = config_t()
+    env_map = {
+        f"SECTION{sec_idx}__ENTRY3": f"value{sec_idx}" for sec_idx in range(n_sections)
+    }
+    env_map[f"SECTION{version % n_sections}__ENTRY0"] = str(version)
+    fill_config_w_oracles(cfg, None, None, None, env_map=env_map)
+    return cfg
+
+
+def _retained_kb(make_configs) -> float:
+    tracemalloc.start()
+    retained = make_configs()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+    return size / 1024
+
+
+def main():
+    config_t = make_config_class(n_sections, n_entries)
+    # Fresh config objects for each publish, since publishing with history
+    # replaces sections of the published configs with shared ones.
+    n_publish = 50
+
+    for label, holder in (
+        ("publish without history", ConfigHolder(_filled(config_t, 0))),
+        ("publish with history", ConfigHolder(_filled(config_t, 0), history=history)),
+    ):
+        configs = iter([_filled(config_t, x) for x in range(1, n_publish + 1)])
+        report(
+            label,
+            best_time(
+                lambda: holder.publish(next(configs)), number=n_publish, repetitions=1
+            ),
+        )
+
+    report("rollback", best_time(lambda: holder.rollback(), number=1000))
+
+    def independent():
+        return [_filled(config_t, x) for x in range(history + 1)]
+
+    def shared():
+        holder = ConfigHolder(_filled(config_t, 0), history=history)
+
+        for x in range(1, history + 1):
+            holder.publish(_filled(config_t, x))
+
+        return holder
+
+    print(
+        f"{'memory of 17 independent configs':<48} {_retained_kb(independent):12.0f} kB"
+    )
+    print(f"{'memory of history (17 configs)':<48} {_retained_kb(shared):12.0f} kB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Contention between 64 reader threads (each reading an entry of the current
+config 20000 times) and a writer publishing a new config every millisecond,
+with a 'ConfigHolder' versus a shared variable protected by a lock.
+
+Run with: python -m benchmarks.config_holder
+"""
+
+from threading import Event, Lock, Thread
+from time import perf_counter
+
+from nx_config import ConfigHolder
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+from benchmarks.helpers import make_config_class, report
+
+n_readers = 64
+n_reads = 20_000
+publish_interval = 0.001
+
+
+class LockedHolder:
+    __slots__ = ("_current", "_lock")
+
+    def __init__(self, initial):
+        self._current = initial
+        self._lock = Lock()
+
+    @property
+    def current(self):
+        with self._lock:
+            return self._current
+
+    def publish(self, cfg):
+        with self._lock:
+            self._current = cfg
+
+
+def run(holder, make_config) -> float:
+    stop = Event()
+    n_published = 0
+
+    def reader():
+        for _ in range(n_reads):
+            _ = holder.current.section0.entry0
+
+    def writer():
+        nonlocal n_published
+
+        while not stop.wait(publish_interval):
+            holder.publish(make_config())
+            n_published += 1
+
+    writer_thread = Thread(target=writer)
+    readers = [Thread(target=reader) for _ in range(n_readers)]
+    writer_thread.start()
+    start = perf_counter()
+
+    for t in readers:
+        t.start()
+
+    for t in readers:
+        t.join()
+
+    duration = perf_counter() - start
+    stop.set()
+    writer_thread.join()
+    print(f"  ({n_published} configs published)")
+    return duration / (n_readers * n_reads)
+
+
+def main():
+    config_t = make_config_class(10, 10)
+
+    def make_config():
+        cfg = config_t()
+        fill_config_w_oracles(
+            cfg, in_stream=None, fmt=None, env_prefix=None, env_map={}
+        )
+        return cfg
+
+    report("read with lock", run(LockedHolder(make_config()), make_config))
+    report("read from ConfigHolder", run(ConfigHolder(make_config()), make_config))
+
+
+if __name__ == "__main__":
+    main()
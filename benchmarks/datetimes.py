@@ -0,0 +1,54 @@
+"""
+Conversion of collections of 10k ISO-8601 timestamps, as a comma-separated
+string (INI files and environment variables) and as a YAML list of strings,
+with the ISO-8601 fast path versus parsing every element with 'dateutil'.
+
+Run with: python -m benchmarks.datetimes
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Tuple
+
+# noinspection PyPackageRequirements
+from dateutil.parser import parse as dateutil_parse
+
+# noinspection PyProtectedMember
+from nx_config._core.conversion import string_converter, yaml_converter
+
+# noinspection PyProtectedMember
+from nx_config._core.type_checks import ConfigTypeInfo
+from benchmarks.helpers import best_time, report
+
+n_timestamps = 10_000
+
+
+def main():
+    start = datetime(2021, 5, 4, tzinfo=timezone.utc)
+    timestamps = [
+        (start + timedelta(minutes=15 * idx)).isoformat() for idx in range(n_timestamps)
+    ]
+    value_str = ", ".join(timestamps)
+    type_info = ConfigTypeInfo.from_type_hint(Tuple[datetime, ...])
+    convert_string = string_converter(type_info)
+    convert_yaml = yaml_converter(type_info)
+
+    def dateutil_only():
+        return tuple(dateutil_parse(x.strip()) for x in value_str.split(","))
+
+    assert dateutil_only() == convert_string(value_str) == convert_yaml(timestamps)
+
+    report(
+        f"dateutil only ({n_timestamps} timestamps)", best_time(dateutil_only, number=3)
+    )
+    report(
+        f"string, fast path ({n_timestamps} timestamps)",
+        best_time(lambda: convert_string(value_str), number=3),
+    )
+    report(
+        f"YAML list, fast path ({n_timestamps} timestamps)",
+        best_time(lambda: convert_yaml(timestamps), number=3),
+    )
+
+
+if __name__ == "__main__":
+    main()
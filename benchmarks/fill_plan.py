@@ -0,0 +1,41 @@
+"""
+Per-fill cost with and without the cached fill plan, for a config with 50
+sections of 10 entries each (a few of them set through environment variables).
+
+Run with: python -m benchmarks.fill_plan
+"""
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+# noinspection PyProtectedMember
+from nx_config._core.naming_utils import fill_plans_attr
+from benchmarks.helpers import make_config_class, best_time, report
+
+n_sections = 50
+n_entries = 10
+
+
+def main():
+    config_t = make_config_class(n_sections, n_entries)
+    env_map = {f"BENCH__SECTION{idx}__ENTRY0": str(idx) for idx in range(n_sections)}
+    plans = config_t.__dict__[fill_plans_attr]
+
+    def fill():
+        fill_config_w_oracles(
+            config_t(), in_stream=None, fmt=None, env_prefix="BENCH", env_map=env_map
+        )
+
+    def fill_without_cached_plan():
+        plans.clear()
+        fill()
+
+    uncached = best_time(fill_without_cached_plan, number=200)
+    cached = best_time(fill, number=200)
+    report(f"fill, plan rebuilt ({n_sections} sections)", uncached)
+    report(f"fill, cached plan ({n_sections} sections)", cached)
+    print(f"speedup: {uncached / cached:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Private dirty memory of forked worker processes sharing a config with 2000
+sections of 10 entries each (filled in the parent), with and without
+'freeze_process_heap' before forking (with the garbage collector disabled in
+the parent while filling). Each worker runs a full garbage collection
+(as would eventually happen on its own) and reads every entry once, then
+reports how much of its memory was copied from the parent, as the increase
+of 'Private_Dirty' in '/proc/self/smaps_rollup' (Linux only).
+
+Run with: python -m benchmarks.fork_memory
+"""
+
+import gc
+import os
+from multiprocessing import get_context
+
+from nx_config import freeze_process_heap
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+from benchmarks.helpers import make_config_class
+
+n_workers = 8
+n_sections = 2000
+n_entries = 10
+
+
+def _private_dirty_kb() -> int:
+    with open("/proc/self/smaps_rollup") as fstream:
+        for line in fstream:
+            if line.startswith("Private_Dirty:"):
+                return int(line.split()[1])
+
+    raise RuntimeError("No 'Private_Dirty' in '/proc/self/smaps_rollup'.")
+
+
+def _work(cfg, results):
+    # Runs in the forked worker, 'cfg' is inherited from the parent.
+    start_kb = _private_dirty_kb()
+    gc.collect()
+
+    for section_name in type(cfg).__annotations__:
+        section = getattr(cfg, section_name)
+
+        for entry_name in section:
+            getattr(section, entry_name)
+
+    results.put(_private_dirty_kb() - start_kb)
+
+
+def _measure(cfg) -> float:
+    ctx = get_context("fork")
+    results = ctx.SimpleQueue()
+    workers = [ctx.Process(target=_work, args=(cfg, results)) for _ in range(n_workers)]
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    return sum(results.get() for _ in workers) / n_workers
+
+
+def _filled_config():
+    config_t = make_config_class(n_sections, n_entries)
+    cfg = config_t()
+    env_map = {
+        f"SECTION{sec_idx}__ENTRY{idx}": str(sec_idx * idx)
+        for sec_idx in range(n_sections)
+        for idx in range(0, n_entries, 5)
+    }
+    fill_config_w_oracles(cfg, None, None, None, env_map=env_map)
+    return cfg
+
+
+def main():
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        print("This benchmark needs Linux (with '/proc/self/smaps_rollup').")
+        return
+
+    cfg = _filled_config()
+    print(f"{'plain fork':<48} {_measure(cfg):12.0f} kB private dirty per worker")
+    del cfg
+    gc.collect()
+
+    # The sequence recommended for 'gc.freeze', see 'freeze_process_heap':
+    gc.disable()
+    cfg = _filled_config()
+    freeze_process_heap()
+    print(
+        f"{'freeze_process_heap before fork':<48} {_measure(cfg):12.0f} kB private dirty per worker"
+    )
+    gc.unfreeze()
+    gc.enable()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from timeit import repeat
+from types import new_class
+from typing import Callable, Type, Tuple, Optional
+
+from nx_config import Config, ConfigSection, InternPool
+
+_entry_types = (int, float, bool, str, Optional[Tuple[int, ...]])
+_entry_defaults = (0, 0.0, False, "", None)
+
+
+def make_section_class(
+    n_entries: int,
+    name: str = "BenchSection",
+    compact: bool = False,
+    sparse: bool = False,
+    intern_pool: Optional[InternPool] = None,
+) -> type:
+    def body(ns):
+        annotations = {}
+
+        for idx in range(n_entries):
+            entry_name = f"entry{idx}"
+            annotations[entry_name] = _entry_types[idx % len(_entry_types)]
+            ns[entry_name] = _entry_defaults[idx % len(_entry_defaults)]
+
+        ns["__annotations__"] = annotations
+
+    kwds = {"compact": compact, "sparse": sparse, "intern_pool": intern_pool}
+    return new_class(name, (ConfigSection,), kwds, exec_body=body)
+
+
+def make_config_class(
+    n_sections: int,
+    n_entries: int,
+    compact: bool = False,
+    sparse: bool = False,
+    intern_pool: Optional[InternPool] = None,
+) -> Type[Config]:
+    section_t = make_section_class(
+        n_entries, compact=compact, sparse=sparse, intern_pool=intern_pool
+    )
+
+    def body(ns):
+        ns["__annotations__"] = {
+            f"section{idx}": section_t for idx in range(n_sections)
+        }
+
+    return new_class("BenchConfig", (Config,), exec_body=body)
+
+
+def best_time(
+    func: Callable[[], object], *, number: int, repetitions: int = 5
+) -> float:
+    return min(repeat(func, number=number, repeat=repetitions)) / number
+
+
+def report(label: str, seconds: float):
+    print(f"{label:<48} {seconds * 1e6:12.2f} us")
@@ -0,0 +1,70 @@
+"""
+Reloading an INI file for a config with 200 sections of 10 entries each after
+one value changed, with a full and with an incremental refill (plus parsing
+alone, which both need).
+
+Run with: python -m benchmarks.incremental_reload
+"""
+
+from io import StringIO
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_plan import get_fill_plan
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import (
+    fill_config_w_oracles,
+    parse_stream,
+    refill_config_w_oracles,
+)
+from nx_config import Format
+from benchmarks.helpers import make_config_class, best_time, report
+
+n_sections = 200
+n_entries = 10
+
+
+def main():
+    config_t = make_config_class(n_sections, n_entries)
+    text = "\n".join(
+        f"[section{sec_idx}]\n"
+        + "\n".join(f"entry{idx} = {idx}" for idx in range(0, n_entries, 3))
+        for sec_idx in range(n_sections)
+    )
+    changed_text = text.replace("[section7]\nentry0 = 0", "[section7]\nentry0 = 1")
+    previous_cfg = config_t()
+    inputs, _ = refill_config_w_oracles(
+        previous_cfg, StringIO(text), Format.ini, None, {}, None, None, None
+    )
+
+    def full():
+        fill_config_w_oracles(
+            config_t(), StringIO(changed_text), Format.ini, None, env_map={}
+        )
+
+    def incremental():
+        refill_config_w_oracles(
+            config_t(),
+            StringIO(changed_text),
+            Format.ini,
+            None,
+            {},
+            None,
+            previous_cfg,
+            inputs,
+        )
+
+    plan = get_fill_plan(config_t, None)
+    report(
+        "parsing only",
+        best_time(
+            lambda: parse_stream(StringIO(changed_text), Format.ini, plan, None),
+            number=20,
+        ),
+    )
+    report("full reload", best_time(full, number=20))
+    report("incremental reload", best_time(incremental, number=20))
+
+
+if __name__ == "__main__":
+    main()
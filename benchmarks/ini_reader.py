@@ -0,0 +1,40 @@
+"""
+Reading a shared INI file (200 sections of 50 options, only 5 of those
+sections declared in the target config) with 'configparser.ConfigParser'
+versus the single-pass reader used by 'fill_config'.
+
+Run with: python -m benchmarks.ini_reader
+"""
+
+from configparser import ConfigParser
+from io import StringIO
+
+# noinspection PyProtectedMember
+from nx_config._core.ini_reader import read_ini
+from benchmarks.helpers import best_time, report
+
+n_sections = 200
+n_options = 50
+n_wanted_sections = 5
+
+
+def main():
+    text = "\n".join(
+        f"[section{sec_idx}]\n"
+        + "\n".join(f"option{idx} = value {idx}" for idx in range(n_options))
+        for sec_idx in range(n_sections)
+    )
+    wanted = {
+        f"section{idx}": {f"option{x}": f"option{x}" for x in range(n_options)}
+        for idx in range(n_wanted_sections)
+    }
+
+    def config_parser():
+        ConfigParser().read_file(StringIO(text))
+
+    report("ConfigParser", best_time(config_parser, number=10))
+    report("read_ini", best_time(lambda: read_ini(StringIO(text), wanted), number=10))
+
+
+if __name__ == "__main__":
+    main()
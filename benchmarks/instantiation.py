@@ -0,0 +1,46 @@
+"""
+Cost of instantiating a config with 50 sections of 10 entries each, using the
+generated '__init__' methods versus a generic loop over the annotations (which
+is what 'Config.__init__' and 'ConfigSection.__init__' used to do).
+
+Run with: python -m benchmarks.instantiation
+"""
+
+# noinspection PyProtectedMember
+from nx_config._core.iteration_utils import get_annotations
+
+# noinspection PyProtectedMember
+from nx_config._core.naming_utils import internal_name
+from benchmarks.helpers import make_config_class, best_time, report
+
+n_sections = 50
+n_entries = 10
+
+
+def main():
+    config_t = make_config_class(n_sections, n_entries)
+    sections = tuple(
+        (internal_name(k), v) for k, v in get_annotations(config_t).items()
+    )
+
+    def generic_init():
+        cfg = object.__new__(config_t)
+
+        for attr, section_t in sections:
+            section = object.__new__(section_t)
+
+            for entry_name in get_annotations(section_t):
+                entry = getattr(section_t, entry_name)
+                setattr(section, internal_name(entry_name), entry.default)
+
+            setattr(cfg, attr, section)
+
+    generic = best_time(generic_init, number=500)
+    generated = best_time(config_t, number=500)
+    report(f"generic __init__ ({n_sections} sections)", generic)
+    report(f"generated __init__ ({n_sections} sections)", generated)
+    print(f"speedup: {generic / generated:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
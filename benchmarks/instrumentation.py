@@ -0,0 +1,41 @@
+"""
+Per-fill cost for a config with 50 sections of 10 entries each, without an
+observer, with a no-op observer and with one receiving an event per entry.
+
+Run with: python -m benchmarks.instrumentation
+"""
+
+from nx_config import FillObserver
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+from benchmarks.helpers import make_config_class, best_time, report
+
+n_sections = 50
+n_entries = 10
+
+
+def main():
+    config_t = make_config_class(n_sections, n_entries)
+    env_map = {f"BENCH__SECTION{idx}__ENTRY0": str(idx) for idx in range(n_sections)}
+
+    def fill(observer):
+        fill_config_w_oracles(
+            config_t(),
+            in_stream=None,
+            fmt=None,
+            env_prefix="BENCH",
+            env_map=env_map,
+            observer=observer,
+        )
+
+    report("no observer", best_time(lambda: fill(None), number=200))
+    report("default observer", best_time(lambda: fill(FillObserver()), number=200))
+    report(
+        "all entries reported",
+        best_time(lambda: fill(FillObserver(entry_threshold_ns=0)), number=200),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Memory per config instance (measured with 'tracemalloc') and fill time for
+many tenant configs filled from (per-tenant) environment variables that are
+equal for 95% of the entries, with and without an 'InternPool' shared by all
+configs. Also reports the pool's hit rate and estimated bytes saved.
+
+Run with: python -m benchmarks.intern_pool
+"""
+
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from types import new_class
+from typing import FrozenSet, Optional, Tuple
+
+from nx_config import Config, ConfigSection, InternPool
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+n_configs = 5_000
+n_sections = 4
+_entries = {
+    "host": (str, "HOST{}.example.com"),
+    "data_dir": (Path, "/srv/data/{}"),
+    "valid_since": (datetime, "2021-05-04T09:15:00+02:00"),
+    "features": (Tuple[str, ...], "search, billing, export, audit, sso"),
+    "regions": (FrozenSet[str], "eu-west-1, us-east-1, ap-south-1"),
+}
+n_values = n_sections * len(_entries)
+
+
+def _make_config_class(intern_pool: Optional[InternPool]) -> type:
+    kwds = {} if intern_pool is None else {"intern_pool": intern_pool}
+
+    def section_body(ns):
+        ns["__annotations__"] = {k: t for k, (t, _) in _entries.items()}
+
+    section_t = new_class("TenantSection", (ConfigSection,), kwds, section_body)
+
+    def config_body(ns):
+        ns["__annotations__"] = {f"section{x}": section_t for x in range(n_sections)}
+
+    return new_class("TenantConfig", (Config,), exec_body=config_body)
+
+
+def _env_map(tenant: int):
+    # Fresh strings for each tenant (as if read from their own files). Every
+    # 20th value is tenant-specific.
+    env_map = {}
+
+    for value_idx in range(n_values):
+        sec_idx, entry_idx = divmod(value_idx, len(_entries))
+        entry_name, (_, value) = list(_entries.items())[entry_idx]
+        specific = (tenant * n_values + value_idx) % 20 == 0
+        env_map[f"SECTION{sec_idx}__{entry_name.upper()}"] = value.format(
+            tenant if specific else sec_idx
+        )
+
+    return env_map
+
+
+def _fill_all(config_t, env_maps):
+    configs = []
+
+    for env_map in env_maps:
+        cfg = config_t()
+        fill_config_w_oracles(cfg, None, None, None, env_map=env_map)
+        configs.append(cfg)
+
+    return configs
+
+
+def _measure(config_t, pool: InternPool):
+    env_maps = [_env_map(x) for x in range(n_configs)]
+    # Timed without 'tracemalloc', which slows down allocations:
+    start = perf_counter()
+    _fill_all(config_t, env_maps)
+    seconds = perf_counter() - start
+    pool.clear()
+    tracemalloc.start()
+    configs = _fill_all(config_t, env_maps)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del configs
+    return size / n_configs, seconds / n_configs
+
+
+def main():
+    pool = InternPool(maxsize=4096)
+
+    for label, config_t in (
+        ("without pool", _make_config_class(None)),
+        ("with InternPool", _make_config_class(pool)),
+    ):
+        bytes_per_config, seconds = _measure(config_t, pool)
+        print(
+            f"{label:<24} {bytes_per_config:10.0f} bytes per config"
+            f" {seconds * 1e6:10.1f} us per fill"
+        )
+
+    print(
+        f"pool: {pool.hit_rate:.1%} hit rate,"
+        f" {pool.bytes_saved / n_configs:.0f} bytes saved per config (estimated)"
+    )
+
+
+if __name__ == "__main__":
+    main()
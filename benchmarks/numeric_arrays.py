@@ -0,0 +1,80 @@
+"""
+Memory (measured with 'tracemalloc') and fill time of a section with a single
+entry of 200k numbers, declared as 'Tuple[int, ...]' / 'Tuple[float, ...]'
+and as 'IntArray' / 'FloatArray', filled from a comma separated environment
+variable and from a YAML list.
+
+Run with: python -m benchmarks.numeric_arrays
+"""
+
+import tracemalloc
+from io import StringIO
+from types import new_class
+from typing import Tuple
+
+from nx_config import Config, ConfigSection, FloatArray, Format, IntArray
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+from benchmarks.helpers import best_time, report
+
+n_elements = 200_000
+
+
+def _make_config_class(entry_t: type) -> type:
+    def section_body(ns):
+        ns["__annotations__"] = {"values": entry_t}
+
+    section_t = new_class("BenchSection", (ConfigSection,), exec_body=section_body)
+
+    def config_body(ns):
+        ns["__annotations__"] = {"section": section_t}
+
+    return new_class("BenchConfig", (Config,), exec_body=config_body)
+
+
+def _fill(config_t: type, values_str: str, fmt: Format):
+    cfg = config_t()
+
+    if fmt == Format.yaml:
+        in_stream = StringIO(f"section:\n  values: [{values_str}]")
+        fill_config_w_oracles(cfg, in_stream, fmt, None, env_map={})
+    else:
+        env_map = {"SECTION__VALUES": values_str}
+        fill_config_w_oracles(cfg, None, None, None, env_map=env_map)
+
+    return cfg
+
+
+def _bytes_per_config(config_t: type, values_str: str) -> float:
+    tracemalloc.start()
+    cfg = _fill(config_t, values_str, Format.ini)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cfg
+    return size
+
+
+def main():
+    ints_str = ", ".join(str(x * 7919 % 1_000_003) for x in range(n_elements))
+    floats_str = ", ".join(str(x / 7.0) for x in range(n_elements))
+
+    for label, entry_t, values_str in (
+        ("Tuple[int, ...]", Tuple[int, ...], ints_str),
+        ("IntArray", IntArray, ints_str),
+        ("Tuple[float, ...]", Tuple[float, ...], floats_str),
+        ("FloatArray", FloatArray, floats_str),
+    ):
+        config_t = _make_config_class(entry_t)
+        print(f"{label:<48} {_bytes_per_config(config_t, values_str):12.0f} bytes")
+
+        for fmt in (Format.ini, Format.yaml):
+            seconds = best_time(
+                lambda: _fill(config_t, values_str, fmt), number=1, repetitions=3
+            )
+            source = "env" if fmt == Format.ini else "yaml"
+            report(f"  fill from {source}", seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Repeatedly filling configs (20 sections of 10 entries) from the same YAML
+file, with and without a 'ParsedFileCache'.
+
+Run with: python -m benchmarks.parsed_file_cache
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from nx_config import fill_config_from_path, ParsedFileCache
+from benchmarks.helpers import best_time, make_config_class, report
+
+n_sections = 20
+n_entries = 10
+
+
+def main():
+    config_t = make_config_class(n_sections, n_entries)
+    text = "\n".join(
+        f"section{sec_idx}:\n"
+        + "\n".join(f"  entry{idx}: {idx}" for idx in range(0, n_entries, 5))
+        for sec_idx in range(n_sections)
+    )
+
+    with TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "config.yaml"
+        path.write_text(text)
+        cache = ParsedFileCache()
+
+        def uncached():
+            fill_config_from_path(config_t(), path=path)
+
+        def cached():
+            fill_config_from_path(config_t(), path=path, cache=cache)
+
+        report("uncached", best_time(uncached, number=100))
+        report("cached", best_time(cached, number=100))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Getting a config with 200 sections of 10 entries each in a worker process:
+Filling it from a YAML file, rebuilding it from a SharedConfig after a publish
+and reading the (unchanged) SharedConfig's current config.
+
+Run with: python -m benchmarks.shared_config
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from nx_config import SharedConfig, fill_config_from_path
+from benchmarks.helpers import make_config_class, best_time, report
+
+n_sections = 200
+n_entries = 10
+
+
+def main():
+    config_t = make_config_class(n_sections, n_entries)
+    text = "\n".join(
+        f"section{sec_idx}:\n"
+        + "\n".join(f"  entry{idx}: {idx}" for idx in range(0, n_entries, 5))
+        for sec_idx in range(n_sections)
+    )
+
+    with TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "config.yaml"
+        path.write_text(text)
+        cfg = config_t()
+        fill_config_from_path(cfg, path=path)
+
+        def fill():
+            fill_config_from_path(config_t(), path=path)
+
+        report("fill from YAML file", best_time(fill, number=20))
+
+    with SharedConfig.create(cfg) as shared:
+        with SharedConfig.attach(config_t, name=shared.name) as attached:
+
+            def rebuild():
+                shared.publish(cfg)
+                return attached.current
+
+            report(
+                "publish + rebuild from shared memory", best_time(rebuild, number=20)
+            )
+            report(
+                "read unchanged shared config",
+                best_time(lambda: attached.current, number=10000),
+            )
+
+
+if __name__ == "__main__":
+    main()
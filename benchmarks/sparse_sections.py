@@ -0,0 +1,71 @@
+"""
+Memory per config instance (measured with 'tracemalloc') for many configs
+with large, mostly-default sections (4 sections of 300 tuning knobs each, 3
+of them overridden per section through environment variables), with
+ordinary, compact and sparse sections. Also shows the latency of reading an
+overridden and a default entry of each kind of section.
+
+Run with: python -m benchmarks.sparse_sections
+"""
+
+import tracemalloc
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+from benchmarks.helpers import make_config_class, best_time
+
+n_configs = 2_000
+n_sections = 4
+n_entries = 300
+n_reads = 1_000_000
+
+
+def _env_map(tenant: int):
+    # Entries 0, 5, 10... are ints (see 'helpers').
+    return {
+        f"SECTION{sec_idx}__ENTRY{entry_idx}": str(1000 + tenant)
+        for sec_idx in range(n_sections)
+        for entry_idx in (0, 5, 10)
+    }
+
+
+def _bytes_per_config(config_t) -> float:
+    env_maps = [_env_map(x) for x in range(n_configs)]
+    tracemalloc.start()
+    configs = []
+
+    for env_map in env_maps:
+        cfg = config_t()
+        fill_config_w_oracles(cfg, None, None, None, env_map=env_map)
+        configs.append(cfg)
+
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / n_configs
+
+
+def _read_ns(section, entry_name: str) -> float:
+    code = compile(f"for _ in range({n_reads}): x.{entry_name}", "<benchmark>", "exec")
+    namespace = {"x": section}
+    return best_time(lambda: exec(code, namespace), number=1) / n_reads * 1e9
+
+
+def main():
+    for label, kwds in (
+        ("ordinary sections", {}),
+        ("compact sections", {"compact": True}),
+        ("sparse sections", {"sparse": True}),
+    ):
+        config_t = make_config_class(n_sections, n_entries, **kwds)
+        # Warm-up (fill plan and generated code):
+        cfg = config_t()
+        fill_config_w_oracles(cfg, None, None, None, env_map=_env_map(0))
+        print(
+            f"{label:<24} {_bytes_per_config(config_t):10.0f} bytes per config"
+            f" {_read_ns(cfg.section0, 'entry5'):8.1f} ns per read (overridden)"
+            f" {_read_ns(cfg.section0, 'entry6'):8.1f} ns per read (default)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Parsing a large (~2 MB) generated YAML config file with the libyaml-based
+loader versus the pure python loader, plus which loader is used by default in
+the current environment.
+
+Run with: python -m benchmarks.yaml_loaders
+"""
+
+from io import StringIO
+
+# noinspection PyPackageRequirements
+import yaml
+
+from nx_config import YAMLLoader
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import _load_yaml
+from benchmarks.helpers import best_time, report
+
+n_sections = 700
+n_entries = 100
+
+
+def _generate_yaml() -> str:
+    lines = []
+
+    for sec_idx in range(n_sections):
+        lines.append(f"section{sec_idx}:")
+
+        for entry_idx in range(n_entries):
+            if entry_idx % 4 == 0:
+                value = f"[{entry_idx}, {entry_idx + 1}, {entry_idx + 2}]"
+            elif entry_idx % 4 == 1:
+                value = f"'some string value number {entry_idx}'"
+            elif entry_idx % 4 == 2:
+                value = f"{entry_idx}.5"
+            else:
+                value = "2021-05-04T09:15:00Z"
+
+            lines.append(f"  entry{entry_idx}: {value}")
+
+    return "\n".join(lines)
+
+
+def main():
+    text = _generate_yaml()
+    print(f"YAML size: {len(text) / 1e6:.2f} MB")
+    print(f"PyYAML built with libyaml: {yaml.__with_libyaml__}")
+    default_t = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    print(f"Default loader: {default_t.__name__}")
+
+    loaders = [YAMLLoader.pure_python]
+
+    if yaml.__with_libyaml__:
+        loaders.append(YAMLLoader.libyaml)
+
+    for loader in loaders:
+        seconds = best_time(
+            lambda: _load_yaml(StringIO(text), loader), number=1, repetitions=3
+        )
+        report(f"{loader.name}", seconds)
+
+
+if __name__ == "__main__":
+    main()
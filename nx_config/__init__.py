@@ -1,15 +1,27 @@
+# noinspection PyUnresolvedReferences
+from .async_fill import fill_config_async, fill_config_from_path_async, watch_config
+
+# noinspection PyUnresolvedReferences
+from .bulk_fill import fill_configs
+
 # noinspection PyUnresolvedReferences
 from .cli import add_cli_options
 
 # noinspection PyUnresolvedReferences
 from .config import Config
 
+# noinspection PyUnresolvedReferences
+from .config_holder import ConfigHolder, ConfigSnapshot
+
 # noinspection PyUnresolvedReferences
 from .exceptions import (
     NxConfigError,
     ValidationError,
     IncompleteSectionError,
     ParsingError,
+    AggregateError,
+    ConfigProblem,
+    UnmatchedEnvVarWarning,
 )
 
 # noinspection PyUnresolvedReferences
@@ -18,17 +30,41 @@ from .fill import fill_config, fill_config_from_path
 # noinspection PyUnresolvedReferences
 from .format import Format
 
+# noinspection PyUnresolvedReferences
+from .instrumentation import FillObserver, FillEvent, FillPhase
+
+# noinspection PyUnresolvedReferences
+from .intern_pool import InternPool
+
+# noinspection PyUnresolvedReferences
+from .numeric_array import FloatArray, IntArray
+
+# noinspection PyUnresolvedReferences
+from .parsed_file_cache import ParsedFileCache
+
 # noinspection PyUnresolvedReferences
 from .path_resolution import resolve_config_path
 
+# noinspection PyUnresolvedReferences
+from .process_heap import freeze_process_heap
+
+# noinspection PyUnresolvedReferences
+from .reloadable_config import ReloadableConfig
+
 # noinspection PyUnresolvedReferences
 from .secret_string import SecretString
 
 # noinspection PyUnresolvedReferences
 from .section import ConfigSection
 
+# noinspection PyUnresolvedReferences
+from .shared_config import SharedConfig
+
 # noinspection PyUnresolvedReferences
 from .url import URL
 
 # noinspection PyUnresolvedReferences
 from .validation import validate
+
+# noinspection PyUnresolvedReferences
+from .yaml_loader import YAMLLoader
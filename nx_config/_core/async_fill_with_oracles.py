@@ -0,0 +1,183 @@
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Mapping,
+    Optional,
+    TextIO,
+    Tuple,
+    Type,
+)
+
+from nx_config._core.file_stat import file_stat_key
+from nx_config._core.fill_plan import get_fill_plan, FillPlan
+from nx_config._core.fill_with_oracles import (
+    _snapshot_env,
+    fill_sections_stepwise,
+    parse_stream,
+    report_phase,
+)
+from nx_config._core.path_format import format_from_path
+from nx_config._core.timing import perf_counter_ns
+from nx_config.config import Config
+from nx_config.format import Format
+from nx_config.instrumentation import FillObserver, FillPhase
+from nx_config.yaml_loader import YAMLLoader
+
+
+def _parse_path(
+    path: Path, plan: FillPlan, yaml_loader: Optional[YAMLLoader]
+) -> Tuple[Format, Any]:
+    fmt = format_from_path(path)
+
+    with path.open() as fstream:
+        return fmt, parse_stream(fstream, fmt, plan, yaml_loader)
+
+
+async def _fill_parsed_async(
+    cfg: Config,
+    in_map: Any,
+    fmt: Optional[Format],
+    plan: FillPlan,
+    env_map: Mapping[str, str],
+    collect_errors: bool,
+    observer: Optional[FillObserver],
+    start_ns: int,
+):
+    # Conversion and validation happen in the event loop's thread (they're
+    # usually quick and validators may not be thread-safe), but control is
+    # handed back to the loop after each section.
+    import asyncio
+
+    env_start_ns = 0 if observer is None else perf_counter_ns()
+    env_snapshot = _snapshot_env(env_map, plan)
+
+    if observer is not None:
+        report_phase(observer, FillPhase.env, None, env_start_ns)
+
+    for _ in fill_sections_stepwise(
+        cfg, in_map, fmt, plan, env_snapshot, collect_errors, observer
+    ):
+        await asyncio.sleep(0)
+
+    if observer is not None:
+        report_phase(observer, FillPhase.total, None, start_ns)
+
+
+async def fill_config_async_w_oracles(
+    cfg: Config,
+    in_stream: Optional[TextIO],
+    fmt: Optional[Format],
+    env_prefix: Optional[str],
+    env_map: Mapping[str, str],
+    yaml_loader: Optional[YAMLLoader] = None,
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+):
+    # 'asyncio' is slow to import and only the async API needs it.
+    import asyncio
+
+    start_ns = 0 if observer is None else perf_counter_ns()
+    plan = get_fill_plan(type(cfg), env_prefix)
+
+    if in_stream is None:
+        in_map = None
+    elif fmt is None:
+        raise ValueError(
+            "When filling a config object directly from a TextIO stream you must"
+            " provide a corresponding nx_config.Format through the 'fmt' parameter."
+        )
+    else:
+        parse_start_ns = 0 if observer is None else perf_counter_ns()
+        in_map = await asyncio.get_event_loop().run_in_executor(
+            None, parse_stream, in_stream, fmt, plan, yaml_loader
+        )
+
+        if observer is not None:
+            report_phase(observer, FillPhase.parse, None, parse_start_ns)
+
+    await _fill_parsed_async(
+        cfg, in_map, fmt, plan, env_map, collect_errors, observer, start_ns
+    )
+
+
+async def fill_config_from_path_async_w_oracles(
+    cfg: Config,
+    path: Path,
+    env_prefix: Optional[str],
+    env_map: Mapping[str, str],
+    yaml_loader: Optional[YAMLLoader] = None,
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+):
+    import asyncio
+
+    start_ns = 0 if observer is None else perf_counter_ns()
+    plan = get_fill_plan(type(cfg), env_prefix)
+    fmt, in_map = await asyncio.get_event_loop().run_in_executor(
+        None, _parse_path, path, plan, yaml_loader
+    )
+
+    if observer is not None:
+        report_phase(observer, FillPhase.parse, None, start_ns)
+
+    await _fill_parsed_async(
+        cfg, in_map, fmt, plan, env_map, collect_errors, observer, start_ns
+    )
+
+
+async def watch_config_w_oracles(
+    config_t: Type[Config],
+    path: Path,
+    env_prefix: Optional[str],
+    env_map: Mapping[str, str],
+    yaml_loader: Optional[YAMLLoader],
+    poll_interval: float,
+    on_error: Optional[Callable[[Exception], None]],
+) -> AsyncIterator[Config]:
+    if poll_interval <= 0:
+        raise ValueError(
+            f"Invalid poll_interval {poll_interval} for watch_config, must be positive."
+        )
+
+    import asyncio
+
+    loop = asyncio.get_event_loop()
+    stat_key = await loop.run_in_executor(None, file_stat_key, path)
+    cfg = config_t()
+    # Errors in the initial fill are raised:
+    await fill_config_from_path_async_w_oracles(
+        cfg, path, env_prefix, env_map, yaml_loader
+    )
+    yield cfg
+
+    while True:
+        await asyncio.sleep(poll_interval)
+
+        try:
+            new_stat_key = await loop.run_in_executor(None, file_stat_key, path)
+        except OSError as xcp:
+            # E.g. the file is missing, only reported once until it's back.
+            if (stat_key is not None) and (on_error is not None):
+                on_error(xcp)
+
+            stat_key = None
+            continue
+
+        if new_stat_key == stat_key:
+            continue
+
+        # Stat-ed before reading, so a change during the fill is noticed later.
+        stat_key = new_stat_key
+        cfg = config_t()
+
+        try:
+            await fill_config_from_path_async_w_oracles(
+                cfg, path, env_prefix, env_map, yaml_loader
+            )
+        except Exception as xcp:
+            if on_error is not None:
+                on_error(xcp)
+        else:
+            yield cfg
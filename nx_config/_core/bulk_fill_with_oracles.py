@@ -0,0 +1,116 @@
+from functools import partial
+from io import StringIO
+from os import PathLike
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, Optional, TextIO, Type, Union
+
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+from nx_config._core.path_format import format_from_path
+from nx_config.config import Config
+from nx_config.format import Format
+from nx_config.yaml_loader import YAMLLoader
+
+BulkSource = Union[str, PathLike, TextIO]
+
+
+def _fill_one(
+    source: Union[Path, str],
+    config_t: Type[Config],
+    fmt: Optional[Format],
+    env_prefix: Optional[str],
+    env_map: Mapping[str, str],
+    yaml_loader: Optional[YAMLLoader],
+    collect_errors: bool,
+) -> Any:
+    # Runs in the worker processes. 'source' is either the path of a file or
+    # the contents of a stream read by the parent process. Errors are returned
+    # rather than raised, so that one bad source doesn't affect the others.
+    try:
+        cfg = config_t()
+
+        if isinstance(source, Path):
+            source_fmt = format_from_path(source)
+
+            with source.open() as fstream:
+                fill_config_w_oracles(
+                    cfg,
+                    fstream,
+                    source_fmt,
+                    env_prefix,
+                    env_map,
+                    yaml_loader,
+                    collect_errors,
+                )
+        else:
+            fill_config_w_oracles(
+                cfg,
+                StringIO(source),
+                fmt,
+                env_prefix,
+                env_map,
+                yaml_loader,
+                collect_errors,
+            )
+
+        return cfg
+    except Exception as xcp:
+        return xcp
+
+
+def _prepare_source(source: BulkSource, fmt: Optional[Format]) -> Union[Path, str]:
+    if isinstance(source, (str, PathLike)):
+        return Path(source)
+
+    # Streams can't be sent to other processes, their contents can.
+    if fmt is None:
+        raise ValueError(
+            "When filling config objects from TextIO streams you must provide a"
+            " corresponding nx_config.Format through the 'fmt' parameter."
+        )
+
+    return source.read()
+
+
+def fill_configs_w_oracles(
+    config_t: Type[Config],
+    sources: Iterable[BulkSource],
+    fmt: Optional[Format],
+    env_prefix: Optional[str],
+    env_map: Mapping[str, str],
+    yaml_loader: Optional[YAMLLoader],
+    collect_errors: bool,
+    return_exceptions: bool,
+    # noinspection PyUnresolvedReferences
+    executor: Optional["concurrent.futures.Executor"],
+    max_workers: Optional[int],
+    chunksize: int,
+) -> List[Any]:
+    if chunksize < 1:
+        raise ValueError(f"Invalid chunksize {chunksize}, must be at least 1.")
+
+    prepared = [_prepare_source(x, fmt) for x in sources]
+    fill_one = partial(
+        _fill_one,
+        config_t=config_t,
+        fmt=fmt,
+        env_prefix=env_prefix,
+        env_map=dict(env_map),
+        yaml_loader=yaml_loader,
+        collect_errors=collect_errors,
+    )
+
+    if executor is None:
+        # Pulls in 'multiprocessing', which is slow to import.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as own_executor:
+            results = list(own_executor.map(fill_one, prepared, chunksize=chunksize))
+    else:
+        results = list(executor.map(fill_one, prepared, chunksize=chunksize))
+
+    if not return_exceptions:
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+    return results
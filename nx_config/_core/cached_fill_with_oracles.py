@@ -0,0 +1,54 @@
+import os
+from pathlib import Path
+from typing import Mapping, Optional
+
+from nx_config._core.file_stat import file_stat_key
+from nx_config._core.fill_plan import get_fill_plan
+from nx_config._core.fill_with_oracles import (
+    parse_stream,
+    fill_parsed_w_oracles,
+    report_phase,
+)
+from nx_config._core.timing import perf_counter_ns
+from nx_config.config import Config
+from nx_config.format import Format
+from nx_config.instrumentation import FillObserver, FillPhase
+from nx_config.parsed_file_cache import ParsedFileCache
+from nx_config.yaml_loader import YAMLLoader
+
+
+def fill_config_from_cached_path_w_oracles(
+    cfg: Config,
+    path: Path,
+    fmt: Format,
+    env_prefix: Optional[str],
+    env_map: Mapping[str, str],
+    yaml_loader: Optional[YAMLLoader],
+    cache: ParsedFileCache,
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+    validation_workers: Optional[int] = None,
+):
+    start_ns = 0 if observer is None else perf_counter_ns()
+    plan = get_fill_plan(type(cfg), env_prefix)
+    stat_key = file_stat_key(path)
+    # Parsed INI files only contain the sections and entries declared in the
+    # target 'Config' class, so they can't be shared between classes.
+    key = (os.path.abspath(path), type(cfg) if fmt == Format.ini else None)
+
+    def load():
+        with path.open() as fstream:
+            return parse_stream(fstream, fmt, plan, yaml_loader)
+
+    # noinspection PyProtectedMember
+    in_map = cache._get(key, stat_key, load)
+
+    if observer is not None:
+        report_phase(observer, FillPhase.parse, None, start_ns)
+
+    fill_parsed_w_oracles(
+        cfg, in_map, fmt, plan, env_map, collect_errors, observer, validation_workers
+    )
+
+    if observer is not None:
+        report_phase(observer, FillPhase.total, None, start_ns)
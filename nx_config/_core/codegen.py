@@ -0,0 +1,28 @@
+from typing import Callable, Mapping, Any, Sequence
+
+from nx_config._core.naming_utils import indentation_spaces
+
+
+def create_function(
+    name: str,
+    args: Sequence[str],
+    body: Sequence[str],
+    *,
+    qualname: str,
+    closure: Mapping[str, Any],
+) -> Callable:
+    # Same approach as 'dataclasses': The generated function is nested inside
+    # a factory taking the values in 'closure' as arguments, so that they end
+    # up as fast closure variables instead of globals of the generated code.
+    inner_body = "\n".join(f"{indentation_spaces * 2}{x}" for x in body or ("pass",))
+    src = (
+        f"def __nx_config_create_fn__({', '.join(closure)}):\n"
+        f"{indentation_spaces}def {name}({', '.join(args)}):\n"
+        f"{inner_body}\n"
+        f"{indentation_spaces}return {name}\n"
+    )
+    ns = {}
+    exec(compile(src, f"<nx_config generated {qualname}>", "exec"), {}, ns)
+    fn = ns["__nx_config_create_fn__"](**closure)
+    fn.__qualname__ = qualname
+    return fn
@@ -0,0 +1,14 @@
+from nx_config._core.iteration_utils import get_annotations
+from nx_config._core.naming_utils import section_compact_attr
+
+# Compact sections (see 'SectionMeta') store their values in a single tuple.
+# With an 'InternPool', sections with equal values share that tuple, so that
+# each section only costs the object holding a reference to it.
+
+
+def is_compact(section_t: type) -> bool:
+    # Subclasses of compact sections without entries of their own are filled
+    # (with nothing) like any other section.
+    return (
+        getattr(section_t, section_compact_attr) and len(get_annotations(section_t)) > 0
+    )
@@ -1,6 +1,9 @@
 from inspect import isroutine, isclass
+from operator import attrgetter
+from typing import Callable, Mapping
 
-from nx_config._core.naming_utils import root_attr, internal_name
+from nx_config._core.codegen import create_function
+from nx_config._core.naming_utils import root_attr, internal_name, fill_plans_attr
 from nx_config.section import ConfigSection
 
 _special_config_keys = (
@@ -13,10 +16,9 @@ _special_config_keys = (
 _forbidden_default_section = "default"
 
 
-def _internal_property(name: str) -> property:
-    def getter(self):
-        return getattr(self, name)
-
+def _section_property(section_name: str) -> property:
+    # The getter is an 'attrgetter' (rather than a Python function), so that
+    # reading a section doesn't run any Python code.
     # noinspection PyUnusedLocal
     def setter(self, value):
         raise AttributeError(
@@ -24,7 +26,25 @@ def _internal_property(name: str) -> property:
             " loaded at startup from defaults, configuration files and environment variables."
         )
 
-    return property(fget=getter, fset=setter)
+    return property(
+        fget=attrgetter(internal_name(section_name)),
+        fset=setter,
+        doc=f"Config section '{section_name}'.",
+    )
+
+
+def _generate_init(qualname: str, sections: Mapping[str, type]) -> Callable:
+    closure = {}
+    body = []
+
+    for section_name, section_type in sections.items():
+        type_var = f"_type_{section_name}"
+        closure[type_var] = section_type
+        body.append(f"self.{internal_name(section_name)} = {type_var}()")
+
+    return create_function(
+        "__init__", ("self",), body, qualname=f"{qualname}.__init__", closure=closure
+    )
 
 
 class ConfigMeta(type):
@@ -76,7 +96,7 @@ class ConfigMeta(type):
                     f" subclasses of 'ConfigSection'. Non-conforming attribute: '{section_name}'"
                 )
 
-            ns[section_name] = _internal_property(internal_name(section_name))
+            ns[section_name] = _section_property(section_name)
 
         special_keys = frozenset(sections).union(_special_config_keys)
 
@@ -89,5 +109,12 @@ class ConfigMeta(type):
                     f" Non-conforming member: '{k}'"
                 )
 
-        ns["__slots__"] = (internal_name(section) for section in sections)
+        ns["__slots__"] = tuple(internal_name(section) for section in sections)
+        ns[fill_plans_attr] = {}
+
+        # Subclasses without annotations of their own keep the inherited
+        # (generic) '__init__'.
+        if sections and not is_root:
+            ns["__init__"] = _generate_init(ns.get("__qualname__", typename), sections)
+
         return super().__new__(mcs, typename, bases, ns)
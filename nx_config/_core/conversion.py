@@ -0,0 +1,240 @@
+import re
+from array import array
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Any, Iterable, Callable, Optional, Type
+from uuid import UUID
+
+from nx_config._core.type_checks import ConfigTypeInfo
+from nx_config.numeric_array import NumericArray
+
+_truey_strings = frozenset(
+    ("True", "true", "TRUE", "Yes", "yes", "YES", "On", "on", "ON", "1")
+)
+_falsey_strings = frozenset(
+    ("False", "false", "FALSE", "No", "no", "NO", "Off", "off", "OFF", "0")
+)
+# YYYY-MM-DD, optionally followed by [T or space]HH:MM[:SS[.ffffff]] and then
+# optionally by a UTC offset (Z, +HH:MM or +HHMM).
+_iso_datetime_regex = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?"
+    r"(?:(Z)|([+-])(\d{2}):?(\d{2}))?)?"
+)
+
+
+def _parse_iso_datetime(value_str: str) -> Optional[datetime]:
+    match = _iso_datetime_regex.fullmatch(value_str)
+
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second, fraction, utc, sign, tz_h, tz_m = (
+        match.groups()
+    )
+
+    try:
+        if utc is not None:
+            tzinfo = timezone.utc
+        elif sign is not None:
+            offset = timedelta(hours=int(tz_h), minutes=int(tz_m))
+            tzinfo = timezone(-offset if sign == "-" else offset)
+        else:
+            tzinfo = None
+
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            0 if hour is None else int(hour),
+            0 if minute is None else int(minute),
+            0 if second is None else int(second),
+            0 if fraction is None else int(fraction.ljust(6, "0")),
+            tzinfo=tzinfo,
+        )
+    except ValueError:
+        # E.g. day 31 in a month with 30 days, an hour 24 or a UTC offset of
+        # 24 hours or more. We let 'dateutil' handle (or reject) such values so
+        # behaviour stays exactly as before.
+        return None
+
+
+def _dateutil_parse(value_str: str) -> datetime:
+    # 'dateutil' is slow to import and most apps never parse non-ISO
+    # datetimes.
+    # noinspection PyPackageRequirements
+    from dateutil.parser import parse
+
+    return parse(value_str)
+
+
+def _convert_string_to_datetime(value_str: str) -> datetime:
+    # Strict ISO-8601 strings (by far the most common case) are parsed directly,
+    # anything else goes through the much slower but more lenient 'dateutil'.
+    value = _parse_iso_datetime(value_str)
+    return _dateutil_parse(value_str) if value is None else value
+
+
+def _numeric_array_from_elements(
+    array_t: Type[NumericArray], elements: Iterable[Any]
+) -> NumericArray:
+    try:
+        # noinspection PyProtectedMember
+        return array_t._from_array(array(array_t.typecode, elements))
+    except (TypeError, OverflowError) as xcp:
+        raise ValueError(str(xcp)) from xcp
+
+
+def _numeric_array_string_converter(
+    array_t: Type[NumericArray],
+) -> Callable[[str], NumericArray]:
+    convert_element = float if array_t.typecode == "d" else int
+
+    def convert(value_str: str) -> NumericArray:
+        if value_str == "":
+            return array_t()
+
+        # Converted in one go, without a python loop ('int' and 'float' ignore
+        # surrounding whitespace), because arrays can be very long.
+        return _numeric_array_from_elements(
+            array_t, map(convert_element, value_str.split(","))
+        )
+
+    return convert
+
+
+# Base types for which YAML strings must be converted (all other base types
+# are either native YAML types or plain strings):
+_yaml_str_converters = {
+    Path: Path,
+    UUID: UUID,
+    datetime: _convert_string_to_datetime,
+}
+
+
+def _convert_yaml_str_to_element(
+    yaml_str: str, base: type, convert_str: Callable[[str], Any]
+) -> Any:
+    try:
+        return convert_str(yaml_str)
+    except ValueError as xcp:
+        raise ValueError(
+            f"Cannot convert string '{yaml_str}' into {base.__name__}: {xcp}"
+        ) from xcp
+
+
+def _yaml_str_converter(base: type) -> Optional[Callable[[str], Any]]:
+    if issubclass(base, NumericArray):
+        return _numeric_array_string_converter(base)
+    else:
+        return _yaml_str_converters.get(base)
+
+
+def _convert_yaml(
+    yaml_value: Any,
+    type_info: ConfigTypeInfo,
+    convert_str: Optional[Callable[[str], Any]],
+) -> Any:
+    base = type_info.base
+    coll = type_info.collection
+
+    if isinstance(yaml_value, str) and (convert_str is not None):
+        try:
+            return convert_str(yaml_value)
+        except ValueError as xcp:
+            raise ValueError(
+                f"Cannot convert string '{yaml_value}' into {type_info}: {xcp}"
+            ) from xcp
+    elif isinstance(yaml_value, list) and issubclass(base, NumericArray):
+        try:
+            return _numeric_array_from_elements(base, yaml_value)
+        except ValueError as xcp:
+            raise ValueError(f"Failed to convert list into {type_info}: {xcp}") from xcp
+    elif isinstance(yaml_value, list) and (coll is not None):
+        if convert_str is not None:
+            try:
+                # noinspection PyArgumentList
+                return coll(
+                    (
+                        _convert_yaml_str_to_element(x, base, convert_str)
+                        if isinstance(x, str)
+                        else x
+                    )
+                    for x in yaml_value
+                )
+            except ValueError as xcp:
+                raise ValueError(
+                    f"Failed to convert list into {type_info}: {xcp}"
+                ) from xcp
+        # noinspection PyArgumentList
+        return coll(yaml_value)
+    else:
+        return yaml_value
+
+
+def _convert_string_to_bool(value_str: str) -> bool:
+    if value_str in _truey_strings:
+        return True
+    elif value_str in _falsey_strings:
+        return False
+    else:
+        raise ValueError()
+
+
+def _base_string_converter(base: type) -> Callable[[str], Any]:
+    if base in (int, float, Path, UUID):
+        return base
+    elif base is bool:
+        return _convert_string_to_bool
+    elif base is datetime:
+        return _convert_string_to_datetime
+    elif issubclass(base, NumericArray):
+        return _numeric_array_string_converter(base)
+    else:
+        return str
+
+
+def _convert_each_string(
+    parts: Iterable[str], convert_base: Callable[[str], Any]
+) -> Iterable[Any]:
+    for value_str in parts:
+        try:
+            yield convert_base(value_str)
+        except ValueError as xcp:
+            raise ValueError(f"Invalid part: '{value_str}'; {xcp}") from xcp
+
+
+def string_converter(type_info: ConfigTypeInfo) -> Callable[[str], Any]:
+    coll = type_info.collection
+    optional = type_info.optional
+    convert_base = _base_string_converter(type_info.base)
+
+    def convert(value_str: str) -> Any:
+        if value_str == "":
+            if optional:
+                return None
+            elif coll is not None:
+                return coll()
+
+        try:
+            if coll is None:
+                return convert_base(value_str)
+            else:
+                parts = (x.strip() for x in value_str.split(","))
+                # noinspection PyArgumentList
+                return coll(_convert_each_string(parts, convert_base))
+        except ValueError as xcp:
+            raise ValueError(
+                f"Cannot convert string '{value_str}' into {type_info}: {xcp}"
+            ) from xcp
+
+    return convert
+
+
+def yaml_converter(type_info: ConfigTypeInfo) -> Callable[[Any], Any]:
+    convert_str = _yaml_str_converter(type_info.base)
+
+    def convert(yaml_value: Any) -> Any:
+        return _convert_yaml(yaml_value, type_info, convert_str)
+
+    return convert
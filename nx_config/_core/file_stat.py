@@ -0,0 +1,12 @@
+import os
+from pathlib import Path
+from typing import Tuple
+
+FileStatKey = Tuple[int, int, int, int]
+
+
+def file_stat_key(path: Path) -> FileStatKey:
+    # Changes whenever the file is modified or replaced (e.g. through an
+    # atomic rename), at least on file systems with sub-second timestamps.
+    st = os.stat(path)
+    return st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size
@@ -0,0 +1,330 @@
+from typing import (
+    NamedTuple,
+    Tuple,
+    Callable,
+    Any,
+    Optional,
+    Type,
+    Mapping,
+    List,
+    Dict,
+    FrozenSet,
+)
+
+from nx_config._core.codegen import create_function
+from nx_config._core.compact_values import is_compact
+from nx_config._core.conversion import string_converter, yaml_converter
+from nx_config._core.iteration_utils import get_annotations
+from nx_config._core.naming_utils import (
+    fill_plans_attr,
+    internal_name,
+    section_fill_attr,
+    section_intern_pool_attr,
+    section_overrides_attr,
+    section_timed_fill_attr,
+    section_values_attr,
+)
+from nx_config._core.section_entry import SectionEntry
+from nx_config._core.sparse_values import is_sparse
+from nx_config._core.timing import perf_counter_ns
+from nx_config.exceptions import ParsingError
+from nx_config.intern_pool import InternPool
+
+_upper_ascii_letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_digits = "0123456789"
+_env_prefix_first_char = _upper_ascii_letters + "_"
+_env_prefix_chars = _env_prefix_first_char + _digits
+
+
+class EntryPlan(NamedTuple):
+    entry_name: str
+    env_key: str
+    entry: SectionEntry
+
+
+# noinspection PyUnresolvedReferences
+SectionFillFunction = Callable[
+    [
+        "ConfigSection",
+        Mapping[str, str],
+        Tuple[str, ...],
+        Optional[Mapping[str, Any]],
+        bool,
+        Optional[List[Tuple[str, Optional[str], Exception]]],
+    ],
+    None,
+]
+
+
+class SectionPlan(NamedTuple):
+    section_name: str
+    entries: Tuple[EntryPlan, ...]
+    env_keys: Tuple[str, ...]
+    # Generated function taking (section, env_map, env_keys, section_in_map, yaml_input,
+    # errors). With 'errors=None' the first error is raised, otherwise a tuple
+    # (entry name, env key if the value came from 'env_map' or None, exception) is appended
+    # to 'errors' for each entry that fails and filling continues. See also
+    # 'get_timed_section_fill'.
+    fill: SectionFillFunction
+
+
+class FillPlan(NamedTuple):
+    sections: Tuple[SectionPlan, ...]
+    # Every environment variable relevant for this plan starts with one of these:
+    env_key_prefixes: Tuple[str, ...]
+    env_keys: FrozenSet[str]
+    # Section name -> lower case entry name -> entry name:
+    ini_options: Mapping[str, Mapping[str, str]]
+
+
+def _check_env_prefix(prefix: str):
+    if prefix == "":
+        raise ValueError(
+            f"Invalid empty prefix for configuration environment variables. If you don't want to use a custom"
+            f" prefix, use None instead (default)."
+        )
+
+    if (prefix[0] not in _env_prefix_first_char) or any(
+        x not in _env_prefix_chars for x in prefix[1:]
+    ):
+        raise ValueError(
+            f"Invalid prefix {repr(prefix)} for configuration environment variables. The only characters"
+            f" allowed in the prefix are upper case ASCII letters '{_upper_ascii_letters}', numerical digits"
+            f" '{_digits}' and underscores '_', with the additional restriction that the first character cannot"
+            f" be a numerical digit."
+        )
+
+
+def _generate_entry_fill_lines(
+    idx: int,
+    entry: SectionEntry,
+    closure: Dict[str, Any],
+    timed: bool,
+    compact: bool,
+    sparse: bool,
+    intern_pool: Optional[InternPool],
+) -> List[str]:
+    name = entry.entry_name
+    entry_var = f"_entry_{name}"
+    string_var = f"_convert_string_{name}"
+    yaml_var = f"_convert_yaml_{name}"
+    closure[entry_var] = entry
+    closure[string_var] = string_converter(entry.type_info)
+    closure[yaml_var] = yaml_converter(entry.type_info)
+
+    if intern_pool is not None:
+        # noinspection PyProtectedMember
+        closure[string_var] = intern_pool._interning(closure[string_var])
+        # noinspection PyProtectedMember
+        closure[yaml_var] = intern_pool._interning(closure[yaml_var])
+    file_error_prefix = f"Error converting value for attribute '{name}': "
+    env_error_prefix = f"Error parsing the value for attribute '{name}'"
+
+    if compact:
+        # Values of compact sections are collected in the list 'values', see
+        # '_generate_section_fill'.
+        set_line = f"values[{idx}] = {entry_var}._checked(value)"
+        store_line = f"values[{idx}] = value"
+    elif sparse:
+        # Same for the 'dict' 'overrides' of sparse sections.
+        set_line = f"overrides[{name!r}] = {entry_var}._checked(value)"
+        store_line = f"overrides[{name!r}] = value"
+    else:
+        set_line = f"{entry_var}._set(section, value)"
+        store_line = f"section.{internal_name(name)} = value"
+
+    lines = [
+        f"value = env_map.get(env_keys[{idx}])",
+        "if value is None:",
+        "    if section_in_map is not None:",
+        "        try:",
+        f"            value = section_in_map[{name!r}]",
+        "        except KeyError:",
+        "            pass",
+        "        else:",
+        "            try:",
+        "                if yaml_input:",
+        f"                    value = {yaml_var}(value)",
+        "                else:",
+        f"                    value = {string_var}(value)",
+        "            except ValueError as xcp:",
+        f"                raise ValueError({file_error_prefix!r} + str(xcp)) from xcp",
+        f"            {set_line}",
+        "else:",
+        "    try:",
+        f"        value = {string_var}(value)",
+        "    except ValueError as xcp:",
+        "        raise _ParsingError(",
+        f"            f{env_error_prefix!r}",
+        f"            f\" from environment variable '{{env_keys[{idx}]}}': {{xcp}}\"",
+        "        ) from xcp",
+        f"    {store_line}",
+    ]
+    lines = [
+        "try:",
+        *(f"    {x}" for x in lines),
+        "except Exception as xcp:",
+        "    if errors is None:",
+        "        raise",
+        f"    env_key = env_keys[{idx}]",
+        "    errors.append((",
+        f"        {name!r}, env_key if env_key in env_map else None, xcp",
+        "    ))",
+    ]
+
+    if not timed:
+        return lines
+
+    return [
+        "start_ns = _perf_counter_ns()",
+        *lines,
+        "duration_ns = _perf_counter_ns() - start_ns",
+        "if duration_ns >= threshold_ns:",
+        f"    timings.append(({name!r}, duration_ns))",
+    ]
+
+
+def _generate_section_fill(section_t: type, timed: bool) -> SectionFillFunction:
+    closure = {"_ParsingError": ParsingError}
+    args = ("section", "env_map", "env_keys", "section_in_map", "yaml_input", "errors")
+    body = []
+
+    if timed:
+        closure["_perf_counter_ns"] = perf_counter_ns
+        args += ("timings", "threshold_ns")
+
+    compact = is_compact(section_t)
+    sparse = is_sparse(section_t)
+    intern_pool = getattr(section_t, section_intern_pool_attr)
+
+    for idx, entry_name in enumerate(get_annotations(section_t)):
+        entry = getattr(section_t, entry_name)
+        body.extend(
+            _generate_entry_fill_lines(
+                idx, entry, closure, timed, compact, sparse, intern_pool
+            )
+        )
+
+    if compact:
+        # The tuple of values is replaced once at the end (also when filling
+        # fails, so that the entries filled until then are kept, as with other
+        # sections). With an intern pool, equal tuples are shared as a whole.
+        if intern_pool is None:
+            store_values = "tuple(values)"
+        else:
+            # noinspection PyProtectedMember
+            closure["_intern"] = intern_pool._intern
+            store_values = "_intern(tuple(values))"
+
+        body = [
+            f"values = list(section.{section_values_attr})",
+            "try:",
+            *(f"    {x}" for x in body),
+            "finally:",
+            f"    section.{section_values_attr} = {store_values}",
+        ]
+    elif sparse:
+        body = [
+            f"overrides = dict(section.{section_overrides_attr} or ())",
+            "try:",
+            *(f"    {x}" for x in body),
+            "finally:",
+            f"    section.{section_overrides_attr} = overrides or None",
+        ]
+
+    return create_function(
+        "fill",
+        args,
+        body,
+        qualname=f"{section_t.__qualname__}.<{'timed_' if timed else ''}fill>",
+        closure=closure,
+    )
+
+
+def _get_section_fill(section_t: type, timed: bool = False) -> SectionFillFunction:
+    # Generated lazily (only for sections that are actually filled) and once
+    # per section class, no matter how many configs and env prefixes use it.
+    attr = section_timed_fill_attr if timed else section_fill_attr
+
+    try:
+        return section_t.__dict__[attr]
+    except KeyError:
+        fill = _generate_section_fill(section_t, timed)
+        setattr(section_t, attr, fill)
+        return fill
+
+
+def get_timed_section_fill(section_t: type) -> Callable:
+    # Same as 'SectionPlan.fill', but taking two additional arguments 'timings'
+    # and 'threshold_ns': A tuple (entry name, duration in nanoseconds) is
+    # appended to the list 'timings' for each entry that takes at least
+    # 'threshold_ns' to fill. Only used with a 'FillObserver', so that normal
+    # fills don't pay for the timing.
+    return _get_section_fill(section_t, timed=True)
+
+
+def _build_section_plan(
+    section_name: str, section_t: type, env_key_prefix: str
+) -> SectionPlan:
+    entries = []
+
+    for entry_name in get_annotations(section_t):
+        entry = getattr(section_t, entry_name)
+        entries.append(
+            EntryPlan(
+                entry_name=entry_name,
+                env_key=f"{env_key_prefix}{section_name.upper()}__{entry_name.upper()}",
+                entry=entry,
+            )
+        )
+
+    entries = tuple(entries)
+    return SectionPlan(
+        section_name=section_name,
+        entries=entries,
+        env_keys=tuple(x.env_key for x in entries),
+        fill=_get_section_fill(section_t),
+    )
+
+
+def build_fill_plan(config_t: type, env_prefix: Optional[str]) -> FillPlan:
+    if env_prefix is None:
+        env_key_prefix = ""
+    else:
+        _check_env_prefix(env_prefix)
+        env_key_prefix = f"{env_prefix}__"
+
+    sections = tuple(
+        _build_section_plan(section_name, section_t, env_key_prefix)
+        for section_name, section_t in get_annotations(config_t).items()
+    )
+
+    if env_prefix is None:
+        env_key_prefixes = tuple(f"{x.section_name.upper()}__" for x in sections)
+    else:
+        env_key_prefixes = (env_key_prefix,)
+
+    return FillPlan(
+        sections=sections,
+        env_key_prefixes=env_key_prefixes,
+        env_keys=frozenset(k for x in sections for k in x.env_keys),
+        ini_options={
+            x.section_name: {e.entry_name.lower(): e.entry_name for e in x.entries}
+            for x in sections
+        },
+    )
+
+
+# noinspection PyUnresolvedReferences
+def get_fill_plan(config_t: Type["Config"], env_prefix: Optional[str]) -> FillPlan:
+    # Each subclass of 'Config' gets its own (initially empty) cache of plans
+    # from the metaclass, so looking it up in the class's own '__dict__' is
+    # enough. Races between threads can at worst build the same plan twice.
+    plans = config_t.__dict__[fill_plans_attr]
+
+    try:
+        return plans[env_prefix]
+    except KeyError:
+        plan = build_fill_plan(config_t, env_prefix)
+        plans[env_prefix] = plan
+        return plan
@@ -1,151 +1,544 @@
-from configparser import ConfigParser
-from datetime import datetime
-from pathlib import Path
-from typing import Mapping, Any, Iterable, Optional, TextIO
-from uuid import UUID
-
-# noinspection PyPackageRequirements
-from dateutil.parser import parse as dateutil_parse
-
-# noinspection PyPackageRequirements
-from yaml import safe_load
-
-from nx_config._core.iteration_utils import get_annotations
-from nx_config._core.naming_utils import internal_name
+from typing import (
+    Mapping,
+    Optional,
+    TextIO,
+    Dict,
+    Any,
+    List,
+    Tuple,
+    Iterator,
+    Callable,
+)
+from os.path import dirname, join
+from sys import _getframe
+from warnings import warn
+
+from nx_config._core.fill_plan import (
+    get_fill_plan,
+    get_timed_section_fill,
+    SectionPlan,
+    FillPlan,
+)
+from nx_config._core.ini_reader import read_ini
+from nx_config._core.naming_utils import section_validators_attr, internal_name
 from nx_config._core.section_meta import run_validators
-from nx_config._core.type_checks import ConfigTypeInfo
+from nx_config._core.timing import perf_counter_ns
 from nx_config._core.unset import Unset
 from nx_config.config import Config
-from nx_config.exceptions import ValidationError, IncompleteSectionError, ParsingError
+from nx_config.exceptions import (
+    AggregateError,
+    ConfigProblem,
+    ValidationError,
+    IncompleteSectionError,
+    UnmatchedEnvVarWarning,
+)
 from nx_config.format import Format
+from nx_config.instrumentation import FillObserver, FillEvent, FillPhase
+from nx_config.yaml_loader import YAMLLoader
 from nx_config.section import ConfigSection
 
-_truey_strings = frozenset(
-    ("True", "true", "TRUE", "Yes", "yes", "YES", "On", "on", "ON", "1")
-)
-_falsey_strings = frozenset(
-    ("False", "false", "FALSE", "No", "no", "NO", "Off", "off", "OFF", "0")
-)
-_upper_ascii_letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-_digits = "0123456789"
-_env_prefix_first_char = _upper_ascii_letters + "_"
-_env_prefix_chars = _env_prefix_first_char + _digits
 
+def _check_all_entries_were_set(section: ConfigSection, section_plan: SectionPlan):
+    for entry_plan in section_plan.entries:
+        if getattr(section, entry_plan.entry_name) is Unset:
+            raise ValueError(
+                f"Attribute '{entry_plan.entry_name}' has not been set and has no default value."
+            )
+
+
+def _load_yaml(in_stream: TextIO, loader: Optional[YAMLLoader]) -> Any:
+    # 'yaml' is slow to import, and apps that only use environment variables
+    # (or INI files) never need it.
+    # noinspection PyPackageRequirements
+    import yaml
+
+    if loader is None:
+        loader_t = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    elif loader == YAMLLoader.libyaml:
+        try:
+            loader_t = yaml.CSafeLoader
+        except AttributeError as xcp:
+            raise ImportError(
+                "Cannot use YAMLLoader.libyaml because the installed PyYAML was built"
+                " without libyaml. Reinstall PyYAML with libyaml available or use"
+                " YAMLLoader.pure_python (or the default) instead."
+            ) from xcp
+    else:  # loader == YAMLLoader.pure_python
+        loader_t = yaml.SafeLoader
+
+    return yaml.load(in_stream, Loader=loader_t)
+
+
+# Directory of the 'nx_config' package (with a trailing separator).
+_package_dir = join(dirname(dirname(__file__)), "")
+
+
+def _outside_caller_stacklevel() -> int:
+    # The 'stacklevel' (for 'warn', called right in the caller of this
+    # function) pointing to the innermost frame outside 'nx_config', i.e. the
+    # user code calling any of the (sync or async) public functions.
+    frame = _getframe(2)
+    stacklevel = 2
+
+    while (frame is not None) and frame.f_code.co_filename.startswith(_package_dir):
+        frame = frame.f_back
+        stacklevel += 1
+
+    return stacklevel
+
+
+def _snapshot_env(env_map: Mapping[str, str], plan: FillPlan) -> Dict[str, str]:
+    # A single pass over the environment, keeping only the few variables that
+    # could be relevant. Lookups in 'os.environ' are comparatively expensive
+    # (encoding, decoding and a 'KeyError' for each miss), lookups in the
+    # resulting small 'dict' are not.
+    prefixes = plan.env_key_prefixes
+    snapshot = {k: v for k, v in env_map.items() if k.startswith(prefixes)}
+    unmatched = sorted(k for k in snapshot if k not in plan.env_keys)
+
+    if unmatched:
+        warn(
+            f"The following environment variables look like configuration variables"
+            f" (because of their prefixes) but don't match any entry: {', '.join(unmatched)}",
+            UnmatchedEnvVarWarning,
+            stacklevel=_outside_caller_stacklevel(),
+        )
+
+    return snapshot
+
+
+def parse_stream(
+    in_stream: TextIO, fmt: Format, plan: FillPlan, yaml_loader: Optional[YAMLLoader]
+) -> Any:
+    if fmt == Format.yaml:
+        return _load_yaml(in_stream, yaml_loader)
+    else:  # fmt == Format.ini
+        return read_ini(in_stream, plan.ini_options)
+
+
+def report_phase(
+    observer: FillObserver,
+    phase: FillPhase,
+    section_name: Optional[str],
+    start_ns: int,
+) -> int:
+    end_ns = perf_counter_ns()
+    observer.on_event(FillEvent(phase, section_name, None, end_ns - start_ns))
+    return end_ns
+
+
+def _run_section_fill(
+    section: ConfigSection,
+    section_plan: SectionPlan,
+    env_map: Mapping[str, str],
+    section_in_map: Any,
+    yaml_input: bool,
+    errors: Optional[list],
+    observer: Optional[FillObserver],
+):
+    if observer is None:
+        section_plan.fill(
+            section, env_map, section_plan.env_keys, section_in_map, yaml_input, errors
+        )
+        return
+
+    section_name = section_plan.section_name
+    fill = get_timed_section_fill(type(section))
+    timings = []
+    start_ns = perf_counter_ns()
+    fill(
+        section,
+        env_map,
+        section_plan.env_keys,
+        section_in_map,
+        yaml_input,
+        errors,
+        timings,
+        observer.entry_threshold_ns,
+    )
+    duration_ns = perf_counter_ns() - start_ns
+
+    for entry_name, entry_duration_ns in timings:
+        observer.on_event(
+            FillEvent(FillPhase.fill_entry, section_name, entry_name, entry_duration_ns)
+        )
+
+    observer.on_event(
+        FillEvent(FillPhase.fill_section, section_name, None, duration_ns)
+    )
+
+
+def _get_section_in_map(in_map: Any, section_name: str) -> Any:
+    if in_map is None:
+        return None
 
-def _convert_yaml_str_to_element(yaml_str: str, base: type) -> Any:
+    # Not using 'dict.get' because the top-level value of a YAML document isn't
+    # necessarily a 'dict'.
     try:
-        return base(yaml_str)
+        return in_map[section_name]
+    except KeyError:
+        return None
+
+
+def _fill_and_check_section(
+    section: ConfigSection,
+    section_plan: SectionPlan,
+    env_map: Mapping[str, str],
+    section_in_map: Any,
+    yaml_input: bool,
+    observer: Optional[FillObserver],
+):
+    section_name = section_plan.section_name
+
+    try:
+        _run_section_fill(
+            section, section_plan, env_map, section_in_map, yaml_input, None, observer
+        )
+    except Exception as xcp:
+        raise type(xcp)(f"Error filling section '{section_name}': {xcp}") from xcp
+
+    start_ns = 0 if observer is None else perf_counter_ns()
+
+    try:
+        _check_all_entries_were_set(section, section_plan)
     except ValueError as xcp:
-        raise ValueError(
-            f"Cannot convert string '{yaml_str}' into {base.__name__}: {xcp}"
+        raise IncompleteSectionError(
+            f"Incomplete section '{section_name}': {xcp}"
         ) from xcp
 
+    if observer is not None:
+        report_phase(observer, FillPhase.check_section, section_name, start_ns)
 
-def _convert_yaml(yaml_value: Any, type_info: ConfigTypeInfo) -> Any:
-    base = type_info.base
-    coll = type_info.collection
 
-    if isinstance(yaml_value, str) and (base in (Path, UUID)):
-        try:
-            return base(yaml_value)
-        except ValueError as xcp:
-            raise ValueError(
-                f"Cannot convert string '{yaml_value}' into {type_info}: {xcp}"
-            ) from xcp
-    elif isinstance(yaml_value, list) and (coll is not None):
-        if base in (Path, UUID):
-            try:
-                # noinspection PyArgumentList
-                return coll(
-                    _convert_yaml_str_to_element(x, base) if isinstance(x, str) else x
-                    for x in yaml_value
-                )
-            except ValueError as xcp:
-                raise ValueError(
-                    f"Failed to convert list into {type_info}: {xcp}"
-                ) from xcp
-        # noinspection PyArgumentList
-        return coll(yaml_value)
-    else:
-        return yaml_value
+def _validate_section(section: ConfigSection, section_name: str):
+    try:
+        run_validators(section)
+    except Exception as xcp:
+        raise ValidationError(
+            f"Error validating section '{section_name}' at the end of 'fill_config' call: {xcp}"
+        ) from xcp
+
 
+def _fill_section(
+    section: ConfigSection,
+    section_plan: SectionPlan,
+    env_map: Mapping[str, str],
+    section_in_map: Any,
+    yaml_input: bool,
+    observer: Optional[FillObserver],
+):
+    _fill_and_check_section(
+        section, section_plan, env_map, section_in_map, yaml_input, observer
+    )
+    section_name = section_plan.section_name
+    start_ns = 0 if observer is None else perf_counter_ns()
+    _validate_section(section, section_name)
 
-def _convert_string_to_base(value_str: str, base: type) -> Any:
-    if base in (int, float, Path, UUID):
-        return base(value_str)
-    elif base is bool:
-        if value_str in _truey_strings:
-            return True
-        elif value_str in _falsey_strings:
-            return False
+    if observer is not None:
+        report_phase(observer, FillPhase.validate_section, section_name, start_ns)
+
+
+def _fill_and_check_section_collecting_problems(
+    section: ConfigSection,
+    section_plan: SectionPlan,
+    env_map: Mapping[str, str],
+    section_in_map: Any,
+    fmt: Optional[Format],
+    observer: Optional[FillObserver],
+) -> List[ConfigProblem]:
+    # Same checks as '_fill_and_check_section', but every problem is recorded
+    # (with the same exception '_fill_and_check_section' would raise for it)
+    # instead of raised.
+    section_name = section_plan.section_name
+    errors = []
+    _run_section_fill(
+        section,
+        section_plan,
+        env_map,
+        section_in_map,
+        fmt == Format.yaml,
+        errors,
+        observer,
+    )
+    problems = []
+
+    for entry_name, env_key, xcp in errors:
+        error = type(xcp)(f"Error filling section '{section_name}': {xcp}")
+        error.__cause__ = xcp
+
+        if env_key is None:
+            source = f"{fmt.name.upper()} input"
         else:
-            raise ValueError()
-    elif base is datetime:
-        return dateutil_parse(value_str)
-    else:
-        return value_str
+            source = f"environment variable '{env_key}'"
 
+        problems.append(ConfigProblem(section_name, entry_name, source, error))
 
-def _convert_each_string_to_base(parts: Iterable[str], base: type) -> Iterable[Any]:
-    for value_str in parts:
-        try:
-            yield _convert_string_to_base(value_str, base)
-        except ValueError as xcp:
-            raise ValueError(f"Invalid part: '{value_str}'; {xcp}") from xcp
+    failed_entries = {x[0] for x in errors}
+    start_ns = 0 if observer is None else perf_counter_ns()
 
+    for entry_plan in section_plan.entries:
+        entry_name = entry_plan.entry_name
 
-def _convert_string(value_str: str, type_info: ConfigTypeInfo) -> Any:
-    coll = type_info.collection
-    base = type_info.base
+        if (entry_name not in failed_entries) and (
+            getattr(section, entry_name) is Unset
+        ):
+            error = IncompleteSectionError(
+                f"Incomplete section '{section_name}': Attribute '{entry_name}' has"
+                f" not been set and has no default value."
+            )
+            problems.append(ConfigProblem(section_name, entry_name, None, error))
 
-    if value_str == "":
-        if type_info.optional:
-            return None
-        elif coll is not None:
-            return coll()
+    if observer is not None:
+        report_phase(observer, FillPhase.check_section, section_name, start_ns)
 
-    if coll is None:
-        try:
-            return _convert_string_to_base(value_str, base)
-        except ValueError as xcp:
-            raise ValueError(
-                f"Cannot convert string '{value_str}' into {type_info}: {xcp}"
-            ) from xcp
-    else:
-        parts = (x.strip() for x in value_str.split(","))
+    return problems
+
+
+def _validate_section_collecting_problems(
+    section: ConfigSection, section_name: str
+) -> List[ConfigProblem]:
+    problems = []
+
+    for validator in getattr(type(section), section_validators_attr):
         try:
-            # noinspection PyArgumentList
-            return coll(_convert_each_string_to_base(parts, base))
-        except ValueError as xcp:
-            raise ValueError(
-                f"Cannot convert string '{value_str}' into {type_info}: {xcp}"
-            ) from xcp
+            validator(section)
+        except Exception as xcp:
+            error = ValidationError(
+                f"Error validating section '{section_name}' at the end of 'fill_config' call: {xcp}"
+            )
+            error.__cause__ = xcp
+            source = f"validator '{getattr(validator, '__name__', validator)}'"
+            problems.append(ConfigProblem(section_name, None, source, error))
 
+    return problems
 
-def _check_all_entries_were_set(section: ConfigSection):
-    for entry_name in get_annotations(section):
-        if getattr(section, entry_name) is Unset:
-            raise ValueError(
-                f"Attribute '{entry_name}' has not been set and has no default value."
+
+def _fill_section_collecting_problems(
+    section: ConfigSection,
+    section_plan: SectionPlan,
+    env_map: Mapping[str, str],
+    section_in_map: Any,
+    fmt: Optional[Format],
+    observer: Optional[FillObserver],
+) -> List[ConfigProblem]:
+    problems = _fill_and_check_section_collecting_problems(
+        section, section_plan, env_map, section_in_map, fmt, observer
+    )
+
+    if problems:
+        # Validators can rely on all entries being set (and valid).
+        return problems
+
+    section_name = section_plan.section_name
+    start_ns = 0 if observer is None else perf_counter_ns()
+    problems = _validate_section_collecting_problems(section, section_name)
+
+    if observer is not None:
+        report_phase(observer, FillPhase.validate_section, section_name, start_ns)
+
+    return problems
+
+
+def _run_timed(function: Callable, *args) -> Tuple[Any, int]:
+    start_ns = perf_counter_ns()
+    result = function(*args)
+    return result, perf_counter_ns() - start_ns
+
+
+# Section name, problems found filling (and checking) the section and the
+# future of its validation (only if there were no such problems):
+# noinspection PyUnresolvedReferences
+_PendingValidation = Tuple[
+    str, List[ConfigProblem], Optional["concurrent.futures.Future"]
+]
+
+
+def _gather_validations(
+    pending: List[_PendingValidation], observer: Optional[FillObserver]
+) -> List[ConfigProblem]:
+    # Waits for the validations in section order, so that the first error (or
+    # the list of problems) is always the same as with sequential validation.
+    problems = []
+
+    try:
+        for section_name, fill_problems, future in pending:
+            problems.extend(fill_problems)
+
+            if future is None:
+                continue
+
+            validation_problems, duration_ns = future.result()
+
+            if observer is not None:
+                observer.on_event(
+                    FillEvent(
+                        FillPhase.validate_section, section_name, None, duration_ns
+                    )
+                )
+
+            if validation_problems is not None:
+                problems.extend(validation_problems)
+    except BaseException:
+        # Validators that haven't started yet won't be needed anymore.
+        for _, _, future in pending:
+            if future is not None:
+                future.cancel()
+
+        raise
+
+    return problems
+
+
+def _fill_sections_validating_concurrently(
+    cfg: Config,
+    in_map: Any,
+    fmt: Optional[Format],
+    plan: FillPlan,
+    env_snapshot: Mapping[str, str],
+    collect_errors: bool,
+    observer: Optional[FillObserver],
+    validation_workers: int,
+):
+    # Sections are filled (and checked) one after another in this thread, as
+    # usual. Their validators are submitted to a thread pool as soon as each
+    # section is ready, so they overlap with each other and with filling the
+    # remaining sections.
+    # 'concurrent.futures' is slow to import and only needed here.
+    from concurrent.futures import ThreadPoolExecutor
+
+    yaml_input = fmt == Format.yaml
+    pending = []
+    fill_error = None
+
+    with ThreadPoolExecutor(
+        max_workers=validation_workers, thread_name_prefix="nx_config validator"
+    ) as executor:
+        for section_plan in plan.sections:
+            section_name = section_plan.section_name
+            section = getattr(cfg, section_name)
+            section_in_map = _get_section_in_map(in_map, section_name)
+
+            if collect_errors:
+                fill_problems = _fill_and_check_section_collecting_problems(
+                    section, section_plan, env_snapshot, section_in_map, fmt, observer
+                )
+
+                if fill_problems:
+                    pending.append((section_name, fill_problems, None))
+                    continue
+
+                validate = _validate_section_collecting_problems
+            else:
+                try:
+                    _fill_and_check_section(
+                        section,
+                        section_plan,
+                        env_snapshot,
+                        section_in_map,
+                        yaml_input,
+                        observer,
+                    )
+                except Exception as xcp:
+                    # Only raised after the validators of the previous
+                    # sections, one of which might fail first.
+                    fill_error = xcp
+                    break
+
+                validate = _validate_section
+
+            future = executor.submit(_run_timed, validate, section, section_name)
+            pending.append((section_name, [], future))
+
+        problems = _gather_validations(pending, observer)
+
+    if fill_error is not None:
+        raise fill_error
+
+    if problems:
+        raise AggregateError(problems)
+
+
+def fill_sections_stepwise(
+    cfg: Config,
+    in_map: Any,
+    fmt: Optional[Format],
+    plan: FillPlan,
+    env_snapshot: Mapping[str, str],
+    collect_errors: bool,
+    observer: Optional[FillObserver],
+) -> Iterator[None]:
+    # Fills one section per step, so that callers can do other things in
+    # between (see the async API). 'env_snapshot' must come from
+    # '_snapshot_env'.
+    yaml_input = fmt == Format.yaml
+    problems = []
+
+    for section_plan in plan.sections:
+        section_name = section_plan.section_name
+        section = getattr(cfg, section_name)
+        section_in_map = _get_section_in_map(in_map, section_name)
+
+        if collect_errors:
+            problems.extend(
+                _fill_section_collecting_problems(
+                    section, section_plan, env_snapshot, section_in_map, fmt, observer
+                )
+            )
+        else:
+            _fill_section(
+                section,
+                section_plan,
+                env_snapshot,
+                section_in_map,
+                yaml_input,
+                observer,
             )
 
+        yield
+
+    if problems:
+        raise AggregateError(problems)
+
 
-def _check_env_prefix(prefix: str):
-    if prefix == "":
+def fill_parsed_w_oracles(
+    cfg: Config,
+    in_map: Any,
+    fmt: Optional[Format],
+    plan: FillPlan,
+    env_map: Mapping[str, str],
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+    validation_workers: Optional[int] = None,
+):
+    if (validation_workers is not None) and (validation_workers < 1):
         raise ValueError(
-            f"Invalid empty prefix for configuration environment variables. If you don't want to use a custom"
-            f" prefix, use None instead (default)."
+            f"Invalid validation_workers {validation_workers}, must be at least 1"
+            f" (or None to run validators sequentially)."
         )
 
-    if (prefix[0] not in _env_prefix_first_char) or any(
-        x not in _env_prefix_chars for x in prefix[1:]
-    ):
-        raise ValueError(
-            f"Invalid prefix {repr(prefix)} for configuration environment variables. The only characters"
-            f" allowed in the prefix are upper case ASCII letters '{_upper_ascii_letters}', numerical digits"
-            f" '{_digits}' and underscores '_', with the additional restriction that the first character cannot"
-            f" be a numerical digit."
+    start_ns = 0 if observer is None else perf_counter_ns()
+    env_snapshot = _snapshot_env(env_map, plan)
+
+    if observer is not None:
+        report_phase(observer, FillPhase.env, None, start_ns)
+
+    if validation_workers is not None:
+        _fill_sections_validating_concurrently(
+            cfg,
+            in_map,
+            fmt,
+            plan,
+            env_snapshot,
+            collect_errors,
+            observer,
+            validation_workers,
         )
+        return
+
+    for _ in fill_sections_stepwise(
+        cfg, in_map, fmt, plan, env_snapshot, collect_errors, observer
+    ):
+        pass
 
 
 def fill_config_w_oracles(
@@ -154,95 +547,108 @@ def fill_config_w_oracles(
     fmt: Optional[Format],
     env_prefix: Optional[str],
     env_map: Mapping[str, str],
+    yaml_loader: Optional[YAMLLoader] = None,
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+    validation_workers: Optional[int] = None,
 ):
+    start_ns = 0 if observer is None else perf_counter_ns()
+    plan = get_fill_plan(type(cfg), env_prefix)
+
     if in_stream is None:
         in_map = None
-        convert = None
     elif fmt is None:
         raise ValueError(
             "When filling a config object directly from a TextIO stream you must"
             " provide a corresponding nx_config.Format through the 'fmt' parameter."
         )
-    elif fmt == Format.yaml:
-        in_map = safe_load(in_stream)
-        convert = _convert_yaml
-    else:  # fmt == Format.ini
-        in_map = ConfigParser()
-        in_map.read_file(in_stream)
-        convert = _convert_string
-
-    if env_prefix is None:
-        env_key_prefix = ""
+    elif observer is None:
+        in_map = parse_stream(in_stream, fmt, plan, yaml_loader)
     else:
-        _check_env_prefix(env_prefix)
-        env_key_prefix = f"{env_prefix}__"
+        parse_start_ns = perf_counter_ns()
+        in_map = parse_stream(in_stream, fmt, plan, yaml_loader)
+        report_phase(observer, FillPhase.parse, None, parse_start_ns)
 
-    for section_name in get_annotations(cfg):
-        section = getattr(cfg, section_name)
+    fill_parsed_w_oracles(
+        cfg, in_map, fmt, plan, env_map, collect_errors, observer, validation_workers
+    )
 
-        if in_map is None:
-            section_in_map = None
-        else:
-            # Cumbersome alternative to 'dict.get', necessary because
-            # 'in_map' might be a 'configparser.RawConfigParser' and
-            # 'configparser.RawConfigParser.get' doesn't get a whole
-            # section but rather an option within a section.
-            try:
-                section_in_map = in_map[section_name]
-            except KeyError:
-                section_in_map = None
+    if observer is not None:
+        report_phase(observer, FillPhase.total, None, start_ns)
 
-        try:
-            for entry_name in get_annotations(section):
-                env_key = (
-                    f"{env_key_prefix}{section_name.upper()}__{entry_name.upper()}"
-                )
-                env_value = env_map.get(env_key)
-
-                if env_value is None:
-                    if section_in_map is not None:
-                        try:
-                            in_map_value = section_in_map[entry_name]
-                        except KeyError:
-                            continue
-
-                        entry = getattr(type(section), entry_name)
-                        type_info = entry.type_info
-
-                        try:
-                            converted_new_value = convert(in_map_value, type_info)
-                        except ValueError as xcp:
-                            raise ValueError(
-                                f"Error converting value for attribute '{entry_name}': {xcp}"
-                            ) from xcp
-
-                        # noinspection PyProtectedMember
-                        entry._set(section, converted_new_value)
-                else:
-                    type_info = getattr(type(section), entry_name).type_info
-
-                    try:
-                        converted_new_value = _convert_string(env_value, type_info)
-                    except ValueError as xcp:
-                        raise ParsingError(
-                            f"Error parsing the value for attribute '{entry_name}'"
-                            f" from environment variable '{env_key}': {xcp}"
-                        ) from xcp
-
-                    setattr(section, internal_name(entry_name), converted_new_value)
-        except Exception as xcp:
-            raise type(xcp)(f"Error filling section '{section_name}': {xcp}") from xcp
 
-        try:
-            _check_all_entries_were_set(section)
-        except ValueError as xcp:
-            raise IncompleteSectionError(
-                f"Incomplete section '{section_name}': {xcp}"
-            ) from xcp
+# Raw inputs of a section: Its value in the parsed document (if any) and the
+# values of its environment variables (None where not set), in entry order.
+SectionInputs = Tuple[Any, Tuple[Optional[str], ...]]
 
-        try:
-            run_validators(section)
-        except Exception as xcp:
-            raise ValidationError(
-                f"Error validating section '{section_name}' at the end of 'fill_config' call: {xcp}"
-            ) from xcp
+
+def _same_yaml_input(a: Any, b: Any) -> bool:
+    # Stricter than '==', which considers e.g. 'True', '1' and '1.0' equal
+    # although they aren't equally valid for all entries. Only needed for YAML,
+    # raw inputs from INI files and environment variables are strings.
+    if type(a) is not type(b):
+        return False
+    elif isinstance(a, dict):
+        return (a.keys() == b.keys()) and all(_same_yaml_input(a[k], b[k]) for k in a)
+    elif isinstance(a, list):
+        return (len(a) == len(b)) and all(map(_same_yaml_input, a, b))
+    else:
+        return a == b
+
+
+def refill_config_w_oracles(
+    cfg: Config,
+    in_stream: TextIO,
+    fmt: Format,
+    env_prefix: Optional[str],
+    env_map: Mapping[str, str],
+    yaml_loader: Optional[YAMLLoader],
+    previous_cfg: Optional[Config],
+    previous_inputs: Optional[Tuple[SectionInputs, ...]],
+) -> Tuple[Tuple[SectionInputs, ...], Tuple[str, ...]]:
+    # Fills the (new) 'cfg' like 'fill_config_w_oracles', except for sections
+    # whose raw inputs are the same as in 'previous_inputs': The (already
+    # filled and validated) section objects of 'previous_cfg' are reused for
+    # those. Returns the raw inputs of all sections (for the next refill) and
+    # the names of the sections that were filled again.
+    plan = get_fill_plan(type(cfg), env_prefix)
+    in_map = parse_stream(in_stream, fmt, plan, yaml_loader)
+    yaml_input = fmt == Format.yaml
+    env_map = _snapshot_env(env_map, plan)
+    inputs = []
+    changed = []
+
+    for idx, section_plan in enumerate(plan.sections):
+        section_name = section_plan.section_name
+        section_in_map = _get_section_in_map(in_map, section_name)
+        section_inputs = (
+            section_in_map,
+            tuple(map(env_map.get, section_plan.env_keys)),
+        )
+        inputs.append(section_inputs)
+
+        # Plain '==' first, since it's much faster and sufficient to detect
+        # almost all changes.
+        if (
+            (previous_inputs is not None)
+            and (previous_inputs[idx] == section_inputs)
+            and (
+                (not yaml_input)
+                or _same_yaml_input(previous_inputs[idx][0], section_in_map)
+            )
+        ):
+            setattr(
+                cfg, internal_name(section_name), getattr(previous_cfg, section_name)
+            )
+        else:
+            changed.append(section_name)
+            _fill_section(
+                getattr(cfg, section_name),
+                section_plan,
+                env_map,
+                section_in_map,
+                yaml_input,
+                None,
+            )
+
+    return tuple(inputs), tuple(changed)
@@ -0,0 +1,74 @@
+from hashlib import blake2b
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Tuple
+
+from nx_config._core.compact_values import is_compact
+from nx_config._core.iteration_utils import get_annotations
+from nx_config._core.naming_utils import (
+    internal_name,
+    section_values_attr,
+    section_values_getter_attr,
+)
+from nx_config._core.sparse_values import is_sparse
+from nx_config.numeric_array import FloatArray, IntArray
+
+_types_to_normalize = frozenset((frozenset, IntArray, FloatArray))
+
+
+def _make_values_getter(section_t: type) -> Callable[[Any], Tuple[Any, ...]]:
+    if is_compact(section_t):
+        return attrgetter(section_values_attr)
+
+    if is_sparse(section_t):
+        # Reading the entries themselves, which takes care of the defaults.
+        names = tuple(get_annotations(section_t))
+    else:
+        names = tuple(internal_name(x) for x in get_annotations(section_t))
+
+    if len(names) > 1:
+        return attrgetter(*names)
+
+    # 'attrgetter' with a single name returns the value itself (not a tuple)
+    # and needs at least one name.
+    getters = tuple(attrgetter(x) for x in names)
+    return lambda section: tuple(f(section) for f in getters)
+
+
+def _get_values_getter(section_t: type) -> Callable[[Any], Tuple[Any, ...]]:
+    # Created once per section class, see also 'fill_plan._get_section_fill'.
+    try:
+        return section_t.__dict__[section_values_getter_attr]
+    except KeyError:
+        getter = _make_values_getter(section_t)
+        setattr(section_t, section_values_getter_attr, getter)
+        return getter
+
+
+def _normalized(value: Any) -> Any:
+    # The iteration order of frozensets (and so their 'repr') can differ for
+    # equal frozensets, so they're replaced by sorted tuples (wrapped in a
+    # 'frozenset' call, to tell them apart from actual tuples). Numeric arrays
+    # can be huge, so they're replaced by a digest of their bytes.
+    value_t = type(value)
+
+    if value_t is frozenset:
+        return frozenset, tuple(sorted(map(repr, value)))
+    elif value_t in _types_to_normalize:
+        return value_t, blake2b(value.view, digest_size=16).hexdigest()
+    else:
+        return value
+
+
+def section_fingerprint(section: Any) -> bytes:
+    # Digest of the values of all entries of a section. The 'repr' of entry
+    # values tells all possible types apart (e.g. '1', 'True' and '1.0').
+    values = _get_values_getter(type(section))(section)
+
+    if not _types_to_normalize.isdisjoint(map(type, values)):
+        values = tuple(map(_normalized, values))
+
+    return blake2b(repr(values).encode(), digest_size=16).digest()
+
+
+def config_fingerprint(section_fingerprints: Iterable[bytes]) -> str:
+    return blake2b(b"".join(section_fingerprints), digest_size=16).hexdigest()
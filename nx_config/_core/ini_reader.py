@@ -0,0 +1,241 @@
+import re
+from collections import ChainMap
+from configparser import (
+    ConfigParser,
+    MissingSectionHeaderError,
+    DuplicateSectionError,
+    DuplicateOptionError,
+    InterpolationDepthError,
+    InterpolationMissingOptionError,
+    InterpolationSyntaxError,
+    MAX_INTERPOLATION_DEPTH,
+    ParsingError,
+)
+from typing import TextIO, Mapping, Dict, List, Optional
+
+_comment_prefixes = ("#", ";")
+_default_section = "DEFAULT"
+# The same regex as 'ConfigParser' (which differs between python versions):
+_section_regex = ConfigParser.SECTCRE
+# The same regex as 'configparser.BasicInterpolation':
+_interpolation_key_regex = re.compile(r"%\(([^)]+)\)s")
+
+# The reader below is a stripped down version of 'configparser.ConfigParser'
+# (with default settings), reading a stream in a single pass and keeping only
+# the sections that are actually declared in the target 'Config' class (and
+# the 'DEFAULT' section). Everything else in the file is checked for syntax
+# errors just as before, but not stored. Whitespace and case semantics are the
+# same as with 'ConfigParser': Section names are case-sensitive, option names
+# are not, values are stripped, comments must be on their own line, indented
+# lines continue the previous value (joined with newlines) and the same syntax
+# errors are reported with the same exception types. Options missing in a
+# section are looked up in the 'DEFAULT' section and values are interpolated
+# like with 'configparser.BasicInterpolation' ('%%' and '%(name)s'). Unlike
+# 'ConfigParser', duplicate options are only reported for options of the
+# 'DEFAULT' section and options declared in the 'Config', and interpolation
+# errors are raised for all declared options found in the file (not only for
+# those actually used, i.e. not overridden by environment variables).
+
+
+def _joined(lines: List[str]) -> str:
+    return "\n".join(lines).rstrip()
+
+
+def _interpolate(
+    option: str,
+    section: str,
+    rawval: str,
+    rest: str,
+    options: Mapping[str, List[str]],
+    accum: List[str],
+    depth: int,
+):
+    # Same as 'configparser.BasicInterpolation._interpolate_some'. 'options'
+    # maps the lower case names of all options available in 'section' to the
+    # lines of their raw values.
+    if depth > MAX_INTERPOLATION_DEPTH:
+        raise InterpolationDepthError(option, section, rawval)
+
+    while rest:
+        p = rest.find("%")
+
+        if p < 0:
+            accum.append(rest)
+            return
+
+        if p > 0:
+            accum.append(rest[:p])
+            rest = rest[p:]
+
+        c = rest[1:2]
+
+        if c == "%":
+            accum.append("%")
+            rest = rest[2:]
+        elif c == "(":
+            match = _interpolation_key_regex.match(rest)
+
+            if match is None:
+                raise InterpolationSyntaxError(
+                    option, section, f"bad interpolation variable reference {rest!r}"
+                )
+
+            var = match.group(1).lower()
+            rest = rest[match.end() :]
+
+            try:
+                value = _joined(options[var])
+            except KeyError:
+                raise InterpolationMissingOptionError(
+                    option, section, rawval, var
+                ) from None
+
+            if "%" in value:
+                _interpolate(option, section, rawval, value, options, accum, depth + 1)
+            else:
+                accum.append(value)
+        else:
+            raise InterpolationSyntaxError(
+                option,
+                section,
+                f"'%' must be followed by '%' or '(', found: {rest!r}",
+            )
+
+
+def _interpolated(
+    option: str, section: str, rawval: str, options: Mapping[str, List[str]]
+) -> str:
+    if "%" not in rawval:
+        return rawval
+
+    accum = []
+    _interpolate(option, section, rawval, rawval, options, accum, 1)
+    return "".join(accum)
+
+
+def read_ini(
+    stream: TextIO, wanted: Mapping[str, Mapping[str, str]]
+) -> Dict[str, Dict[str, str]]:
+    # 'wanted' maps section names to mappings from lower case option names to
+    # the corresponding entry names. The result maps section names to mappings
+    # from entry names to (interpolated string) values.
+    fpname = getattr(stream, "name", "<???>")
+    # Lower case option names to the lines of their raw values, for the
+    # 'DEFAULT' section and each wanted section:
+    defaults: Dict[str, List[str]] = {}
+    sections: Dict[str, Dict[str, List[str]]] = {}
+    seen_sections = set()
+    error = None
+
+    wanted_options = None  # Options wanted from the current section (if any)
+    section_options = None  # Options of the current section (if stored)
+    sectname = None
+    in_section = False
+    in_option = False  # Whether an indented line continues an option
+    option_lines: Optional[List[str]] = None  # Lines of a stored option's value
+    indent_level = 0
+
+    for lineno, line in enumerate(stream, start=1):
+        stripped = line.strip()
+
+        if stripped.startswith(_comment_prefixes):
+            continue
+
+        if not stripped:
+            if option_lines is not None:
+                option_lines.append("")
+            continue
+
+        cur_indent_level = len(line) - len(line.lstrip())
+
+        if in_option and (cur_indent_level > indent_level):
+            if option_lines is not None:
+                option_lines.append(stripped)
+            continue
+
+        indent_level = cur_indent_level
+        match = _section_regex.match(stripped) if stripped[0] == "[" else None
+
+        if match is not None:
+            sectname = match.group("header")
+
+            if sectname == _default_section:
+                wanted_options = None
+                section_options = defaults
+            else:
+                if sectname in seen_sections:
+                    raise DuplicateSectionError(sectname, fpname, lineno)
+
+                seen_sections.add(sectname)
+                wanted_options = wanted.get(sectname)
+
+                if wanted_options is None:
+                    section_options = None
+                else:
+                    section_options = sections.setdefault(sectname, {})
+
+            in_section = True
+            in_option = False
+            option_lines = None
+        elif not in_section:
+            raise MissingSectionHeaderError(fpname, lineno, line)
+        else:
+            eq_idx = stripped.find("=")
+            colon_idx = stripped.find(":")
+
+            if eq_idx == -1:
+                delim_idx = colon_idx
+            elif colon_idx == -1:
+                delim_idx = eq_idx
+            else:
+                delim_idx = min(eq_idx, colon_idx)
+
+            if delim_idx <= 0:
+                if error is None:
+                    error = ParsingError(fpname)
+                error.append(lineno, repr(line))
+
+                if delim_idx == 0:
+                    # 'ConfigParser' still reads an option with an empty name
+                    # here, which doesn't take continuation lines.
+                    in_option = False
+                    option_lines = None
+
+                continue
+
+            in_option = True
+            option_lines = None
+
+            if section_options is None:
+                continue
+
+            optname = stripped[:delim_idx].rstrip().lower()
+
+            if (optname in section_options) and (
+                (wanted_options is None) or (optname in wanted_options)
+            ):
+                raise DuplicateOptionError(sectname, optname, fpname, lineno)
+
+            option_lines = [stripped[delim_idx + 1 :].lstrip()]
+            # The list is shared, so that continuation lines appended later also
+            # end up in the results. Lines are joined below.
+            section_options[optname] = option_lines
+
+    if error is not None:
+        raise error
+
+    result = {}
+
+    for sectname, section_options in sections.items():
+        options = ChainMap(section_options, defaults)
+        section_result = result[sectname] = {}
+
+        for optname, entry_name in wanted[sectname].items():
+            lines = options.get(optname)
+
+            if lines is not None:
+                section_result[entry_name] = _interpolated(
+                    optname, sectname, _joined(lines), options
+                )
+
+    return result
@@ -4,5 +4,14 @@ def internal_name(name: str) -> str:
 
 section_validators_attr = internal_name("_validators")
 root_attr = internal_name("_root")
+fill_plans_attr = internal_name("_fill_plans")
+section_fill_attr = internal_name("_fill")
+section_timed_fill_attr = internal_name("_timed_fill")
+section_values_getter_attr = internal_name("_values_getter")
+section_compact_attr = internal_name("_compact")
+section_values_attr = internal_name("_values")
+section_intern_pool_attr = internal_name("_intern_pool")
+section_sparse_attr = internal_name("_sparse")
+section_overrides_attr = internal_name("_overrides")
 
 indentation_spaces = "    "
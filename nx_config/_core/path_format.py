@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from nx_config.format import Format
+
+_supported_yaml_extensions = (".yaml", ".yml", ".YAML", ".YML")
+_supported_ini_extensions = (".ini", ".INI")
+
+
+def format_from_path(path: Path) -> Format:
+    if path.is_dir():
+        raise IsADirectoryError(f"Is a directory: '{path}'")
+
+    dot_ext = path.suffix
+
+    if dot_ext in _supported_yaml_extensions:
+        return Format.yaml
+    elif dot_ext in _supported_ini_extensions:
+        return Format.ini
+    else:
+        raise ValueError(
+            f"Configuration filepath '{path}' has unsupported extension. This version of PyConfig supports"
+            f" the formats YAML (extensions: {', '.join(_supported_yaml_extensions)}) and INI (extensions:"
+            f" {', '.join(_supported_ini_extensions)})."
+        )
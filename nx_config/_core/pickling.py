@@ -0,0 +1,52 @@
+from typing import Any, Tuple
+
+from nx_config._core.compact_values import is_compact
+from nx_config._core.iteration_utils import get_annotations
+from nx_config._core.naming_utils import (
+    internal_name,
+    section_intern_pool_attr,
+    section_overrides_attr,
+    section_values_attr,
+)
+from nx_config._core.sparse_values import is_sparse, overrides_from_values
+
+# Config objects (and sections) can't be pickled the default way because their
+# attributes can't be set after construction. Instead, they're reduced to their
+# type and values and restored by setting the internal attributes directly.
+
+
+def restore_config(config_t: type, sections: Tuple[Any, ...]) -> Any:
+    cfg = config_t.__new__(config_t)
+
+    for section_name, section in zip(get_annotations(config_t), sections):
+        setattr(cfg, internal_name(section_name), section)
+
+    return cfg
+
+
+def restore_section(section_t: type, values: Tuple[Any, ...]) -> Any:
+    section = section_t.__new__(section_t)
+    intern_pool = getattr(section_t, section_intern_pool_attr)
+
+    if intern_pool is not None:
+        # noinspection PyProtectedMember
+        values = tuple(map(intern_pool._intern, values))
+
+    if is_compact(section_t):
+        if intern_pool is not None:
+            # noinspection PyProtectedMember
+            values = intern_pool._intern(values)
+
+        setattr(section, section_values_attr, values)
+        return section
+
+    if is_sparse(section_t):
+        setattr(
+            section, section_overrides_attr, overrides_from_values(section_t, values)
+        )
+        return section
+
+    for entry_name, value in zip(get_annotations(section_t), values):
+        setattr(section, internal_name(entry_name), value)
+
+    return section
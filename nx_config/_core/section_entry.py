@@ -1,4 +1,5 @@
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable, Optional
 
 from nx_config._core.type_checks import ConfigTypeInfo
 from nx_config._core.unset import Unset
@@ -30,8 +31,60 @@ def _check_default_value(value: Any, entry_name: str, type_info: ConfigTypeInfo)
     )
 
 
-class SectionEntry:
-    __slots__ = ("default", "entry_name", "_value_attribute", "type_info")
+# noinspection PyUnusedLocal
+def _reject_set(instance, value):
+    raise AttributeError(
+        "Setting config entries is not allowed. The contents of the config should be"
+        " loaded at startup from defaults, configuration files and environment variables."
+    )
+
+
+def _make_getter(
+    value_attribute: str,
+    value_index: Optional[int],
+    sparse: bool,
+    entry_name: str,
+    default: Any,
+) -> Callable:
+    get_value = attrgetter(value_attribute)
+
+    if sparse:
+        # Entries of sparse sections are either in the 'dict' of overrides in
+        # 'value_attribute' or have their default value.
+        def get_override(instance):
+            overrides = get_value(instance)
+            return default if overrides is None else overrides.get(entry_name, default)
+
+        return get_override
+
+    if value_index is None:
+        return get_value
+
+    # Entries of compact sections are items of the tuple in 'value_attribute'.
+    # There's no C-level composition of 'attrgetter' and 'itemgetter', so
+    # reading them runs this (small) function.
+    def get_item(instance):
+        return get_value(instance)[value_index]
+
+    return get_item
+
+
+class SectionEntry(property):
+    # A 'property' whose getter is an 'attrgetter' for the (slot) attribute
+    # holding the value, so that reading an entry doesn't run any Python code
+    # (unlike a descriptor class with its own '__get__'). Setting an entry is
+    # rejected by the property's setter, see '_set' for setting it internally.
+    # Subclasses of 'property' need a '__doc__' attribute of their own (and
+    # 'property.__init__' doesn't always set it).
+    __slots__ = (
+        "default",
+        "entry_name",
+        "_value_attribute",
+        "_value_index",
+        "_sparse",
+        "type_info",
+        "__doc__",
+    )
 
     def __init__(
         self,
@@ -39,28 +92,29 @@ class SectionEntry:
         entry_name: str,
         value_attribute: str,
         type_info: ConfigTypeInfo,
+        value_index: Optional[int] = None,
+        sparse: bool = False,
     ):
+        doc = f"Config entry '{entry_name}'."
+        super().__init__(
+            fget=_make_getter(
+                value_attribute, value_index, sparse, entry_name, default
+            ),
+            fset=_reject_set,
+            doc=doc,
+        )
+        self.__doc__ = doc
         self.default = default
         self.entry_name = entry_name
         self._value_attribute = value_attribute
+        self._value_index = value_index
+        self._sparse = sparse
         self.type_info = type_info
 
         if default is not Unset:
             _check_default_value(default, entry_name, type_info)
 
-    def __get__(self, instance, owner):
-        if instance is None:  # Called from the class
-            return self
-
-        return getattr(instance, self._value_attribute)
-
-    def __set__(self, instance, value):
-        raise AttributeError(
-            "Setting config entries is not allowed. The contents of the config should be"
-            " loaded at startup from defaults, configuration files and environment variables."
-        )
-
-    def _set(self, instance, value):
+    def _checked(self, value: Any) -> Any:
         try:
             self.type_info.check_type(value)
         except TypeError as xcp:
@@ -68,4 +122,22 @@ class SectionEntry:
                 f"Error setting attribute '{self.entry_name}': {xcp}"
             ) from xcp
 
-        setattr(instance, self._value_attribute, value)
+        return value
+
+    def _set(self, instance, value):
+        value = self._checked(value)
+        idx = self._value_index
+
+        if self._sparse:
+            overrides = dict(getattr(instance, self._value_attribute) or ())
+            overrides[self.entry_name] = value
+            setattr(instance, self._value_attribute, overrides)
+            return
+
+        if idx is None:
+            setattr(instance, self._value_attribute, value)
+            return
+
+        values = getattr(instance, self._value_attribute)
+        values = values[:idx] + (value,) + values[idx + 1 :]
+        setattr(instance, self._value_attribute, values)
@@ -1,15 +1,23 @@
 from abc import ABCMeta
 from inspect import isroutine, isclass
+from typing import Callable, Mapping, Any, Optional
 
+from nx_config._core.codegen import create_function
 from nx_config._core.naming_utils import (
     root_attr,
     internal_name,
+    section_compact_attr,
+    section_intern_pool_attr,
+    section_overrides_attr,
+    section_sparse_attr,
     section_validators_attr,
+    section_values_attr,
 )
 from nx_config._core.section_entry import SectionEntry
 from nx_config._core.type_checks import ConfigTypeInfo
 from nx_config._core.unset import Unset
 from nx_config._core.validator import Validator
+from nx_config.intern_pool import InternPool
 
 _special_section_keys = (
     "__module__",
@@ -21,8 +29,42 @@ _special_section_keys = (
 )
 
 
+def _generate_init(qualname: str, defaults: Mapping[str, Any]) -> Callable:
+    closure = {}
+    body = []
+
+    for entry_name, default in defaults.items():
+        default_var = f"_default_{entry_name}"
+        closure[default_var] = default
+        body.append(f"self.{internal_name(entry_name)} = {default_var}")
+
+    return create_function(
+        "__init__", ("self",), body, qualname=f"{qualname}.__init__", closure=closure
+    )
+
+
+def _generate_single_slot_init(qualname: str, attribute: str, value: Any) -> Callable:
+    # For compact and sparse sections, which store all values in a single
+    # slot. All default-initialized sections share the same 'value'.
+    return create_function(
+        "__init__",
+        ("self",),
+        [f"self.{attribute} = _value"],
+        qualname=f"{qualname}.__init__",
+        closure={"_value": value},
+    )
+
+
 class SectionMeta(ABCMeta):
-    def __new__(mcs, typename, bases, ns):
+    def __new__(
+        mcs,
+        typename,
+        bases,
+        ns,
+        compact: Optional[bool] = None,
+        sparse: Optional[bool] = None,
+        intern_pool: Optional[InternPool] = None,
+    ):
         is_root = ns.pop(root_attr, False)
 
         if ("__init__" in ns) and (not is_root):
@@ -43,7 +85,30 @@ class SectionMeta(ABCMeta):
                 " unique because in some config file formats keys are parsed case-insensitively."
             )
 
-        for entry_name, entry_type in entries.items():
+        if compact is None:
+            compact = any(getattr(x, section_compact_attr, False) for x in bases)
+
+        if sparse is None:
+            sparse = any(getattr(x, section_sparse_attr, False) for x in bases)
+
+        if compact and sparse:
+            raise ValueError(
+                "Subclass of 'ConfigSection' cannot be both compact and sparse (pass"
+                " 'compact=False' or 'sparse=False' when subclassing a compact or sparse"
+                " section)."
+            )
+
+        if intern_pool is None:
+            inherited = (getattr(x, section_intern_pool_attr, None) for x in bases)
+            intern_pool = next((x for x in inherited if x is not None), None)
+        elif not isinstance(intern_pool, InternPool):
+            raise TypeError(
+                f"Expected an InternPool for 'intern_pool', got {type(intern_pool).__name__}."
+            )
+
+        defaults = {}
+
+        for entry_idx, (entry_name, entry_type) in enumerate(entries.items()):
             if entry_name.startswith("_"):
                 raise ValueError(
                     f"Attributes of 'ConfigSection' subclass cannot start with underscores."
@@ -58,12 +123,22 @@ class SectionMeta(ABCMeta):
                 ) from xcp
 
             default = ns.get(entry_name, Unset)
+            defaults[entry_name] = default
+
+            if compact:
+                value_attribute = section_values_attr
+            elif sparse:
+                value_attribute = section_overrides_attr
+            else:
+                value_attribute = internal_name(entry_name)
 
             ns[entry_name] = SectionEntry(
                 default=default,
                 entry_name=entry_name,
-                value_attribute=internal_name(entry_name),
+                value_attribute=value_attribute,
                 type_info=type_info,
+                value_index=entry_idx if compact else None,
+                sparse=bool(sparse),
             )
 
         special_keys = frozenset(entries).union(_special_section_keys)
@@ -82,7 +157,34 @@ class SectionMeta(ABCMeta):
                 )
 
         ns[section_validators_attr] = tuple(validators)
-        ns["__slots__"] = tuple(internal_name(e) for e in entries)
+        ns[section_compact_attr] = bool(compact)
+        ns[section_sparse_attr] = bool(sparse)
+        ns[section_intern_pool_attr] = intern_pool
+        qualname = ns.get("__qualname__", typename)
+
+        # Subclasses without annotations of their own keep the inherited
+        # (generic) '__init__' and storage.
+        if not entries or is_root:
+            ns["__slots__"] = ()
+            return super().__new__(mcs, typename, bases, ns)
+
+        if sparse:
+            ns["__slots__"] = (section_overrides_attr,)
+            ns["__init__"] = _generate_single_slot_init(
+                qualname, section_overrides_attr, None
+            )
+            return super().__new__(mcs, typename, bases, ns)
+
+        if not compact:
+            ns["__slots__"] = tuple(internal_name(e) for e in entries)
+            ns["__init__"] = _generate_init(qualname, defaults)
+            return super().__new__(mcs, typename, bases, ns)
+
+        default_values = tuple(defaults.values())
+        ns["__slots__"] = (section_values_attr,)
+        ns["__init__"] = _generate_single_slot_init(
+            qualname, section_values_attr, default_values
+        )
         return super().__new__(mcs, typename, bases, ns)
 
 
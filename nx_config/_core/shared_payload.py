@@ -0,0 +1,81 @@
+import io
+import pickle
+from typing import Any, Tuple
+
+from nx_config._core.iteration_utils import get_annotations
+from nx_config._core.pickling import restore_config, restore_section
+
+# Only the values are stored (no classes), so the payload holds nothing but
+# builtin values and the few types config entries can have. Readers only
+# accept exactly those, so that unpickling a corrupted (or tampered) segment
+# can't do anything worse than failing.
+_allowed_globals = frozenset(
+    (
+        ("datetime", "datetime"),
+        ("datetime", "timedelta"),
+        ("datetime", "timezone"),
+        ("dateutil.tz.tz", "tzlocal"),
+        ("dateutil.tz.tz", "tzoffset"),
+        ("dateutil.tz.tz", "tzutc"),
+        ("nx_config.numeric_array", "FloatArray"),
+        ("nx_config.numeric_array", "IntArray"),
+        ("nx_config.numeric_array", "_from_bytes"),
+        ("pathlib", "Path"),
+        ("pathlib", "PosixPath"),
+        ("pathlib", "PurePath"),
+        ("pathlib", "PurePosixPath"),
+        ("pathlib", "PureWindowsPath"),
+        ("pathlib", "WindowsPath"),
+        ("uuid", "SafeUUID"),
+        ("uuid", "UUID"),
+    )
+)
+
+
+class _ValuesUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in _allowed_globals:
+            raise pickle.UnpicklingError(
+                f"Unexpected global '{module}.{name}' in shared config payload."
+            )
+
+        return super().find_class(module, name)
+
+
+def config_layout(config_t: type) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    # Section and entry names, stored with the values so that readers can
+    # tell whether they use the same config class as the writer.
+    return tuple(
+        (section_name, tuple(get_annotations(section_t)))
+        for section_name, section_t in get_annotations(config_t).items()
+    )
+
+
+def dump_config(cfg: Any) -> bytes:
+    values = tuple(
+        tuple(getattr(section, x) for x in get_annotations(section))
+        for section in (getattr(cfg, x) for x in get_annotations(cfg))
+    )
+    return pickle.dumps(
+        (config_layout(type(cfg)), values), protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def load_config(config_t: type, payload: bytes) -> Any:
+    layout, values = _ValuesUnpickler(io.BytesIO(payload)).load()
+
+    if layout != config_layout(config_t):
+        raise ValueError(
+            f"The shared config doesn't match {config_t.__name__}, it has the"
+            f" following sections and entries: {layout}"
+        )
+
+    return restore_config(
+        config_t,
+        tuple(
+            restore_section(section_t, section_values)
+            for section_t, section_values in zip(
+                get_annotations(config_t).values(), values
+            )
+        ),
+    )
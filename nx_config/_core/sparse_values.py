@@ -0,0 +1,34 @@
+from typing import Any, Dict, Optional, Tuple
+
+from nx_config._core.iteration_utils import get_annotations
+from nx_config._core.naming_utils import section_sparse_attr
+from nx_config._core.value_keys import value_key
+
+# Sparse sections (see 'SectionMeta') store only the values of overridden
+# entries, in a 'dict' from entry name to value (or 'None' if no entry was
+# overridden). Reading any other entry returns its default value. Overrides
+# are never modified in place, setting an entry replaces the whole 'dict'.
+
+
+def is_sparse(section_t: type) -> bool:
+    # See 'compact_values.is_compact'.
+    return (
+        getattr(section_t, section_sparse_attr) and len(get_annotations(section_t)) > 0
+    )
+
+
+def overrides_from_values(
+    section_t: type, values: Tuple[Any, ...]
+) -> Optional[Dict[str, Any]]:
+    # Used when all values are known (e.g. when unpickling), but not which of
+    # them were overridden: Values interchangeable with the defaults are left
+    # out.
+    overrides = {}
+
+    for entry_name, value in zip(get_annotations(section_t), values):
+        default = getattr(section_t, entry_name).default
+
+        if (value is not default) and (value_key(value) != value_key(default)):
+            overrides[entry_name] = value
+
+    return overrides or None
@@ -0,0 +1,10 @@
+from sys import version_info
+
+if version_info.minor < 7:
+    from time import perf_counter
+
+    def perf_counter_ns() -> int:
+        return int(perf_counter() * 1e9)
+
+else:
+    from time import perf_counter_ns
@@ -4,6 +4,7 @@ from typing import Tuple, Union, Optional, Type, Collection, NamedTuple, Any
 from uuid import UUID
 
 from nx_config._core.typing_utils import get_origin, get_args
+from nx_config.numeric_array import IntArray, FloatArray, NumericArray
 from nx_config.secret_string import SecretString
 from nx_config.url import URL
 
@@ -18,6 +19,8 @@ _supported_base_types = frozenset(
         Path,
         SecretString,
         URL,
+        IntArray,
+        FloatArray,
     )
 )
 
@@ -79,8 +82,10 @@ class ConfigTypeInfo(NamedTuple):
         collection, base = _get_collection_and_base(base_or_collection)
         nice_str = _nice_type_str(t)
 
-        if (base not in _supported_base_types) or (
-            collection not in (None, tuple, frozenset)
+        if (
+            (base not in _supported_base_types)
+            or (collection not in (None, tuple, frozenset))
+            or ((collection is not None) and issubclass(base, NumericArray))
         ):
             supported = ", ".join(
                 sorted(
@@ -89,7 +94,8 @@ class ConfigTypeInfo(NamedTuple):
             )
             raise TypeError(
                 f"Type(-hint) '{nice_str}' is not supported for config entries. Allowed 'base' types:"
-                f" {supported}. Allowed collections (where 'base' is one of the allowed base types):"
+                f" {supported}. Allowed collections (where 'base' is one of the allowed base types,"
+                f" other than IntArray and FloatArray, which are collections themselves):"
                 f" typing.Tuple[base, ...], tuple[base, ...] (python 3.9+), typing.FrozenSet[base],"
                 f" frozenset[base] (python 3.9+). Allowed optionals: typing.Optional[base] (where"
                 f" 'base' is one of the allowed base types), typing.Optional[collection] (where"
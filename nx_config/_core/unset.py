@@ -8,5 +8,9 @@ class UnsetType:
     def __repr__(self):
         return "Unset"
 
+    def __reduce__(self):
+        # Unpickled as the same (only) instance.
+        return "Unset"
+
 
 Unset = UnsetType()
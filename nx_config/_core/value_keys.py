@@ -0,0 +1,32 @@
+from pathlib import PurePath
+from typing import Any, Hashable
+from uuid import UUID
+
+from nx_config.numeric_array import FloatArray, IntArray
+
+
+def value_key(value: Any) -> Hashable:
+    # Two entry values are interchangeable if they have the same key. Equal
+    # values aren't always interchangeable (e.g. '0.0' and '-0.0', '1' and
+    # 'True' in a tuple, or datetimes with different time zones for the same
+    # instant), but values of the same type with the same 'repr' are. Cheaper
+    # keys are used where equality is enough, starting with strings (the most
+    # common values), which are their own key.
+    value_t = type(value)
+
+    if value_t is str:
+        return value
+    elif (value_t in (int, UUID)) or (
+        (value_t in (tuple, frozenset)) and all(type(x) is str for x in value)
+    ):
+        return value_t, value
+    elif isinstance(value, PurePath):
+        return value_t, str(value)
+    elif value_t is IntArray:
+        return value_t, value
+    elif value_t is FloatArray:
+        # Equal float arrays aren't interchangeable if they differ in zeros'
+        # signs, arrays with the same bytes are.
+        return value_t, value.view.tobytes()
+    else:
+        return value_t, repr(value)
@@ -0,0 +1,139 @@
+from os import environ, PathLike
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional, TextIO, Type, TypeVar, Union
+
+# noinspection PyProtectedMember
+from nx_config._core.async_fill_with_oracles import (
+    fill_config_async_w_oracles as _fill_config_async_w_oracles,
+    fill_config_from_path_async_w_oracles as _fill_config_from_path_async_w_oracles,
+    watch_config_w_oracles as _watch_config_w_oracles,
+)
+from nx_config.config import Config
+from nx_config.format import Format
+from nx_config.instrumentation import FillObserver
+from nx_config.yaml_loader import YAMLLoader
+
+ConfigT = TypeVar("ConfigT", bound=Config)
+
+
+async def fill_config_async(
+    cfg: Config,
+    *,
+    stream: Optional[TextIO] = None,
+    fmt: Optional[Format] = None,
+    env_prefix: Optional[str] = None,
+    yaml_loader: Optional[YAMLLoader] = None,
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+):
+    """
+    Asynchronous version of :py:func:`~nx_config.fill_config`, for use in
+    ``asyncio`` applications. The stream is read and parsed in the event loop's
+    default executor. Conversion and validation run in the event loop's thread
+    (so validators don't need to be thread-safe), handing control back to the
+    loop after each section.
+
+    :param cfg: See :py:func:`~nx_config.fill_config`.
+    :param stream: See :py:func:`~nx_config.fill_config`.
+    :param fmt: See :py:func:`~nx_config.fill_config`.
+    :param env_prefix: See :py:func:`~nx_config.fill_config`.
+    :param yaml_loader: See :py:func:`~nx_config.fill_config`.
+    :param collect_errors: See :py:func:`~nx_config.fill_config`.
+    :param observer: See :py:func:`~nx_config.fill_config`.
+    """
+    # WARNING: Keep this a thin wrapper, see 'fill_config'.
+    await _fill_config_async_w_oracles(
+        cfg,
+        in_stream=stream,
+        fmt=fmt,
+        env_prefix=env_prefix,
+        env_map=environ,
+        yaml_loader=yaml_loader,
+        collect_errors=collect_errors,
+        observer=observer,
+    )
+
+
+async def fill_config_from_path_async(
+    cfg: Config,
+    *,
+    path: Optional[Union[str, PathLike]] = None,
+    env_prefix: Optional[str] = None,
+    yaml_loader: Optional[YAMLLoader] = None,
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+):
+    """
+    Asynchronous version of :py:func:`~nx_config.fill_config_from_path`. The
+    file is opened, read and parsed in the event loop's default executor. See
+    :py:func:`~nx_config.fill_config_async` for the rest.
+
+    :param cfg: See :py:func:`~nx_config.fill_config_from_path`.
+    :param path: See :py:func:`~nx_config.fill_config_from_path`.
+    :param env_prefix: See :py:func:`~nx_config.fill_config`.
+    :param yaml_loader: See :py:func:`~nx_config.fill_config`.
+    :param collect_errors: See :py:func:`~nx_config.fill_config`.
+    :param observer: See :py:func:`~nx_config.fill_config`.
+    """
+    # WARNING: Keep this a thin wrapper, see 'fill_config_from_path'.
+    if path is None:
+        return await fill_config_async(
+            cfg,
+            env_prefix=env_prefix,
+            yaml_loader=yaml_loader,
+            collect_errors=collect_errors,
+            observer=observer,
+        )
+
+    await _fill_config_from_path_async_w_oracles(
+        cfg,
+        path=Path(path),
+        env_prefix=env_prefix,
+        env_map=environ,
+        yaml_loader=yaml_loader,
+        collect_errors=collect_errors,
+        observer=observer,
+    )
+
+
+def watch_config(
+    config_t: Type[ConfigT],
+    *,
+    path: Union[str, PathLike],
+    env_prefix: Optional[str] = None,
+    yaml_loader: Optional[YAMLLoader] = None,
+    poll_interval: float = 1.0,
+    on_error: Optional[Callable[[Exception], None]] = None,
+) -> AsyncIterator[ConfigT]:
+    """
+    Asynchronous iterator yielding a newly filled instance of ``config_t``
+    first right away and then each time the file at ``path`` changes (checked
+    every ``poll_interval`` seconds with ``os.stat``, see
+    :py:class:`~nx_config.ReloadableConfig`). Configs are filled with
+    :py:func:`~nx_config.fill_config_from_path_async`. If the initial fill
+    fails, the exception is raised. Later failures (including failures to
+    access the file) are passed to ``on_error`` and skipped, so only valid
+    configs are yielded.
+
+    Example::
+
+        async for cfg in watch_config(MyConfig, path="config.yaml"):
+            app.config = cfg
+
+    :param config_t: Subclass of :py:class:`~nx_config.Config` to fill.
+    :param path: Path of the config file.
+    :param env_prefix: See :py:func:`~nx_config.fill_config`.
+    :param yaml_loader: See :py:func:`~nx_config.fill_config`.
+    :param poll_interval: Seconds between checks of the watched file.
+    :param on_error: Optional callback receiving the exception of each failed
+        reload.
+    """
+    return _watch_config_w_oracles(
+        config_t,
+        path=Path(path),
+        env_prefix=env_prefix,
+        env_map=environ,
+        yaml_loader=yaml_loader,
+        poll_interval=poll_interval,
+        on_error=on_error,
+    )
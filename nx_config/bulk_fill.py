@@ -0,0 +1,77 @@
+from os import environ
+from typing import Iterable, List, Optional, Type, TypeVar, Union
+
+# noinspection PyProtectedMember
+from nx_config._core.bulk_fill_with_oracles import (
+    BulkSource as _BulkSource,
+    fill_configs_w_oracles as _fill_configs_w_oracles,
+)
+from nx_config.config import Config
+from nx_config.format import Format
+from nx_config.yaml_loader import YAMLLoader
+
+ConfigT = TypeVar("ConfigT", bound=Config)
+
+
+def fill_configs(
+    config_t: Type[ConfigT],
+    sources: Iterable[_BulkSource],
+    *,
+    fmt: Optional[Format] = None,
+    env_prefix: Optional[str] = None,
+    yaml_loader: Optional[YAMLLoader] = None,
+    collect_errors: bool = False,
+    return_exceptions: bool = False,
+    # noinspection PyUnresolvedReferences
+    executor: Optional["concurrent.futures.Executor"] = None,
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> List[Union[ConfigT, Exception]]:
+    """
+    Fills one new instance of ``config_t`` for each source, in parallel on a
+    pool of processes, e.g. to check the config files of many deployments at
+    once.
+
+    Sources can be paths (``str`` or path-like objects, see
+    :py:func:`~nx_config.fill_config_from_path`) or text streams (see
+    :py:func:`~nx_config.fill_config`, all with the format ``fmt``). Files are
+    read by the worker processes, streams are read by the calling process and
+    their contents sent to the workers. All configs also get the same
+    environment variables (those of the calling process) as usual.
+
+    ``config_t``, the filled configs and any errors are sent between processes
+    with ``pickle``, so ``config_t`` must be importable (i.e. defined at the
+    top level of a module).
+
+    :param config_t: Subclass of :py:class:`~nx_config.Config` to fill.
+    :param sources: Paths and/or text streams to fill the configs from.
+    :param fmt: Format of all text streams in ``sources`` (ignored for paths).
+    :param env_prefix: See :py:func:`~nx_config.fill_config`.
+    :param yaml_loader: See :py:func:`~nx_config.fill_config`.
+    :param collect_errors: See :py:func:`~nx_config.fill_config`.
+    :param return_exceptions: If ``False`` (default), the first error (in input
+        order) is raised once all sources are processed. If ``True``, errors are
+        returned in place of the corresponding configs instead.
+    :param executor: Optional ``concurrent.futures.Executor`` to use instead of
+        a new ``ProcessPoolExecutor`` (which is shut down at the end).
+    :param max_workers: Number of worker processes for the new
+        ``ProcessPoolExecutor`` (ignored if ``executor`` is given). By default,
+        the number of CPUs.
+    :param chunksize: Number of sources sent to a worker process at a time.
+        Larger chunks reduce the communication overhead for many small files.
+    :return: The filled configs (or errors), in the same order as ``sources``.
+    """
+    # WARNING: Keep this a thin wrapper, see 'fill_config'.
+    return _fill_configs_w_oracles(
+        config_t,
+        sources=sources,
+        fmt=fmt,
+        env_prefix=env_prefix,
+        env_map=environ,
+        yaml_loader=yaml_loader,
+        collect_errors=collect_errors,
+        return_exceptions=return_exceptions,
+        executor=executor,
+        max_workers=max_workers,
+        chunksize=chunksize,
+    )
@@ -5,10 +5,10 @@ from nx_config._core.config_meta import ConfigMeta as _Meta
 from nx_config._core.iteration_utils import get_annotations as _get_annotations
 
 # noinspection PyProtectedMember
-from nx_config._core.naming_utils import (
-    internal_name as _internal_name,
-    indentation_spaces as _indentation_spaces,
-)
+from nx_config._core.naming_utils import indentation_spaces as _indentation_spaces
+
+# noinspection PyProtectedMember
+from nx_config._core.pickling import restore_config as _restore_config
 
 
 def _indent_new_lines(s: str) -> str:
@@ -23,8 +23,9 @@ class Config(metaclass=_Meta):
     _nx_config_internal__root = True
 
     def __init__(self):
-        for section_name, section_type in _get_annotations(self).items():
-            setattr(self, _internal_name(section_name), section_type())
+        # Subclasses declaring sections get a generated '__init__' instead,
+        # see 'ConfigMeta'.
+        pass
 
     def __str__(self):
         sections = ((x, getattr(self, x)) for x in _get_annotations(self))
@@ -40,3 +41,7 @@ class Config(metaclass=_Meta):
             )
         )
         return f"{type(self).__name__}(\n{sections_str})"
+
+    def __reduce__(self):
+        sections = tuple(getattr(self, x) for x in _get_annotations(self))
+        return _restore_config, (type(self), sections)
@@ -0,0 +1,204 @@
+from collections import deque
+from threading import Lock
+from time import time
+from typing import (
+    Callable,
+    Deque,
+    Generic,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+# noinspection PyProtectedMember
+from nx_config._core.fingerprint import (
+    config_fingerprint as _config_fingerprint,
+    section_fingerprint as _section_fingerprint,
+)
+
+# noinspection PyProtectedMember
+from nx_config._core.iteration_utils import get_annotations as _get_annotations
+
+# noinspection PyProtectedMember
+from nx_config._core.naming_utils import internal_name as _internal_name
+from nx_config.config import Config
+
+ConfigT = TypeVar("ConfigT", bound=Config)
+
+
+class ConfigSnapshot(NamedTuple):
+    """
+    Config published in a :py:class:`~nx_config.ConfigHolder` keeping a
+    history (see ``ConfigHolder.snapshots``). ``published_at`` is the time of
+    publishing (as returned by ``time.time``) and ``fingerprint`` a digest of
+    all values of the config (as a hex string), which is the same for configs
+    with the same values.
+    """
+
+    config: Config
+    published_at: float
+    fingerprint: str
+
+
+class ConfigHolder(Generic[ConfigT]):
+    """
+    Read-copy-update style holder for config objects shared between threads.
+
+    Readers simply read ``current`` (a single attribute read, no locks) and
+    keep using the config they got for as long as they need a consistent view,
+    e.g. for the duration of a request. Writers fill a new config object and
+    ``publish`` it, which replaces ``current`` with a single reference
+    assignment. Since config objects can't be mutated, configs obtained from
+    ``current`` stay valid (and unchanged) for as long as they're referenced,
+    no matter how many newer configs are published in the meantime. Configs
+    that are no longer referenced are simply garbage collected.
+
+    With ``history``, the holder also keeps the last few published configs
+    (with their publishing times and fingerprints, see ``snapshots``), so
+    that it can ``rollback`` to any of them instantly, without filling
+    anything again. To keep the memory used by the history low, sections
+    with the same values as in the previous snapshot are shared: Such
+    sections of a newly published config are replaced by the (equal)
+    section objects of the previous one.
+
+    :param initial: Filled config object to start with.
+    :param history: Number of previously published configs to keep for
+        ``rollback`` (besides the current one). No history is kept by default.
+    """
+
+    __slots__ = ("current", "_publish_lock", "_history")
+
+    def __init__(self, initial: ConfigT, *, history: int = 0):
+        if history < 0:
+            raise ValueError(
+                f"Invalid history {history} for ConfigHolder, must not be negative."
+            )
+
+        self._publish_lock = Lock()
+        # Snapshots with the fingerprints of each of their sections:
+        self._history: Deque[Tuple[ConfigSnapshot, Tuple[bytes, ...]]] = deque(
+            maxlen=history + 1
+        )
+
+        if history > 0:
+            self._record(initial, previous=None)
+
+        #: The latest published config.
+        self.current: ConfigT = initial
+
+    def _record(self, cfg: ConfigT, previous: Optional[ConfigT]):
+        # Called with '_publish_lock' held (or from '__init__'), before 'cfg'
+        # is published. Replacing its sections is still fine at this point.
+        if (previous is None) or (type(previous) is not type(cfg)):
+            previous_fingerprints = ()
+        else:
+            previous_fingerprints = self._history[-1][1]
+
+        fingerprints = []
+
+        for idx, section_name in enumerate(_get_annotations(cfg)):
+            section = getattr(cfg, section_name)
+
+            if idx < len(previous_fingerprints):
+                previous_section = getattr(previous, section_name)
+
+                if section is previous_section:
+                    # E.g. reused by an incremental reload.
+                    fingerprints.append(previous_fingerprints[idx])
+                    continue
+
+                fingerprint = _section_fingerprint(section)
+
+                if fingerprint == previous_fingerprints[idx]:
+                    setattr(cfg, _internal_name(section_name), previous_section)
+            else:
+                fingerprint = _section_fingerprint(section)
+
+            fingerprints.append(fingerprint)
+
+        snapshot = ConfigSnapshot(cfg, time(), _config_fingerprint(fingerprints))
+        self._history.append((snapshot, tuple(fingerprints)))
+
+    def _set_current(self, cfg: ConfigT):
+        # Called with '_publish_lock' held.
+        if self._history.maxlen > 1:
+            self._record(cfg, previous=self.current)
+
+        self.current = cfg
+
+    @property
+    def snapshots(self) -> Tuple[ConfigSnapshot, ...]:
+        """
+        The configs kept for ``rollback``, from the oldest to the current one
+        (the last). Empty without ``history``.
+        """
+        with self._publish_lock:
+            return tuple(x[0] for x in self._history)
+
+    def publish(self, cfg: ConfigT) -> ConfigT:
+        """
+        Makes ``cfg`` the current config.
+
+        :param cfg: New (filled) config object.
+        :return: The previously current config.
+        """
+        with self._publish_lock:
+            previous = self.current
+            self._set_current(cfg)
+
+        return previous
+
+    def update(self, make_config: Callable[[ConfigT], ConfigT]) -> ConfigT:
+        """
+        Publishes the config returned by ``make_config`` for the current one,
+        with no other writer publishing in between (readers are never
+        blocked). If ``make_config`` raises, nothing is published.
+
+        :param make_config: Function taking the current config and returning
+            the new one.
+        :return: The newly published config.
+        """
+        with self._publish_lock:
+            cfg = make_config(self.current)
+            self._set_current(cfg)
+
+        return cfg
+
+    def rollback(self, to: Union[int, ConfigSnapshot] = 1) -> ConfigT:
+        """
+        Publishes a previous config again (which then becomes the newest
+        snapshot, like any other published config).
+
+        :param to: Either the number of snapshots to go back (1 for the
+            config published before the current one) or one of the
+            ``snapshots``.
+        :return: The newly published (previous) config.
+        """
+        with self._publish_lock:
+            history = self._history
+
+            if isinstance(to, ConfigSnapshot):
+                for snapshot, fingerprints in history:
+                    if snapshot is to:
+                        break
+                else:
+                    raise ValueError(
+                        "Cannot roll back to a snapshot that isn't kept (anymore)."
+                    )
+            elif 0 < to < len(history):
+                snapshot, fingerprints = history[-1 - to]
+            else:
+                raise ValueError(
+                    f"Cannot roll back {to} snapshot(s), only"
+                    f" {max(len(history) - 1, 0)} previous snapshot(s) kept."
+                )
+
+            # Already recorded (and published) before, so nothing to compute
+            # (or replace) here.
+            cfg = snapshot.config
+            history.append((snapshot._replace(published_at=time()), fingerprints))
+            self.current = cfg
+
+        return cfg
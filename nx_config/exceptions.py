@@ -1,3 +1,6 @@
+from typing import NamedTuple, Optional, Sequence
+
+
 class NxConfigError(Exception):
     """
     TODO
@@ -28,3 +31,66 @@ class ParsingError(NxConfigError, ValueError):
     """
 
     __slots__ = ()
+
+
+class ConfigProblem(NamedTuple):
+    """
+    One of the problems listed by an :py:class:`~nx_config.AggregateError`.
+
+    ``section`` and ``entry`` locate the problem (``entry`` is ``None`` for
+    failing validators). ``source`` describes where the offending value came
+    from, e.g. ``"environment variable 'MY_SECTION__MY_ENTRY'"``, ``"YAML input"``
+    or ``"validator 'my_validator'"`` (``None`` for entries that were never set).
+    ``error`` is the exception that filling would have raised without
+    ``collect_errors``.
+    """
+
+    section: str
+    entry: Optional[str]
+    source: Optional[str]
+    error: Exception
+
+
+class AggregateError(NxConfigError):
+    """
+    Raised by :py:func:`~nx_config.fill_config` and
+    :py:func:`~nx_config.fill_config_from_path` with ``collect_errors=True``
+    when filling finds one or more problems. Every problem is listed in the
+    message and available as a :py:class:`~nx_config.ConfigProblem` in
+    ``problems``.
+    """
+
+    __slots__ = ("problems",)
+
+    def __init__(self, problems: Sequence[ConfigProblem]):
+        self.problems = tuple(problems)
+        lines = [f"Found {len(self.problems)} problem(s) while filling config:"]
+
+        for problem in self.problems:
+            location = f"section '{problem.section}'"
+
+            if problem.entry is not None:
+                location += f", entry '{problem.entry}'"
+
+            if problem.source is not None:
+                location += f" ({problem.source})"
+
+            lines.append(
+                f"  - {location}: {type(problem.error).__name__}: {problem.error}"
+            )
+
+        super().__init__("\n".join(lines))
+
+    def __reduce__(self):
+        return type(self), (self.problems,)
+
+
+class UnmatchedEnvVarWarning(UserWarning):
+    """
+    Issued when filling a config finds environment variables whose names start
+    like those of the config's entries (i.e. with the ``env_prefix`` or, without
+    a prefix, with the name of one of the sections) but don't match any entry.
+    This usually indicates a typo in the variable's name.
+    """
+
+    __slots__ = ()
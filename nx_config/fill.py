@@ -6,11 +6,19 @@ from typing import Optional, TextIO, Union
 from nx_config._core.fill_with_oracles import (
     fill_config_w_oracles as _fill_config_w_oracles,
 )
+
+# noinspection PyProtectedMember
+from nx_config._core.cached_fill_with_oracles import (
+    fill_config_from_cached_path_w_oracles as _fill_config_from_cached_path_w_oracles,
+)
+
+# noinspection PyProtectedMember
+from nx_config._core.path_format import format_from_path as _format_from_path
 from nx_config.config import Config
 from nx_config.format import Format
-
-_supported_yaml_extensions = (".yaml", ".yml", ".YAML", ".YML")
-_supported_ini_extensions = (".ini", ".INI")
+from nx_config.instrumentation import FillObserver
+from nx_config.parsed_file_cache import ParsedFileCache
+from nx_config.yaml_loader import YAMLLoader
 
 
 def fill_config(
@@ -19,6 +27,10 @@ def fill_config(
     stream: Optional[TextIO] = None,
     fmt: Optional[Format] = None,
     env_prefix: Optional[str] = None,
+    yaml_loader: Optional[YAMLLoader] = None,
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+    validation_workers: Optional[int] = None,
 ):
     """
     TODO: incl.: Document that env takes precedence over config files and that if an env var is present,
@@ -45,6 +57,26 @@ def fill_config(
     :param stream:
     :param fmt:
     :param env_prefix:
+    :param yaml_loader: Forces a specific YAML parser (see :py:class:`~nx_config.YAMLLoader`).
+        By default, the fast ``libyaml`` loader is used if available.
+    :param collect_errors: If ``True``, every section is filled, checked for
+        completeness and validated even after a problem is found, and a single
+        :py:class:`~nx_config.AggregateError` listing all problems is raised at
+        the end. Validators of a section only run if all its entries were
+        filled successfully. Syntax errors in the input stream are still raised
+        directly.
+    :param observer: Optional :py:class:`~nx_config.FillObserver` receiving
+        timings for each phase (and section) of the fill.
+    :param validation_workers: If given, the validators of different sections
+        run concurrently on a pool of (at most) this many threads, started as
+        soon as each section is filled. Useful for validators that wait for
+        I/O (e.g. checking paths on network storage). Validators of the same
+        section still run one after another, and errors are reported exactly
+        as without concurrency (the first one in section order, or all of them
+        in section order with ``collect_errors``). Validators of different
+        sections must therefore be safe to run at the same time. With an
+        ``observer``, ``validate_section`` events are reported in section
+        order once all sections are filled.
     """
     # WARNING: This function is difficult to test because testing would involve
     #   setting lots of environment variables (which remain set from test to test),
@@ -57,7 +89,15 @@ def fill_config(
     #   necessary changes directly to fill_config_w_oracles instead of here.
     #     Thanks!
     return _fill_config_w_oracles(
-        cfg, in_stream=stream, fmt=fmt, env_prefix=env_prefix, env_map=environ
+        cfg,
+        in_stream=stream,
+        fmt=fmt,
+        env_prefix=env_prefix,
+        env_map=environ,
+        yaml_loader=yaml_loader,
+        collect_errors=collect_errors,
+        observer=observer,
+        validation_workers=validation_workers,
     )
 
 
@@ -66,6 +106,11 @@ def fill_config_from_path(
     *,
     path: Optional[Union[str, PathLike]] = None,
     env_prefix: Optional[str] = None,
+    yaml_loader: Optional[YAMLLoader] = None,
+    cache: Optional[ParsedFileCache] = None,
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+    validation_workers: Optional[int] = None,
 ):
     """
     TODO: incl.: Refer to docs from fill_config
@@ -73,6 +118,14 @@ def fill_config_from_path(
     :param cfg:
     :param path:
     :param env_prefix:
+    :param yaml_loader: See :py:func:`~nx_config.fill_config`.
+    :param cache: Optional :py:class:`~nx_config.ParsedFileCache` to reuse parsed
+        documents across calls (as long as the file doesn't change). Cached
+        documents are shared, so the same cache can be used with any number
+        of config objects.
+    :param collect_errors: See :py:func:`~nx_config.fill_config`.
+    :param observer: See :py:func:`~nx_config.fill_config`.
+    :param validation_workers: See :py:func:`~nx_config.fill_config`.
     """
     # WARNING: This function is difficult to test because testing would involve
     #   setting lots of environment variables (which remain set from test to test),
@@ -85,26 +138,42 @@ def fill_config_from_path(
     #   any necessary changes directly to fill_config_w_oracles instead of here.
     #     Thanks!
     if path is None:
-        return fill_config(cfg, env_prefix=env_prefix)
+        return fill_config(
+            cfg,
+            env_prefix=env_prefix,
+            yaml_loader=yaml_loader,
+            collect_errors=collect_errors,
+            observer=observer,
+            validation_workers=validation_workers,
+        )
 
     if not isinstance(path, Path):
         path = Path(path)
 
-    if path.is_dir():
-        raise IsADirectoryError(f"Is a directory: '{path}'")
+    fmt = _format_from_path(path)
 
-    dot_ext = path.suffix
-
-    if dot_ext in _supported_yaml_extensions:
-        fmt = Format.yaml
-    elif dot_ext in _supported_ini_extensions:
-        fmt = Format.ini
-    else:
-        raise ValueError(
-            f"Configuration filepath '{path}' has unsupported extension. This version of PyConfig supports"
-            f" the formats YAML (extensions: {', '.join(_supported_yaml_extensions)}) and INI (extensions:"
-            f" {', '.join(_supported_ini_extensions)})."
+    if cache is not None:
+        return _fill_config_from_cached_path_w_oracles(
+            cfg,
+            path=path,
+            fmt=fmt,
+            env_prefix=env_prefix,
+            env_map=environ,
+            yaml_loader=yaml_loader,
+            cache=cache,
+            collect_errors=collect_errors,
+            observer=observer,
+            validation_workers=validation_workers,
         )
 
     with path.open() as fstream:
-        return fill_config(cfg, stream=fstream, fmt=fmt, env_prefix=env_prefix)
+        return fill_config(
+            cfg,
+            stream=fstream,
+            fmt=fmt,
+            env_prefix=env_prefix,
+            yaml_loader=yaml_loader,
+            collect_errors=collect_errors,
+            observer=observer,
+            validation_workers=validation_workers,
+        )
@@ -0,0 +1,73 @@
+from enum import Enum, auto
+from typing import NamedTuple, Optional
+
+
+class FillPhase(Enum):
+    """
+    Phases of filling a config, as reported to a
+    :py:class:`~nx_config.FillObserver` in :py:class:`~nx_config.FillEvent`
+    objects.
+
+    * ``parse``: Parsing the input stream (or getting it from a
+      :py:class:`~nx_config.ParsedFileCache`).
+    * ``env``: Reading the relevant environment variables.
+    * ``fill_section``: Converting and setting all entries of one section.
+    * ``fill_entry``: Converting and setting one entry (only reported for
+      entries taking at least ``FillObserver.entry_threshold_ns``). Already
+      included in the corresponding ``fill_section`` event.
+    * ``check_section``: Checking that all entries of one section are set.
+    * ``validate_section``: Running the validators of one section.
+    * ``total``: The whole fill, from start to end.
+    """
+
+    parse = auto()
+    env = auto()
+    fill_section = auto()
+    fill_entry = auto()
+    check_section = auto()
+    validate_section = auto()
+    total = auto()
+
+
+class FillEvent(NamedTuple):
+    """
+    Timing of one phase of filling a config. ``section`` is ``None`` for the
+    phases that aren't specific to a section, ``entry`` is ``None`` for all
+    phases except ``FillPhase.fill_entry``. ``duration_ns`` is measured with
+    ``time.perf_counter_ns`` (or with ``time.perf_counter`` in python 3.6).
+    """
+
+    phase: FillPhase
+    section: Optional[str]
+    entry: Optional[str]
+    duration_ns: int
+
+
+class FillObserver:
+    """
+    Receives timing events from :py:func:`~nx_config.fill_config` and
+    :py:func:`~nx_config.fill_config_from_path` (``observer`` parameter).
+    Subclass it and override ``on_event``, e.g. to log slow phases or to
+    export metrics. No event is reported for a phase interrupted by an
+    exception.
+
+    Without an observer, filling isn't timed at all.
+
+    :param entry_threshold_ns: Minimum duration (in nanoseconds) for an entry
+        to be reported with a ``FillPhase.fill_entry`` event. Use 0 to report
+        all entries.
+    """
+
+    __slots__ = ("entry_threshold_ns",)
+
+    def __init__(self, entry_threshold_ns: int = 10_000):
+        self.entry_threshold_ns = entry_threshold_ns
+
+    def on_event(self, event: FillEvent):
+        """
+        Called once for each event, in the order in which phases complete.
+        Does nothing by default.
+
+        :param event: Timing of the phase that just completed.
+        """
+        pass
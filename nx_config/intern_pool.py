@@ -0,0 +1,139 @@
+from collections import OrderedDict
+from sys import getsizeof
+from threading import Lock
+from typing import Any, Callable
+
+# noinspection PyProtectedMember
+from nx_config._core.value_keys import value_key as _value_key
+
+
+def _estimated_size(value: Any) -> int:
+    if isinstance(value, (tuple, frozenset)):
+        return getsizeof(value) + sum(map(getsizeof, value))
+    else:
+        return getsizeof(value)
+
+
+class InternPool:
+    """
+    A bounded, thread-safe LRU pool of config entry values, meant to be shared
+    by sections of many config objects filled from mostly equal inputs (e.g.
+    one config per tenant), so that equal values (strings, paths, datetimes,
+    tuples...) are stored only once instead of once per config object.
+
+    Pass the pool to the section classes whose values should be interned, with
+    ``class MySection(ConfigSection, intern_pool=pool)`` (subclasses use the
+    same pool). Whenever an entry of such a section is filled (and when such a
+    section is unpickled, e.g. with :py:func:`~nx_config.fill_configs`), the
+    converted value is replaced by an equal value from the pool if there is
+    one, and added to the pool otherwise. Only interchangeable values are
+    shared, i.e. values of the same type with the same ``repr`` (so e.g.
+    ``0.0`` and ``-0.0`` aren't). ``None`` and booleans aren't interned.
+    Default values aren't interned either (they're shared by all instances
+    anyway). Compact sections (``compact=True``) also intern the tuple holding
+    all their values, so that sections with equal values share it.
+
+    :param maxsize: Maximum number of values kept in the pool (at least 1).
+        When full, the least recently used value is dropped (configs still
+        using it are unaffected).
+    """
+
+    __slots__ = ("_maxsize", "_values", "_lock", "_hits", "_misses", "_bytes_saved")
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError(
+                f"Invalid maxsize {maxsize} for InternPool, must be at least 1."
+            )
+
+        self._maxsize = maxsize
+        self._values = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bytes_saved = 0
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Maximum number of values kept in the pool.
+        """
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of values replaced by an equal value from the pool since
+        creation (or since the last call to ``clear``).
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of values added to the pool since creation (or since the last
+        call to ``clear``).
+        """
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of interned values found in the pool (0.0 before any value
+        was interned).
+        """
+        total = self._hits + self._misses
+        return 0.0 if total == 0 else self._hits / total
+
+    @property
+    def bytes_saved(self) -> int:
+        """
+        Estimated number of bytes saved by hits (as reported by
+        ``sys.getsizeof`` for each replaced value, plus its elements for
+        tuples and frozensets) since creation (or since the last call to
+        ``clear``).
+        """
+        return self._bytes_saved
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def clear(self):
+        """
+        Drops all values and resets the ``hits``, ``misses`` and
+        ``bytes_saved`` counters.
+        """
+        with self._lock:
+            self._values.clear()
+            self._hits = 0
+            self._misses = 0
+            self._bytes_saved = 0
+
+    def _intern(self, value: Any) -> Any:
+        if (value is None) or (type(value) is bool):
+            return value
+
+        key = _value_key(value)
+
+        with self._lock:
+            pooled = self._values.get(key)
+
+            if pooled is not None:
+                self._values.move_to_end(key)
+                self._hits += 1
+                self._bytes_saved += _estimated_size(value)
+                return pooled
+
+            self._misses += 1
+            self._values[key] = value
+
+            if len(self._values) > self._maxsize:
+                self._values.popitem(last=False)
+
+        return value
+
+    def _interning(self, convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        def convert_and_intern(raw_value: Any) -> Any:
+            return self._intern(convert(raw_value))
+
+        return convert_and_intern
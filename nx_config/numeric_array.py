@@ -0,0 +1,130 @@
+from array import array
+from sys import byteorder
+from typing import Any, Iterable, Iterator, Type, Union
+
+
+def _read_only_view(values: array) -> memoryview:
+    # A view on immutable 'bytes' is read-only ('memoryview.toreadonly' needs
+    # python 3.8+).
+    return memoryview(values.tobytes()).cast(values.typecode)
+
+
+def _from_bytes(
+    array_t: Type["NumericArray"], data: bytes, data_byteorder: str
+) -> "NumericArray":
+    # Unpickles arrays (pickled as raw bytes, see 'NumericArray.__reduce__').
+    values = array(array_t.typecode)
+    values.frombytes(data)
+
+    if data_byteorder != byteorder:
+        values.byteswap()
+
+    # noinspection PyProtectedMember
+    return array_t._from_array(values)
+
+
+class NumericArray:
+    """
+    Base class of :py:class:`~nx_config.IntArray` and
+    :py:class:`~nx_config.FloatArray`.
+    """
+
+    __slots__ = ("_view", "_hash")
+    typecode = ""
+
+    def __init__(self, values: Iterable = ()):
+        self._view = _read_only_view(array(self.typecode, values))
+        self._hash = None
+
+    @classmethod
+    def _from_array(cls, values: array) -> "NumericArray":
+        obj = cls.__new__(cls)
+        obj._view = _read_only_view(values)
+        obj._hash = None
+        return obj
+
+    @property
+    def view(self) -> memoryview:
+        """
+        Read-only ``memoryview`` on the elements, for handing them over
+        without copying (e.g. ``numpy.frombuffer(cfg.my_section.my_entry.view,
+        dtype=numpy.int64)``).
+        """
+        return self._view
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._view)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return self._from_array(array(self.typecode, self._view[index]))
+
+        return self._view[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self._view == other._view
+
+    def __hash__(self) -> int:
+        # Cached, because hashing boxes all elements.
+        if self._hash is None:
+            self._hash = hash((type(self), tuple(self._view)))
+
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._view.tolist()})"
+
+    def __reduce__(self) -> Any:
+        return _from_bytes, (type(self), self._view.obj, byteorder)
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self)
+            + self._view.__sizeof__()
+            + self._view.obj.__sizeof__()
+        )
+
+    def tolist(self) -> list:
+        """
+        Returns the elements as a list.
+        """
+        return self._view.tolist()
+
+
+class IntArray(NumericArray):
+    """
+    Read-only array of 64-bit signed integers, for config entries holding many
+    numbers, e.g. ``my_ids: IntArray = IntArray()``. Unlike
+    ``Tuple[int, ...]``, it stores its elements unboxed, in 8 bytes each, and
+    is converted from config files and environment variables in one bulk
+    operation (from a comma separated string, e.g. ``"1, 2, 3"``, or a YAML
+    list).
+
+    It behaves like a read-only sequence (``len``, indexing, iteration, ``==``,
+    hashing, pickling) and hands its elements over without copying through
+    :py:attr:`view`.
+
+    :param values: Integers in the range of 64-bit signed integers.
+    """
+
+    __slots__ = ()
+    typecode = "q"
+
+
+class FloatArray(NumericArray):
+    """
+    Read-only array of 64-bit floats, for config entries holding many numbers,
+    e.g. ``my_weights: FloatArray = FloatArray()``. See
+    :py:class:`~nx_config.IntArray`.
+
+    :param values: Floats (or integers).
+    """
+
+    __slots__ = ()
+    typecode = "d"
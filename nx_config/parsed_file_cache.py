@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, Tuple
+
+
+class ParsedFileCache:
+    """
+    A bounded, thread-safe LRU cache of parsed configuration files, meant to be
+    passed to :py:func:`~nx_config.fill_config_from_path` (``cache`` parameter)
+    when the same files are used to fill many config objects.
+
+    Cached documents are validated on every use with ``os.stat`` (device,
+    inode, modification time in nanoseconds and size), so a file that changed
+    is parsed again. A "warm" fill only needs to apply environment variables,
+    convert values and run validators.
+
+    :param maxsize: Maximum number of parsed documents kept in the cache (at
+        least 1). When full, the least recently used document is dropped.
+    """
+
+    __slots__ = ("_maxsize", "_documents", "_lock", "_hits", "_misses")
+
+    def __init__(self, maxsize: int = 16):
+        if maxsize < 1:
+            raise ValueError(
+                f"Invalid maxsize {maxsize} for ParsedFileCache, must be at least 1."
+            )
+
+        self._maxsize = maxsize
+        self._documents = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Maximum number of parsed documents kept in the cache.
+        """
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of fills that used a cached document since creation (or since
+        the last call to ``clear``).
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of fills that had to parse a file since creation (or since the
+        last call to ``clear``).
+        """
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def clear(self):
+        """
+        Drops all cached documents and resets the ``hits`` and ``misses``
+        counters.
+        """
+        with self._lock:
+            self._documents.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _get(self, key: Hashable, stat_key: Tuple, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            cached = self._documents.get(key)
+
+            if (cached is not None) and (cached[0] == stat_key):
+                self._documents.move_to_end(key)
+                self._hits += 1
+                return cached[1]
+
+            self._misses += 1
+
+        # Parsing happens outside the lock. Two threads missing on the same file
+        # at the same time will both parse it, which is harmless.
+        document = load()
+
+        with self._lock:
+            self._documents[key] = (stat_key, document)
+            self._documents.move_to_end(key)
+
+            while len(self._documents) > self._maxsize:
+                self._documents.popitem(last=False)
+
+        return document
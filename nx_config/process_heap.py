@@ -0,0 +1,62 @@
+import gc
+import os
+
+# Whether forked children should enable the garbage collector, as of the last
+# call to 'freeze_process_heap'. The hook doing it is registered at most once.
+_enable_gc_in_children = False
+_at_fork_registered = False
+
+
+def _after_fork_in_child():
+    if _enable_gc_in_children:
+        gc.enable()
+
+
+def freeze_process_heap():
+    """
+    Freezes the whole heap of the current process (all config objects
+    included) for being shared with forked worker processes (e.g. by pre-fork
+    servers such as gunicorn), to be called in the parent process after
+    filling the configs, right before forking.
+
+    Forked processes share the parent's memory pages until they write to
+    them. Besides actual modifications (impossible for config objects), the
+    garbage collector writes to every object it traverses, so each worker
+    would soon end up with its own copy of all pages holding config objects.
+    This function moves all objects tracked by the garbage collector in the
+    process, not only configs, to a permanent generation that is never
+    traversed, with ``gc.freeze`` (Python 3.7 and later, does nothing on
+    earlier versions).
+
+    This follows the sequence recommended for ``gc.freeze``:
+
+    1. Call ``gc.disable()`` early in the parent process (e.g. before
+       filling the config), so that collections don't leave freed holes in
+       pages that would then be filled (i.e. written to) after forking.
+    2. Call ``freeze_process_heap`` right before forking. No collection is
+       run.
+    3. Enable the garbage collector early in the children. If the garbage
+       collector is disabled when calling ``freeze_process_heap``, this is
+       done automatically for all processes forked afterwards (where
+       ``os.register_at_fork`` is available, i.e. on POSIX systems), until
+       it's called again with the garbage collector enabled. The parent's
+       garbage collector is left as it is.
+
+    Reading entries still updates the reference counts of the objects read,
+    which can't be avoided in CPython.
+    """
+    global _enable_gc_in_children, _at_fork_registered
+
+    freeze = getattr(gc, "freeze", None)
+
+    if freeze is None:
+        return
+
+    register_at_fork = getattr(os, "register_at_fork", None)
+    _enable_gc_in_children = (not gc.isenabled()) and (register_at_fork is not None)
+
+    if _enable_gc_in_children and (not _at_fork_registered):
+        register_at_fork(after_in_child=_after_fork_in_child)
+        _at_fork_registered = True
+
+    freeze()
@@ -0,0 +1,439 @@
+from logging import getLogger
+from os import PathLike, environ
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Any, Callable, NamedTuple, Optional, Tuple, Type, Union
+
+# noinspection PyProtectedMember
+from nx_config._core.file_stat import (
+    FileStatKey as _FileStatKey,
+    file_stat_key as _file_stat_key,
+)
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import (
+    refill_config_w_oracles as _refill_config_w_oracles,
+)
+
+# noinspection PyProtectedMember
+from nx_config._core.iteration_utils import get_annotations as _get_annotations
+
+# noinspection PyProtectedMember
+from nx_config._core.path_format import format_from_path as _format_from_path
+from nx_config.config_holder import ConfigHolder, ConfigSnapshot, ConfigT
+from nx_config.fill import fill_config_from_path
+from nx_config.yaml_loader import YAMLLoader
+
+
+class _Subscription(NamedTuple):
+    section: str
+    entry: Optional[str]
+    callback: Callable[[Any, Any], None]
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    # Stricter than '==', e.g. 'True' replacing '1' is a change.
+    return (a is b) or ((type(a) is type(b)) and (a == b))
+
+
+def _same_section(a: Any, b: Any) -> bool:
+    return (a is b) or all(
+        _same_value(getattr(a, x), getattr(b, x)) for x in _get_annotations(a)
+    )
+
+
+class ReloadableConfig(ConfigHolder[ConfigT]):
+    """
+    Handle to a config object that is filled from a file and reloaded when the
+    file changes (including changes through atomic renames, as done by most
+    deployment tools).
+
+    Each reload fills a brand-new instance of ``config_t`` (exactly like
+    :py:func:`~nx_config.fill_config_from_path`, including environment
+    variables and validators). Only if that succeeds is the new config
+    published in ``current``, with a single reference assignment. If it fails
+    the previous config stays in place and the error is passed to
+    ``on_error``. So readers always get a complete and validated config, just
+    by reading ``current`` (no locks involved, see
+    :py:class:`~nx_config.ConfigHolder`).
+
+    Changes are detected by polling the file's ``os.stat`` (device, inode,
+    modification time and size) from a background thread, see ``start``.
+    Reloads can also be triggered manually with ``check`` and ``reload``.
+
+    With ``incremental=True``, each reload compares the raw inputs of every
+    section (its values in the file and its environment variables) with those
+    of the current config. Only sections whose inputs changed are converted,
+    checked and validated again. The new config reuses the (immutable) section
+    objects of the current one for all other sections. The names of the
+    sections that changed are available in ``changed_sections``. This assumes
+    that validators only depend on their section's values.
+
+    Components can ``subscribe`` to changes of a section or of a single entry,
+    e.g. to rebuild objects derived from it only when needed. Since editors
+    often save a file with several writes, the background thread can wait
+    for the file to settle (``debounce``) so that such bursts cause a single
+    reload (and a single notification).
+
+    The initial config is filled by the constructor, which raises if that
+    fails.
+
+    :param config_t: Subclass of :py:class:`~nx_config.Config` to fill.
+    :param path: Path of the config file.
+    :param env_prefix: See :py:func:`~nx_config.fill_config`.
+    :param yaml_loader: See :py:func:`~nx_config.fill_config`.
+    :param poll_interval: Seconds between checks of the watched file.
+    :param on_reload: Optional callback receiving each newly published config.
+    :param on_error: Optional callback receiving the exception of each failed
+        reload (including failures to access the file) and of each failed
+        ``on_reload`` or subscriber callback. Exceptions raised by
+        ``on_error`` itself are logged (with the ``logging`` module) and
+        otherwise ignored, so that failing callbacks never stop the
+        background thread.
+    :param incremental: Whether to only refill sections whose inputs changed
+        (see above).
+    :param history: See :py:class:`~nx_config.ConfigHolder`. A rollback
+        doesn't stop later changes of the file from being loaded.
+    :param debounce: Seconds the file must stay unchanged before the
+        background thread reloads it (0 to reload as soon as a change is
+        seen). Doesn't affect ``check`` and ``reload``.
+    """
+
+    __slots__ = (
+        "_config_t",
+        "_path",
+        "_env_prefix",
+        "_yaml_loader",
+        "_poll_interval",
+        "_on_reload",
+        "_on_error",
+        "_incremental",
+        "_debounce",
+        "_subscriptions",
+        "_subscribe_lock",
+        "_inputs",
+        "_changed_sections",
+        "_stat_key",
+        "_reload_lock",
+        "_stop_event",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        config_t: Type[ConfigT],
+        *,
+        path: Union[str, PathLike],
+        env_prefix: Optional[str] = None,
+        yaml_loader: Optional[YAMLLoader] = None,
+        poll_interval: float = 1.0,
+        on_reload: Optional[Callable[[ConfigT], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        incremental: bool = False,
+        history: int = 0,
+        debounce: float = 0.0,
+    ):
+        if poll_interval <= 0:
+            raise ValueError(
+                f"Invalid poll_interval {poll_interval} for ReloadableConfig, must be positive."
+            )
+
+        if debounce < 0:
+            raise ValueError(
+                f"Invalid debounce {debounce} for ReloadableConfig, must not be negative."
+            )
+
+        self._config_t = config_t
+        self._path = Path(path)
+        self._env_prefix = env_prefix
+        self._yaml_loader = yaml_loader
+        self._poll_interval = poll_interval
+        self._on_reload = on_reload
+        self._on_error = on_error
+        self._incremental = incremental
+        self._debounce = debounce
+        # Replaced (never mutated) under '_subscribe_lock', so that reloads
+        # can iterate over it without locking.
+        self._subscriptions: Tuple[_Subscription, ...] = ()
+        self._subscribe_lock = Lock()
+        # The config filled by the last (incremental) fill, with its inputs:
+        self._inputs = None
+        self._changed_sections = ()
+        self._reload_lock = Lock()
+        self._stop_event = Event()
+        self._thread = None
+
+        self._stat_key = _file_stat_key(self._path)
+        super().__init__(self._fill(), history=history)
+
+    @property
+    def path(self) -> Path:
+        """
+        Path of the watched config file.
+        """
+        return self._path
+
+    @property
+    def changed_sections(self) -> Tuple[str, ...]:
+        """
+        Names of the sections whose inputs changed in the last successful
+        reload (or all sections after the initial fill). Only available with
+        ``incremental=True``, otherwise always empty.
+        """
+        return self._changed_sections
+
+    def subscribe(
+        self,
+        section: str,
+        callback: Callable[[Any, Any], None],
+        *,
+        entry: Optional[str] = None,
+    ) -> Callable[[], None]:
+        """
+        Registers ``callback`` to be called with the old and the new value
+        of a section (or of one of its entries) whenever a reload (or
+        ``rollback``) publishes a config in which it changed. Values count as
+        changed if they differ in value or in type, sections if any of their
+        entries changed. Callbacks run in the thread doing the reload (or
+        rollback), after the new config is published, in subscription order.
+        Configs published directly through ``publish`` or ``update`` aren't
+        compared.
+
+        :param section: Name of the section.
+        :param callback: Function taking the old and the new section object
+            (or entry value).
+        :param entry: Name of an entry in the section, to only be notified
+            about changes of that entry.
+        :return: Function that cancels the subscription when called.
+        """
+        section_t = _get_annotations(self._config_t).get(section)
+
+        if section_t is None:
+            raise ValueError(
+                f"Cannot subscribe to unknown section '{section}' of"
+                f" {self._config_t.__name__}."
+            )
+
+        if (entry is not None) and (entry not in _get_annotations(section_t)):
+            raise ValueError(
+                f"Cannot subscribe to unknown entry '{entry}' of section"
+                f" '{section}' of {self._config_t.__name__}."
+            )
+
+        subscription = _Subscription(section, entry, callback)
+
+        with self._subscribe_lock:
+            self._subscriptions += (subscription,)
+
+        def unsubscribe():
+            with self._subscribe_lock:
+                self._subscriptions = tuple(
+                    x for x in self._subscriptions if x is not subscription
+                )
+
+        return unsubscribe
+
+    def _notify(self, previous: ConfigT, cfg: ConfigT):
+        for section_name, entry_name, callback in self._subscriptions:
+            old = getattr(previous, section_name)
+            new = getattr(cfg, section_name)
+
+            if entry_name is None:
+                if _same_section(old, new):
+                    continue
+            else:
+                old = getattr(old, entry_name)
+                new = getattr(new, entry_name)
+
+                if _same_value(old, new):
+                    continue
+
+            try:
+                callback(old, new)
+            except Exception as xcp:
+                self._report_error(xcp)
+
+    def _fill(self) -> ConfigT:
+        cfg = self._config_t()
+
+        if self._incremental:
+            previous_cfg = getattr(self, "current", None)
+
+            # Sections are only reused from the config the inputs were taken
+            # for, not e.g. from a config published through 'publish' since.
+            if (self._inputs is not None) and (self._inputs[0] is previous_cfg):
+                previous_inputs = self._inputs[1]
+            else:
+                previous_inputs = None
+
+            with self._path.open() as fstream:
+                inputs, changed_sections = _refill_config_w_oracles(
+                    cfg,
+                    in_stream=fstream,
+                    fmt=_format_from_path(self._path),
+                    env_prefix=self._env_prefix,
+                    env_map=environ,
+                    yaml_loader=self._yaml_loader,
+                    previous_cfg=previous_cfg,
+                    previous_inputs=previous_inputs,
+                )
+
+            self._inputs = (cfg, inputs)
+            self._changed_sections = changed_sections
+            return cfg
+
+        fill_config_from_path(
+            cfg,
+            path=self._path,
+            env_prefix=self._env_prefix,
+            yaml_loader=self._yaml_loader,
+        )
+        return cfg
+
+    def _report_error(self, xcp: Exception):
+        if self._on_error is None:
+            return
+
+        try:
+            self._on_error(xcp)
+        except Exception:
+            # Nowhere else to report it to, but it mustn't stop the watching
+            # thread either.
+            getLogger(__name__).exception(
+                f"Error callback of ReloadableConfig for '{self._path}' failed."
+            )
+
+    def _reload(self) -> bool:
+        # Called with '_reload_lock' held. The file is stat-ed before reading
+        # it, so a change during the reload triggers another one later.
+        try:
+            self._stat_key = _file_stat_key(self._path)
+            cfg = self._fill()
+        except Exception as xcp:
+            self._report_error(xcp)
+            return False
+
+        previous = self.publish(cfg)
+
+        if self._subscriptions:
+            self._notify(previous, cfg)
+
+        if self._on_reload is not None:
+            try:
+                self._on_reload(cfg)
+            except Exception as xcp:
+                self._report_error(xcp)
+
+        return True
+
+    def rollback(self, to: Union[int, ConfigSnapshot] = 1) -> ConfigT:
+        """
+        See :py:meth:`~nx_config.ConfigHolder.rollback`. Subscribers are
+        notified of the changes like after a reload. With
+        ``incremental=True``, the next reload fills all sections again.
+        """
+        with self._reload_lock:
+            previous = self.current
+            cfg = super().rollback(to)
+            self._changed_sections = ()
+
+            if self._subscriptions:
+                self._notify(previous, cfg)
+
+        return cfg
+
+    def reload(self) -> bool:
+        """
+        Reloads the config file now, whether it changed or not.
+
+        :return: ``True`` if a new config was published, ``False`` if the
+            reload failed (and the previous config was kept).
+        """
+        with self._reload_lock:
+            return self._reload()
+
+    def check(self) -> bool:
+        """
+        Reloads the config file if it changed since the last reload (attempt).
+        This is what the background thread does periodically.
+
+        :return: ``True`` if a new config was published, ``False`` otherwise.
+        """
+        with self._reload_lock:
+            try:
+                stat_key = _file_stat_key(self._path)
+            except OSError as xcp:
+                # E.g. the file is missing, only reported once until it's back.
+                if self._stat_key is not None:
+                    self._stat_key = None
+                    self._report_error(xcp)
+                return False
+
+            if stat_key == self._stat_key:
+                return False
+
+            return self._reload()
+
+    def _try_stat(self) -> Optional[_FileStatKey]:
+        try:
+            return _file_stat_key(self._path)
+        except OSError:
+            return None
+
+    def _wait_until_settled(self) -> bool:
+        # Returns 'False' if stopped while waiting. A change seen here is left
+        # for 'check' to detect (and report) again.
+        stat_key = self._try_stat()
+
+        if stat_key == self._stat_key:
+            return True
+
+        while not self._stop_event.wait(self._debounce):
+            new_stat_key = self._try_stat()
+
+            if new_stat_key == stat_key:
+                return True
+
+            stat_key = new_stat_key
+
+        return False
+
+    def _watch(self):
+        while not self._stop_event.wait(self._poll_interval):
+            if (self._debounce == 0) or self._wait_until_settled():
+                self.check()
+
+    def start(self):
+        """
+        Starts watching the config file from a background (daemon) thread.
+        Does nothing if already started.
+        """
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = Thread(
+            target=self._watch,
+            name=f"nx_config watcher for '{self._path}'",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops watching the config file (waiting for the background thread to
+        finish). Does nothing if not started.
+        """
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "ReloadableConfig[ConfigT]":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -23,10 +23,10 @@ from nx_config._core.entry_to_text import (
 from nx_config._core.iteration_utils import get_annotations as _get_annotations
 
 # noinspection PyProtectedMember
-from nx_config._core.naming_utils import (
-    internal_name as _internal_name,
-    indentation_spaces as _indentation_spaces,
-)
+from nx_config._core.naming_utils import indentation_spaces as _indentation_spaces
+
+# noinspection PyProtectedMember
+from nx_config._core.pickling import restore_section as _restore_section
 
 # noinspection PyProtectedMember
 from nx_config._core.section_meta import SectionMeta as _Meta
@@ -40,9 +40,9 @@ class ConfigSection(_SectionMappingBase, metaclass=_Meta):
     _nx_config_internal__root = True
 
     def __init__(self):
-        for entry_name in _get_annotations(self):
-            entry = getattr(type(self), entry_name)
-            setattr(self, _internal_name(entry_name), entry.default)
+        # Subclasses declaring entries get a generated '__init__' instead,
+        # see 'SectionMeta'.
+        pass
 
     def __str__(self):
         entries = (
@@ -68,3 +68,7 @@ class ConfigSection(_SectionMappingBase, metaclass=_Meta):
 
     def __getitem__(self, k: str) -> Any:
         return getattr(self, k)
+
+    def __reduce__(self):
+        values = tuple(getattr(self, x) for x in _get_annotations(self))
+        return _restore_section, (type(self), values)
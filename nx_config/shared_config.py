@@ -0,0 +1,330 @@
+import os
+from threading import Lock
+from time import perf_counter, sleep
+from typing import Any, Generic, Optional, Type
+
+from nx_config.config_holder import ConfigT
+
+# Layout of a shared memory segment holding a config:
+#   [version: u64][payload length: u64][payload (see '_core.shared_payload')]
+# The version is odd while the payload is being (re)written, so readers retry
+# until they read the same even version before and after copying the payload
+# (a "sequence lock", which never blocks the writer). Readers retrying this
+# many times in a row start sleeping between retries (and eventually give up,
+# e.g. if the writer died while writing):
+_header_size = 16
+_spinning_retries = 100
+_retry_sleep = 0.001
+
+
+def _read_u64(buf: memoryview, offset: int) -> int:
+    return int.from_bytes(buf[offset : offset + 8], "little")
+
+
+def _write_header(buf: memoryview, version: int, length: int):
+    buf[:_header_size] = version.to_bytes(8, "little") + length.to_bytes(8, "little")
+
+
+def _set_tracked(shm: Any, tracked: bool):
+    # The 'multiprocessing' resource tracker unlinks the segments registered
+    # with it once all processes using it are gone. Opening a segment
+    # registers it (on POSIX systems, the only ones with a tracker), so
+    # attached segments are unregistered again, and only the creator's
+    # registration is meant to stay. But processes started with
+    # 'multiprocessing' share their parent's tracker, so attaching from them
+    # can remove that one too, which the creator makes up for before
+    # unlinking (unlinking unregisters as well).
+    if os.name != "posix":  # pragma: no cover
+        return
+
+    from multiprocessing import resource_tracker
+
+    # noinspection PyProtectedMember
+    name = shm._name
+
+    if tracked:
+        resource_tracker.register(name, "shared_memory")
+    else:
+        resource_tracker.unregister(name, "shared_memory")
+
+
+def _shared_memory_t() -> type:
+    # 'multiprocessing' is slow to import, so only SharedConfig users pay for it.
+    try:
+        from multiprocessing.shared_memory import SharedMemory
+    except ImportError as xcp:  # pragma: no cover
+        raise ImportError("SharedConfig requires Python 3.8 or later.") from xcp
+
+    return SharedMemory
+
+
+class SharedConfig(Generic[ConfigT]):
+    """
+    Config object shared between processes through a named
+    ``multiprocessing.shared_memory`` segment, e.g. filled once by a parent
+    process and read by all its worker processes.
+
+    The parent ``create`` s the segment with an initial config and can
+    ``publish`` new configs at any time. Workers ``attach`` to the segment by
+    name (and config class) and read ``current``, which rebuilds the config
+    from the segment only when a new version was published since the last
+    read (checking the version is cheap, so reading ``current`` often is
+    fine). Configs obtained from ``current`` are ordinary (immutable) config
+    objects and stay unchanged when newer versions are published, just like
+    with :py:class:`~nx_config.ConfigHolder`.
+
+    Only values are stored in the segment (not the classes), and readers only
+    accept values of the types config entries can have, so attaching never
+    runs code from the segment. Readers never block the publisher: A read
+    overlapping with a publish is simply retried (sleeping between retries if
+    it takes longer, and raising ``TimeoutError`` after ``read_timeout``
+    seconds, e.g. if the publishing process died while writing).
+
+    The segment has a fixed size, chosen on creation. Call ``close`` in every
+    process when done, and ``unlink`` once in the creating process to free
+    the segment (both done by the context manager, which unlinks if the
+    object created the segment).
+
+    Requires Python 3.8 or later.
+    """
+
+    __slots__ = (
+        "_config_t",
+        "_shm",
+        "_owner",
+        "_read_timeout",
+        "_publish_lock",
+        "_version",
+        "_cached",
+    )
+
+    def __init__(
+        self, config_t: Type[ConfigT], shm: Any, owner: bool, read_timeout: float
+    ):
+        # Use 'create' or 'attach' instead.
+        if read_timeout <= 0:
+            raise ValueError(
+                f"Invalid read_timeout {read_timeout} for SharedConfig, must be positive."
+            )
+
+        self._config_t = config_t
+        self._shm = shm
+        self._owner = owner
+        self._read_timeout = read_timeout
+        self._publish_lock = Lock()
+        self._version = None
+        self._cached = None
+
+    @classmethod
+    def create(
+        cls,
+        cfg: ConfigT,
+        *,
+        name: Optional[str] = None,
+        size: Optional[int] = None,
+        read_timeout: float = 5.0,
+    ) -> "SharedConfig[ConfigT]":
+        """
+        Creates a new shared memory segment and publishes ``cfg`` in it.
+
+        :param cfg: Filled config object to publish first.
+        :param name: Name for the segment (a random name by default, see
+            ``name``).
+        :param size: Size of the segment in bytes, which limits the size of
+            the configs that can be published. By default, four times the size
+            needed for ``cfg`` (but at least 64 KiB).
+        :param read_timeout: Seconds after which reading ``current`` gives up
+            waiting for a publish to finish (and raises ``TimeoutError``).
+        :return: The new :py:class:`~nx_config.SharedConfig`.
+        """
+        # noinspection PyProtectedMember
+        from nx_config._core.shared_payload import dump_config
+
+        payload = dump_config(cfg)
+
+        if size is None:
+            size = max(4 * (_header_size + len(payload)), 65536)
+
+        shm = _shared_memory_t()(name=name, create=True, size=size)
+
+        try:
+            shared = cls(type(cfg), shm, owner=True, read_timeout=read_timeout)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        try:
+            shared._write(payload)
+        except BaseException:
+            shared.close()
+            shared.unlink()
+            raise
+
+        return shared
+
+    @classmethod
+    def attach(
+        cls, config_t: Type[ConfigT], *, name: str, read_timeout: float = 5.0
+    ) -> "SharedConfig[ConfigT]":
+        """
+        Attaches to an existing segment created with ``create`` (usually in
+        another process).
+
+        :param config_t: Subclass of :py:class:`~nx_config.Config` of the
+            shared configs. Must have the same sections and entries as the
+            class used by the creator.
+        :param name: Name of the segment.
+        :param read_timeout: See ``create``.
+        :return: The attached :py:class:`~nx_config.SharedConfig`.
+        """
+        shm = _shared_memory_t()(name=name)
+        _set_tracked(shm, False)
+
+        try:
+            shared = cls(config_t, shm, owner=False, read_timeout=read_timeout)
+        except BaseException:
+            shm.close()
+            raise
+
+        try:
+            # Fails early if the segment holds a different config class.
+            _ = shared.current
+        except BaseException:
+            shared.close()
+            raise
+
+        return shared
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the shared memory segment, to be passed to ``attach``.
+        """
+        return self._shm.name
+
+    @property
+    def version(self) -> int:
+        """
+        Number of configs published so far (counting the initial one). May
+        briefly lag behind while a new config is being published.
+        """
+        return (_read_u64(self._shm.buf, 0) + 1) // 2
+
+    @property
+    def current(self) -> ConfigT:
+        """
+        The latest published config.
+        """
+        buf = self._shm.buf
+        retries = 0
+        deadline = None
+
+        while True:
+            version = _read_u64(buf, 0)
+
+            if version == self._version:
+                return self._cached
+
+            if version % 2 == 0:
+                length = _read_u64(buf, 8)
+                payload = bytes(buf[_header_size : _header_size + length])
+
+                if _read_u64(buf, 0) == version:
+                    break
+
+            retries += 1
+
+            if retries > _spinning_retries:
+                if deadline is None:
+                    deadline = perf_counter() + self._read_timeout
+                elif perf_counter() > deadline:
+                    raise TimeoutError(
+                        f"Gave up reading the config from shared memory segment"
+                        f" '{self.name}' after {self._read_timeout} seconds, a"
+                        f" publish didn't finish (did the publishing process die?)."
+                    )
+
+                sleep(_retry_sleep)
+
+        # noinspection PyProtectedMember
+        from nx_config._core.shared_payload import load_config
+
+        # Safe from races between threads, at worst the config is loaded more
+        # than once.
+        cfg = load_config(self._config_t, payload)
+        self._cached = cfg
+        self._version = version
+        return cfg
+
+    def _write(self, payload: bytes):
+        buf = self._shm.buf
+        available = len(buf) - _header_size
+
+        if len(payload) > available:
+            raise ValueError(
+                f"Config too large for shared memory segment '{self.name}':"
+                f" {len(payload)} bytes needed, {available} available."
+            )
+
+        with self._publish_lock:
+            version = _read_u64(buf, 0)
+            _write_header(buf, version + 1, len(payload))
+            buf[_header_size : _header_size + len(payload)] = payload
+            _write_header(buf, version + 2, len(payload))
+
+    def publish(self, cfg: ConfigT):
+        """
+        Publishes a new config for all attached processes. Only possible
+        through the object that created the segment.
+
+        :param cfg: New (filled) config object, of the same class as the
+            initial one.
+        """
+        if not self._owner:
+            raise RuntimeError(
+                f"Cannot publish to shared memory segment '{self.name}', only the"
+                f" SharedConfig that created it can."
+            )
+
+        if type(cfg) is not self._config_t:
+            raise TypeError(
+                f"Expected a {self._config_t.__name__} object, got {type(cfg).__name__}."
+            )
+
+        # noinspection PyProtectedMember
+        from nx_config._core.shared_payload import dump_config
+
+        self._write(dump_config(cfg))
+
+    def close(self):
+        """
+        Closes this process's access to the segment (doesn't free it).
+        """
+        self._cached = None
+        self._version = None
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Frees the segment once all processes closed it. Call only once, from
+        the creating process (only possible through the object that created
+        the segment).
+        """
+        if not self._owner:
+            raise RuntimeError(
+                f"Cannot unlink shared memory segment '{self.name}', only the"
+                f" SharedConfig that created it can."
+            )
+
+        _set_tracked(self._shm, True)
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedConfig[ConfigT]":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+        if self._owner:
+            self.unlink()
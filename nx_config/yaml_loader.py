@@ -0,0 +1,18 @@
+from enum import Enum, auto
+
+
+class YAMLLoader(Enum):
+    """
+    Selects the implementation used to parse YAML configuration files. By
+    default (i.e. when no loader is specified) PyConfig uses ``libyaml`` if
+    PyYAML was built with it and falls back to the pure python loader
+    otherwise. Both are "safe" loaders, i.e. they only construct simple python
+    objects (no arbitrary code execution).
+
+    * ``libyaml``: Always use ``yaml.CSafeLoader``, raising an ``ImportError``
+      if it's not available.
+    * ``pure_python``: Always use ``yaml.SafeLoader``.
+    """
+
+    libyaml = auto()
+    pure_python = auto()
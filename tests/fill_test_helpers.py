@@ -1,18 +1,51 @@
 from inspect import cleandoc
 from io import StringIO
-from typing import Optional, Mapping
+from typing import List, Optional, Mapping
 
-from nx_config import Config, Format
+from nx_config import Config, FillEvent, FillObserver, Format, YAMLLoader
 
 # noinspection PyProtectedMember
 from nx_config._core.fill_with_oracles import fill_config_w_oracles
 
 
+class NullObserver(FillObserver):
+    __slots__ = ()
+
+    def on_event(self, event: FillEvent):
+        pass
+
+
+class RecordingObserver(FillObserver):
+    __slots__ = ("events",)
+
+    def __init__(self, entry_threshold_ns: int = 0):
+        super().__init__(entry_threshold_ns=entry_threshold_ns)
+        self.events: List[FillEvent] = []
+
+    def on_event(self, event: FillEvent):
+        self.events.append(event)
+
+
 def fill_from_str(
-    cfg: Config, s: str, fmt: Format, env_map: Optional[Mapping[str, str]]
+    cfg: Config,
+    s: Optional[str],
+    fmt: Optional[Format],
+    env_map: Optional[Mapping[str, str]],
+    yaml_loader: Optional[YAMLLoader] = None,
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+    validation_workers: Optional[int] = None,
 ):
     if env_map is None:
         env_map = {}
     fill_config_w_oracles(
-        cfg, in_stream=StringIO(cleandoc(s)), fmt=fmt, env_prefix=None, env_map=env_map
+        cfg,
+        in_stream=None if s is None else StringIO(cleandoc(s)),
+        fmt=fmt,
+        env_prefix=None,
+        env_map=env_map,
+        yaml_loader=yaml_loader,
+        collect_errors=collect_errors,
+        observer=observer,
+        validation_workers=validation_workers,
     )
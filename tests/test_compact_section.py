@@ -0,0 +1,263 @@
+import pickle
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Mapping, Optional, Tuple
+from unittest import TestCase
+
+from nx_config import (
+    AggregateError,
+    Config,
+    ConfigHolder,
+    ConfigSection,
+    FillObserver,
+    Format,
+    IncompleteSectionError,
+    InternPool,
+    validate,
+)
+from nx_config.test_utils import update_section
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+# noinspection PyProtectedMember
+from nx_config._core.naming_utils import internal_name, section_values_attr
+from tests.fill_test_helpers import NullObserver, fill_from_str
+
+_pool = InternPool()
+
+
+class CompactSection(ConfigSection, compact=True, intern_pool=_pool):
+    my_int: int = 42
+    my_str: str = "Hello"
+    my_path: Optional[Path] = None
+    my_tuple: Tuple[int, ...] = (1, 2)
+    my_required: float
+
+    @validate
+    def int_is_positive(self):
+        if self.my_int <= 0:
+            raise ValueError("Not positive.")
+
+
+class SlotsSection(ConfigSection):
+    my_int: int = 42
+    my_str: str = "Hello"
+    my_path: Optional[Path] = None
+    my_tuple: Tuple[int, ...] = (1, 2)
+    my_required: float
+
+
+class CompactConfig(Config):
+    compact: CompactSection
+    slots: SlotsSection
+
+
+class UnpooledSection(ConfigSection, compact=True):
+    my_str: str = ""
+
+
+class UnpooledConfig(Config):
+    sec: UnpooledSection
+
+
+def _values(section: ConfigSection) -> tuple:
+    return getattr(section, section_values_attr)
+
+
+def _fill(
+    s: str,
+    env_map: Mapping[str, str],
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+) -> CompactConfig:
+    cfg = CompactConfig()
+    fill_from_str(cfg, s, Format.ini, env_map, None, collect_errors, observer)
+    return cfg
+
+
+_ini = """
+[compact]
+my_str = World
+my_required = 1.5
+[slots]
+my_str = World
+my_required = 1.5
+"""
+
+
+class CompactSectionTestCase(TestCase):
+    def setUp(self):
+        _pool.clear()
+
+    def test_storage(self):
+        self.assertEqual((section_values_attr,), CompactSection.__slots__)
+        self.assertEqual(
+            tuple(internal_name(x) for x in SlotsSection.__annotations__),
+            SlotsSection.__slots__,
+        )
+
+    def test_defaults(self):
+        sec = CompactSection()
+        self.assertEqual(42, sec.my_int)
+        self.assertEqual("Hello", sec.my_str)
+        self.assertIsNone(sec.my_path)
+        self.assertEqual((1, 2), sec.my_tuple)
+        self.assertEqual("Unset", repr(sec.my_required))
+        self.assertIs(_values(sec), _values(CompactSection()))
+
+    def test_mapping_and_printing(self):
+        cfg = _fill(_ini, {})
+        self.assertEqual(dict(cfg.slots), dict(cfg.compact))
+        self.assertEqual(5, len(cfg.compact))
+        self.assertEqual("World", cfg.compact["my_str"])
+        self.assertEqual(
+            str(cfg.slots).replace("SlotsSection", "CompactSection"),
+            str(cfg.compact),
+        )
+
+    def test_cannot_set_entries(self):
+        sec = CompactSection()
+
+        with self.assertRaises(AttributeError):
+            sec.my_int = 7
+
+        with self.assertRaises(AttributeError):
+            del sec.my_int
+
+        self.assertEqual(42, sec.my_int)
+
+    def test_fill(self):
+        cfg = _fill(_ini, {"COMPACT__MY_INT": "7", "COMPACT__MY_PATH": "/tmp"})
+        self.assertEqual(7, cfg.compact.my_int)
+        self.assertEqual("World", cfg.compact.my_str)
+        self.assertEqual(Path("/tmp"), cfg.compact.my_path)
+        self.assertEqual((1, 2), cfg.compact.my_tuple)
+        self.assertEqual(1.5, cfg.compact.my_required)
+
+    def test_fill_errors(self):
+        with self.assertRaises(IncompleteSectionError):
+            _fill("", {"SLOTS__MY_REQUIRED": "1.0"})
+
+        with self.assertRaises(ValueError) as ctx:
+            _fill(_ini, {"COMPACT__MY_INT": "-1"})
+
+        self.assertIn("Not positive.", str(ctx.exception))
+
+    def test_fill_collecting_errors_keeps_filled_entries(self):
+        observer = NullObserver()
+
+        with self.assertRaises(AggregateError) as ctx:
+            _fill(
+                _ini,
+                {"COMPACT__MY_INT": "nope", "COMPACT__MY_PATH": "/tmp"},
+                collect_errors=True,
+                observer=observer,
+            )
+
+        problems = ctx.exception.problems
+        self.assertEqual(
+            [("compact", "my_int")], [(x.section, x.entry) for x in problems]
+        )
+
+    def test_equal_sections_share_values(self):
+        first = _fill(_ini, {"COMPACT__MY_PATH": "/tmp"})
+        second = _fill(_ini, {"COMPACT__MY_PATH": "/tmp"})
+        third = _fill(_ini, {"COMPACT__MY_PATH": "/var"})
+        self.assertIsNot(first.compact, second.compact)
+        self.assertIs(_values(first.compact), _values(second.compact))
+        self.assertIs(first.compact.my_str, second.compact.my_str)
+        self.assertIsNot(_values(first.compact), _values(third.compact))
+        self.assertEqual(Path("/var"), third.compact.my_path)
+
+    def test_values_of_different_types_arent_shared(self):
+        first = _fill(_ini, {})
+        second = _fill(_ini, {})
+        update_section(first.compact, my_int=1)
+        update_section(second.compact, my_int=True)
+        self.assertIs(int, type(first.compact.my_int))
+        self.assertIs(bool, type(second.compact.my_int))
+
+    def test_equal_but_different_values_arent_shared(self):
+        class MySection(ConfigSection, compact=True, intern_pool=InternPool()):
+            since: Optional[datetime] = None
+            ratio: float = 1.0
+
+        class MyConfig(Config):
+            sec: MySection
+
+        def fill(since: str, ratio: str) -> MyConfig:
+            cfg = MyConfig()
+            fill_config_w_oracles(
+                cfg,
+                None,
+                None,
+                None,
+                env_map={"SEC__SINCE": since, "SEC__RATIO": ratio},
+            )
+            return cfg
+
+        first = fill("2021-05-04T10:00Z", "0.0")
+        second = fill("2021-05-04T11:00+01:00", "-0.0")
+        self.assertEqual(first.sec.since, second.sec.since)
+        self.assertEqual(11, second.sec.since.hour)
+        self.assertEqual(timedelta(hours=1), second.sec.since.utcoffset())
+        self.assertEqual("-0.0", repr(second.sec.ratio))
+        self.assertIsNot(_values(first.sec), _values(second.sec))
+
+    def test_update_section(self):
+        cfg = _fill(_ini, {})
+        update_section(cfg.compact, my_int=3, my_str="Bye")
+        self.assertEqual(3, cfg.compact.my_int)
+        self.assertEqual("Bye", cfg.compact.my_str)
+        self.assertEqual(1.5, cfg.compact.my_required)
+
+        with self.assertRaises(TypeError):
+            update_section(cfg.compact, my_int="3")
+
+    def test_values_are_shared_only_with_intern_pool(self):
+        first = UnpooledConfig()
+        second = UnpooledConfig()
+        fill_from_str(first, "[sec]\nmy_str = x", Format.ini, {})
+        fill_from_str(second, "[sec]\nmy_str = x", Format.ini, {})
+        self.assertEqual(first.sec, second.sec)
+        self.assertIsNot(_values(first.sec), _values(second.sec))
+        restored = pickle.loads(pickle.dumps(first))
+        self.assertEqual(first.sec, restored.sec)
+        self.assertIsNot(_values(first.sec), _values(restored.sec))
+
+        _pool.clear()
+        first = _fill(_ini, {})
+        _pool.clear()
+        second = _fill(_ini, {})
+        self.assertIsNot(_values(first.compact), _values(second.compact))
+
+    def test_pickling(self):
+        cfg = _fill(_ini, {"COMPACT__MY_TUPLE": "4,5"})
+        restored = pickle.loads(pickle.dumps(cfg))
+        self.assertIsInstance(restored.compact, CompactSection)
+        self.assertEqual(dict(cfg.compact), dict(restored.compact))
+        self.assertIs(_values(cfg.compact), _values(restored.compact))
+
+    def test_config_holder_dedupes_compact_sections(self):
+        holder = ConfigHolder(_fill(_ini, {}), history=1)
+        holder.publish(_fill(_ini, {"SLOTS__MY_INT": "1"}))
+        self.assertIs(holder.snapshots[0].config.compact, holder.current.compact)
+
+    def test_subclass_inherits_compactness(self):
+        class SubSection(CompactSection):
+            pass
+
+        class OtherSection(CompactSection, compact=False):
+            pass
+
+        self.assertEqual((), SubSection.__slots__)
+        self.assertEqual(42, SubSection().my_int)
+        self.assertEqual(42, OtherSection().my_int)
+
+    def test_not_compact_by_default(self):
+        self.assertEqual(
+            SlotsSection.__slots__,
+            tuple(internal_name(x) for x in SlotsSection.__annotations__),
+        )
+        self.assertFalse(hasattr(SlotsSection(), section_values_attr))
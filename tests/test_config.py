@@ -268,3 +268,33 @@ class ConfigTestCase(TestCase):
 
         cfg = MyConfig()
         self.assertEqual(cfg.my_section.temp_in_celsius, cfg.temp().celsius())
+
+    def test_generated_init_creates_fresh_sections(self):
+        class MySection(ConfigSection):
+            my_int: int = 42
+
+        class MyConfig(Config):
+            sec1: MySection
+            sec2: MySection
+
+        cfg1 = MyConfig()
+        cfg2 = MyConfig()
+        self.assertIsNot(cfg1.sec1, cfg1.sec2)
+        self.assertIsNot(cfg1.sec1, cfg2.sec1)
+        self.assertEqual(42, cfg1.sec2.my_int)
+        self.assertEqual(
+            f"{MyConfig.__qualname__}.__init__", MyConfig.__init__.__qualname__
+        )
+
+    def test_subclass_without_sections_keeps_inherited_init(self):
+        class MySection(ConfigSection):
+            my_int: int = 42
+
+        class MyConfig(Config):
+            sec: MySection
+
+        class MySubConfig(MyConfig):
+            pass
+
+        self.assertIs(MyConfig.__init__, MySubConfig.__init__)
+        self.assertEqual(42, MySubConfig().sec.my_int)
@@ -0,0 +1,226 @@
+from threading import Thread
+from typing import FrozenSet
+from unittest import TestCase
+
+from nx_config import Config, ConfigHolder, ConfigSection, ConfigSnapshot
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+
+class MySection(ConfigSection):
+    my_int: int = 0
+    my_twice: int = 0
+
+
+class MyConfig(Config):
+    sec: MySection
+
+
+class OtherSection(ConfigSection):
+    my_set: FrozenSet[str] = frozenset()
+    my_str: str = ""
+
+
+class TinySection(ConfigSection):
+    my_float: float = 0.0
+
+
+class TwoSectionConfig(Config):
+    sec: MySection
+    other: OtherSection
+    tiny: TinySection
+
+
+def _filled(my_int: int) -> MyConfig:
+    cfg = MyConfig()
+    fill_config_w_oracles(
+        cfg,
+        in_stream=None,
+        fmt=None,
+        env_prefix=None,
+        env_map={"SEC__MY_INT": str(my_int), "SEC__MY_TWICE": str(2 * my_int)},
+    )
+    return cfg
+
+
+def _filled_two(my_int: int, my_set: str) -> TwoSectionConfig:
+    cfg = TwoSectionConfig()
+    fill_config_w_oracles(
+        cfg,
+        in_stream=None,
+        fmt=None,
+        env_prefix=None,
+        env_map={"SEC__MY_INT": str(my_int), "OTHER__MY_SET": my_set},
+    )
+    return cfg
+
+
+class ConfigHolderTestCase(TestCase):
+    def test_publish(self):
+        first = _filled(1)
+        second = _filled(2)
+        holder = ConfigHolder(first)
+        self.assertIs(first, holder.current)
+        self.assertIs(first, holder.publish(second))
+        self.assertIs(second, holder.current)
+
+        # Old snapshots stay valid:
+        self.assertEqual(1, first.sec.my_int)
+
+    def test_update(self):
+        holder = ConfigHolder(_filled(1))
+        cfg = holder.update(lambda old: _filled(old.sec.my_int + 1))
+        self.assertIs(cfg, holder.current)
+        self.assertEqual(2, cfg.sec.my_int)
+
+    def test_failed_update_publishes_nothing(self):
+        first = _filled(1)
+        holder = ConfigHolder(first)
+
+        def make_config(_):
+            raise ValueError()
+
+        with self.assertRaises(ValueError):
+            holder.update(make_config)
+
+        self.assertIs(first, holder.current)
+
+    def test_concurrent_updates_are_not_lost(self):
+        holder = ConfigHolder(_filled(0))
+        n_threads = 8
+        n_updates = 20
+
+        def writer():
+            for _ in range(n_updates):
+                holder.update(lambda old: _filled(old.sec.my_int + 1))
+
+        threads = [Thread(target=writer) for _ in range(n_threads)]
+
+        for t in threads:
+            t.start()
+
+        # Readers always see consistent snapshots:
+        for _ in range(1000):
+            cfg = holder.current
+            self.assertEqual(2 * cfg.sec.my_int, cfg.sec.my_twice)
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(n_threads * n_updates, holder.current.sec.my_int)
+
+
+class ConfigHolderHistoryTestCase(TestCase):
+    def test_no_history_by_default(self):
+        holder = ConfigHolder(_filled(1))
+        holder.publish(_filled(2))
+        self.assertEqual((), holder.snapshots)
+
+        with self.assertRaises(ValueError) as ctx:
+            holder.rollback()
+
+        self.assertIn("0 previous", str(ctx.exception))
+
+    def test_invalid_history(self):
+        with self.assertRaises(ValueError) as ctx:
+            ConfigHolder(_filled(1), history=-1)
+
+        self.assertIn("history", str(ctx.exception))
+
+    def test_snapshots_are_bounded(self):
+        configs = [_filled(x) for x in range(5)]
+        holder = ConfigHolder(configs[0], history=2)
+        self.assertEqual([configs[0]], [x.config for x in holder.snapshots])
+
+        for cfg in configs[1:]:
+            holder.publish(cfg)
+
+        snapshots = holder.snapshots
+        self.assertEqual(configs[2:], [x.config for x in snapshots])
+        self.assertTrue(all(isinstance(x, ConfigSnapshot) for x in snapshots))
+        self.assertEqual(
+            sorted(x.published_at for x in snapshots),
+            [x.published_at for x in snapshots],
+        )
+        self.assertEqual(3, len({x.fingerprint for x in snapshots}))
+        self.assertTrue(all(len(x.fingerprint) == 32 for x in snapshots))
+
+    def test_rollback(self):
+        first = _filled(1)
+        second = _filled(2)
+        third = _filled(3)
+        holder = ConfigHolder(first, history=3)
+        holder.publish(second)
+        holder.update(lambda _: third)
+
+        self.assertIs(second, holder.rollback())
+        self.assertIs(second, holder.current)
+        self.assertEqual(
+            [first, second, third, second], [x.config for x in holder.snapshots]
+        )
+        self.assertEqual(
+            holder.snapshots[1].fingerprint, holder.snapshots[3].fingerprint
+        )
+
+        self.assertIs(first, holder.rollback(3))
+        self.assertIs(first, holder.current)
+        # The oldest snapshot was dropped from the history:
+        self.assertEqual(
+            [second, third, second, first], [x.config for x in holder.snapshots]
+        )
+
+    def test_rollback_to_snapshot(self):
+        holder = ConfigHolder(_filled(1), history=1)
+        snapshot = holder.snapshots[0]
+        holder.publish(_filled(2))
+        self.assertIs(snapshot.config, holder.rollback(snapshot))
+        self.assertIs(snapshot.config, holder.current)
+
+        # Only two snapshots are kept, so the one for '2' is gone now:
+        with self.assertRaises(ValueError) as ctx:
+            holder.rollback(snapshot)
+
+        self.assertIn("isn't kept", str(ctx.exception))
+
+    def test_invalid_rollback(self):
+        holder = ConfigHolder(_filled(1), history=5)
+        holder.publish(_filled(2))
+
+        for to in (0, -1, 2, 10):
+            with self.subTest(to=to):
+                with self.assertRaises(ValueError) as ctx:
+                    holder.rollback(to)
+
+                self.assertIn("1 previous", str(ctx.exception))
+
+        self.assertEqual(2, holder.current.sec.my_int)
+
+    def test_equal_sections_are_shared(self):
+        first = _filled_two(1, "a, b")
+        holder = ConfigHolder(first, history=2)
+        second = _filled_two(2, "b, a")
+        holder.publish(second)
+        self.assertIs(first.other, second.other)
+        self.assertIs(first.tiny, second.tiny)
+        self.assertIsNot(first.sec, second.sec)
+        self.assertEqual(2, second.sec.my_int)
+
+        third = _filled_two(2, "a")
+        holder.publish(third)
+        self.assertIs(second.sec, third.sec)
+        self.assertEqual(frozenset("a"), third.other.my_set)
+
+        fourth = _filled_two(2, "a")
+        holder.publish(fourth)
+        self.assertEqual(
+            holder.snapshots[-2].fingerprint, holder.snapshots[-1].fingerprint
+        )
+
+    def test_different_config_classes(self):
+        first = _filled(1)
+        holder = ConfigHolder(first, history=1)
+        second = _filled_two(1, "")
+        holder.publish(second)
+        self.assertIsNot(first.sec, second.sec)
+        self.assertIs(second, holder.current)
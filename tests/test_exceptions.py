@@ -1,10 +1,15 @@
+import pickle
 from unittest import TestCase
+from warnings import warn
 
 from nx_config import (
     NxConfigError,
     ValidationError,
     IncompleteSectionError,
     ParsingError,
+    AggregateError,
+    ConfigProblem,
+    UnmatchedEnvVarWarning,
 )
 
 
@@ -32,3 +37,32 @@ class ExceptionsTestCase(TestCase):
     def test_parsing_error_is_value_error(self):
         with self.assertRaises(ValueError):
             raise ParsingError()
+
+    def test_unmatched_env_var_warning_is_user_warning(self):
+        with self.assertWarns(UserWarning):
+            warn("Unmatched", UnmatchedEnvVarWarning)
+
+    def test_aggregate_error_is_nx_config_error(self):
+        with self.assertRaises(NxConfigError):
+            raise AggregateError(())
+
+    def test_aggregate_error_lists_problems(self):
+        problems = (
+            ConfigProblem("sec", "entry", "INI input", ValueError("Bad")),
+            ConfigProblem("sec", None, "validator 'check'", ValidationError("Ugly")),
+        )
+        xcp = AggregateError(problems)
+        self.assertEqual(problems, xcp.problems)
+        self.assertEqual(
+            "Found 2 problem(s) while filling config:\n"
+            "  - section 'sec', entry 'entry' (INI input): ValueError: Bad\n"
+            "  - section 'sec' (validator 'check'): ValidationError: Ugly",
+            str(xcp),
+        )
+
+    def test_aggregate_error_can_be_pickled(self):
+        xcp = AggregateError((ConfigProblem("sec", "entry", None, ValueError("Bad")),))
+        unpickled = pickle.loads(pickle.dumps(xcp))
+        self.assertIs(AggregateError, type(unpickled))
+        self.assertEqual(str(xcp), str(unpickled))
+        self.assertEqual(("sec", "entry", None), unpickled.problems[0][:3])
@@ -0,0 +1,319 @@
+import asyncio
+import os
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from nx_config import (
+    AggregateError,
+    Config,
+    ConfigSection,
+    FillPhase,
+    Format,
+    UnmatchedEnvVarWarning,
+    fill_config_async,
+    fill_config_from_path_async,
+    validate,
+    watch_config,
+)
+
+# noinspection PyProtectedMember
+from nx_config._core.async_fill_with_oracles import (
+    fill_config_async_w_oracles,
+    fill_config_from_path_async_w_oracles,
+    watch_config_w_oracles,
+)
+from tests.fill_test_helpers import RecordingObserver
+
+
+class MySection(ConfigSection):
+    my_int: int = 0
+    my_str: str = ""
+
+    @validate
+    def int_is_small(self):
+        if self.my_int > 10:
+            raise ValueError("Too big.")
+
+
+class MyConfig(Config):
+    first: MySection
+    second: MySection
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+class FillConfigAsyncTestCase(TestCase):
+    def setUp(self):
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = Path(tmp_dir.name)
+
+    def write(self, name: str, content: str) -> Path:
+        # Atomically, so that watchers never see partially written files.
+        path = self.tmp_dir / name
+        tmp_path = self.tmp_dir / f"{name}.tmp"
+        tmp_path.write_text(content)
+        os.replace(tmp_path, path)
+        return path
+
+    def test_fill_from_stream(self):
+        for fmt, s in (
+            (Format.yaml, "first:\n  my_int: 1\n"),
+            (Format.ini, "[first]\nmy_int = 1\n"),
+        ):
+            with self.subTest(fmt=fmt):
+                cfg = MyConfig()
+                _run(
+                    fill_config_async_w_oracles(
+                        cfg,
+                        in_stream=StringIO(s),
+                        fmt=fmt,
+                        env_prefix=None,
+                        env_map={"SECOND__MY_STR": "Hi"},
+                    )
+                )
+                self.assertEqual(1, cfg.first.my_int)
+                self.assertEqual("Hi", cfg.second.my_str)
+
+    def test_fill_without_stream(self):
+        cfg = MyConfig()
+        _run(
+            fill_config_async_w_oracles(
+                cfg,
+                in_stream=None,
+                fmt=None,
+                env_prefix="PREFIX",
+                env_map={"PREFIX__FIRST__MY_INT": "2"},
+            )
+        )
+        self.assertEqual(2, cfg.first.my_int)
+
+    def test_unmatched_env_vars_warning_points_to_caller(self):
+        async def fill():
+            await fill_config_async_w_oracles(
+                MyConfig(),
+                in_stream=None,
+                fmt=None,
+                env_prefix=None,
+                env_map={"FIRST__OTHER": "2"},
+            )
+
+        with self.assertWarns(UnmatchedEnvVarWarning) as ctx:
+            _run(fill())
+
+        self.assertEqual(__file__, ctx.filename)
+
+    def test_stream_without_format(self):
+        with self.assertRaises(ValueError):
+            _run(
+                fill_config_async_w_oracles(
+                    MyConfig(),
+                    in_stream=StringIO(""),
+                    fmt=None,
+                    env_prefix=None,
+                    env_map={},
+                )
+            )
+
+    def test_event_loop_is_not_blocked(self):
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            n_before = len(ticks)
+            await fill_config_async_w_oracles(
+                MyConfig(), in_stream=None, fmt=None, env_prefix=None, env_map={}
+            )
+            n_during = len(ticks) - n_before
+            task.cancel()
+            return n_during
+
+        # The ticker runs at least once between the two sections:
+        self.assertGreaterEqual(_run(main()), 1)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            _run(
+                fill_config_async_w_oracles(
+                    MyConfig(),
+                    in_stream=None,
+                    fmt=None,
+                    env_prefix=None,
+                    env_map={"FIRST__MY_INT": "11"},
+                )
+            )
+
+        with self.assertRaises(AggregateError) as ctx:
+            _run(
+                fill_config_async_w_oracles(
+                    MyConfig(),
+                    in_stream=None,
+                    fmt=None,
+                    env_prefix=None,
+                    env_map={"FIRST__MY_INT": "11", "SECOND__MY_INT": "x"},
+                    collect_errors=True,
+                )
+            )
+
+        self.assertEqual(2, len(ctx.exception.problems))
+
+    def test_observer(self):
+        for fmt, in_stream in ((None, None), (Format.yaml, StringIO("{}"))):
+            with self.subTest(fmt=fmt):
+                observer = RecordingObserver()
+                _run(
+                    fill_config_async_w_oracles(
+                        MyConfig(),
+                        in_stream=in_stream,
+                        fmt=fmt,
+                        env_prefix=None,
+                        env_map={},
+                        observer=observer,
+                    )
+                )
+                expected = [FillPhase.env] + 2 * [
+                    FillPhase.fill_section,
+                    FillPhase.check_section,
+                    FillPhase.validate_section,
+                ]
+
+                if fmt is not None:
+                    expected.insert(0, FillPhase.parse)
+
+                self.assertEqual(
+                    expected + [FillPhase.total],
+                    [
+                        x.phase
+                        for x in observer.events
+                        if x.phase != FillPhase.fill_entry
+                    ],
+                )
+
+    def test_fill_from_path(self):
+        for name, content in (
+            ("config.yaml", "first:\n  my_int: 3\n"),
+            ("config.ini", "[first]\nmy_int = 3\n"),
+        ):
+            with self.subTest(name=name):
+                path = self.write(name, content)
+                cfg = MyConfig()
+                observer = RecordingObserver()
+                _run(
+                    fill_config_from_path_async_w_oracles(
+                        cfg,
+                        path=path,
+                        env_prefix=None,
+                        env_map={},
+                        observer=observer,
+                    )
+                )
+                self.assertEqual(3, cfg.first.my_int)
+                self.assertEqual(FillPhase.parse, observer.events[0].phase)
+
+    def test_public_functions(self):
+        path = self.write("config.yaml", "first:\n  my_int: 4\n")
+
+        cfg = MyConfig()
+        _run(fill_config_from_path_async(cfg, path=str(path)))
+        self.assertEqual(4, cfg.first.my_int)
+
+        cfg = MyConfig()
+        _run(fill_config_from_path_async(cfg))
+        self.assertEqual(0, cfg.first.my_int)
+
+        cfg = MyConfig()
+        _run(
+            fill_config_async(
+                cfg, stream=StringIO("first:\n  my_int: 5"), fmt=Format.yaml
+            )
+        )
+        self.assertEqual(5, cfg.first.my_int)
+
+        async def first_config():
+            async for x in watch_config(MyConfig, path=path):
+                return x
+
+        self.assertEqual(4, _run(first_config()).first.my_int)
+
+    def test_watch(self):
+        for report_errors in (True, False):
+            with self.subTest(report_errors=report_errors):
+                self._test_watch(report_errors)
+
+    def _test_watch(self, report_errors: bool):
+        path = self.write("config.yaml", "first:\n  my_int: 1\n")
+        errors = []
+
+        async def change_file():
+            # Invalid, then missing, then valid again:
+            await asyncio.sleep(0.05)
+            self.write("config.yaml", "first:\n  my_int: 11\n")
+            await asyncio.sleep(0.05)
+            path.unlink()
+            await asyncio.sleep(0.05)
+            self.write("config.yaml", "first:\n  my_int: 2\n")
+
+        async def main():
+            configs = []
+            watcher = watch_config_w_oracles(
+                MyConfig,
+                path=path,
+                env_prefix=None,
+                env_map={},
+                yaml_loader=None,
+                poll_interval=0.001,
+                on_error=errors.append if report_errors else None,
+            )
+            task = asyncio.ensure_future(change_file())
+
+            async for cfg in watcher:
+                configs.append(cfg.first.my_int)
+
+                if len(configs) == 2:
+                    break
+
+            await task
+            return configs
+
+        self.assertEqual([1, 2], _run(main()))
+
+        if report_errors:
+            self.assertEqual(2, len(errors))
+            self.assertIsInstance(errors[0], ValueError)
+            self.assertIsInstance(errors[1], FileNotFoundError)
+
+    def test_watch_initial_errors_are_raised(self):
+        path = self.write("config.yaml", "first:\n  my_int: 11\n")
+
+        async def main():
+            async for _ in watch_config(MyConfig, path=path):
+                pass
+
+        with self.assertRaises(ValueError):
+            _run(main())
+
+    def test_watch_invalid_poll_interval(self):
+        path = self.write("config.yaml", "")
+
+        async def main():
+            async for _ in watch_config(MyConfig, path=path, poll_interval=0):
+                pass
+
+        with self.assertRaises(ValueError):
+            _run(main())
@@ -0,0 +1,181 @@
+from configparser import MissingSectionHeaderError
+from typing import Tuple
+from unittest import TestCase
+
+from nx_config import (
+    AggregateError,
+    Config,
+    ConfigSection,
+    Format,
+    IncompleteSectionError,
+    ParsingError,
+    ValidationError,
+    validate,
+)
+from tests.fill_test_helpers import fill_from_str
+
+
+class FirstSection(ConfigSection):
+    my_int: int = 0
+    my_tuple: Tuple[int, ...] = ()
+    my_float: float
+
+    @validate
+    def int_is_small(self):
+        if self.my_int > 10:
+            raise ValueError("Too big.")
+
+    @validate
+    def tuple_is_short(self):
+        if len(self.my_tuple) > 2:
+            raise ValueError("Too long.")
+
+
+class SecondSection(ConfigSection):
+    my_str: str = ""
+    my_bool: bool = False
+    my_other_int: int
+
+
+class MyConfig(Config):
+    first: FirstSection
+    second: SecondSection
+
+
+class FillConfigCollectErrorsTestCase(TestCase):
+    def test_no_problems(self):
+        cfg = MyConfig()
+        fill_from_str(
+            cfg,
+            "[first]\nmy_float = 1.5\n[second]\nmy_other_int = 3",
+            Format.ini,
+            {"SECOND__MY_BOOL": "yes"},
+            collect_errors=True,
+        )
+        self.assertEqual(1.5, cfg.first.my_float)
+        self.assertEqual(3, cfg.second.my_other_int)
+        self.assertEqual(True, cfg.second.my_bool)
+
+    def test_all_problems_are_collected(self):
+        yaml_str = """
+        first:
+          my_int: not an int
+          my_tuple: [1, 2]
+          my_float: 1.5
+        second:
+          my_bool: [1, 2]
+        """
+        env_map = {"FIRST__MY_TUPLE": "1, two", "SECOND__MY_STR": "Hello"}
+
+        with self.assertRaises(AggregateError) as ctx:
+            fill_from_str(
+                MyConfig(), yaml_str, Format.yaml, env_map, collect_errors=True
+            )
+
+        problems = ctx.exception.problems
+        self.assertEqual(
+            (
+                ("first", "my_int", "YAML input", TypeError),
+                (
+                    "first",
+                    "my_tuple",
+                    "environment variable 'FIRST__MY_TUPLE'",
+                    ParsingError,
+                ),
+                ("second", "my_bool", "YAML input", TypeError),
+                ("second", "my_other_int", None, IncompleteSectionError),
+            ),
+            tuple((x.section, x.entry, x.source, type(x.error)) for x in problems),
+        )
+
+        msg = str(ctx.exception)
+        self.assertIn("Found 4 problem(s)", msg)
+
+        for p in problems:
+            self.assertIn(str(p.error), msg)
+
+    def test_all_validators_run(self):
+        cfg = MyConfig()
+
+        with self.assertRaises(AggregateError) as ctx:
+            fill_from_str(
+                cfg,
+                None,
+                None,
+                {
+                    "FIRST__MY_INT": "42",
+                    "FIRST__MY_TUPLE": "1, 2, 3",
+                    "FIRST__MY_FLOAT": "1.5",
+                    "SECOND__MY_OTHER_INT": "3",
+                },
+                collect_errors=True,
+            )
+
+        problems = ctx.exception.problems
+        self.assertEqual(
+            (
+                ("first", None, "validator 'int_is_small'"),
+                ("first", None, "validator 'tuple_is_short'"),
+            ),
+            tuple(x[:3] for x in problems),
+        )
+
+        for p, expected in zip(problems, ("Too big.", "Too long.")):
+            self.assertIsInstance(p.error, ValidationError)
+            self.assertIsInstance(p.error.__cause__, ValueError)
+            self.assertIn(expected, str(p.error))
+
+        # Sections without problems are completely filled:
+        self.assertEqual(3, cfg.second.my_other_int)
+
+    def test_validators_not_run_for_sections_with_problems(self):
+        with self.assertRaises(AggregateError) as ctx:
+            fill_from_str(
+                MyConfig(), None, None, {"FIRST__MY_INT": "42"}, collect_errors=True
+            )
+
+        self.assertEqual(
+            (("first", "my_float"), ("second", "my_other_int")),
+            tuple(x[:2] for x in ctx.exception.problems),
+        )
+
+    def test_same_errors_as_without_collecting(self):
+        ini_str = """
+        [first]
+        my_int = 1
+        my_float = one
+        [second]
+        my_other_int = 1
+        """
+
+        for fmt, s, env_map in (
+            (Format.ini, ini_str, {}),
+            (None, None, {"FIRST__MY_FLOAT": "1.5", "SECOND__MY_OTHER_INT": "x"}),
+            (None, None, {"FIRST__MY_FLOAT": "1.5"}),
+            (
+                None,
+                None,
+                {
+                    "FIRST__MY_FLOAT": "1.5",
+                    "FIRST__MY_INT": "11",
+                    "SECOND__MY_OTHER_INT": "1",
+                },
+            ),
+        ):
+            with self.subTest(fmt=fmt, env_map=env_map):
+                with self.assertRaises(AggregateError) as ctx:
+                    fill_from_str(MyConfig(), s, fmt, env_map, collect_errors=True)
+
+                with self.assertRaises(Exception) as expected_ctx:
+                    fill_from_str(MyConfig(), s, fmt, env_map, collect_errors=False)
+
+                self.assertEqual(1, len(ctx.exception.problems))
+                error = ctx.exception.problems[0].error
+                self.assertIs(type(expected_ctx.exception), type(error))
+                self.assertEqual(str(expected_ctx.exception), str(error))
+
+    def test_syntax_errors_are_raised_directly(self):
+        with self.assertRaises(MissingSectionHeaderError):
+            fill_from_str(
+                MyConfig(), "[first\nmy_int = 1", Format.ini, {}, collect_errors=True
+            )
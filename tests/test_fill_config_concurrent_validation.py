@@ -0,0 +1,296 @@
+from threading import Barrier
+from time import sleep
+from unittest import TestCase
+
+from nx_config import (
+    AggregateError,
+    Config,
+    ConfigSection,
+    FillPhase,
+    Format,
+    IncompleteSectionError,
+    ParsingError,
+    ValidationError,
+    validate,
+)
+from tests.fill_test_helpers import RecordingObserver, fill_from_str
+
+_barrier = Barrier(2, timeout=5.0)
+
+
+class _Abort(BaseException):
+    pass
+
+
+class FirstSection(ConfigSection):
+    my_int: int = 0
+    wait_for_second: bool = False
+
+    @validate
+    def meet_second(self):
+        if self.wait_for_second:
+            _barrier.wait()
+
+    @validate
+    def int_is_small(self):
+        if self.my_int > 10:
+            # Slow failure, so that the second section fails first in time:
+            sleep(0.05)
+            raise ValueError("Too big.")
+
+
+class SecondSection(ConfigSection):
+    my_float: float = 0.0
+    my_required: int
+    wait_for_first: bool = False
+    abort: bool = False
+
+    @validate
+    def abort_if_requested(self):
+        if self.abort:
+            raise _Abort()
+
+    @validate
+    def meet_first(self):
+        if self.wait_for_first:
+            _barrier.wait()
+
+    @validate
+    def float_is_positive(self):
+        if self.my_float < 0.0:
+            raise ValueError("Negative.")
+
+
+class MyConfig(Config):
+    first: FirstSection
+    second: SecondSection
+
+
+class FillConfigConcurrentValidationTestCase(TestCase):
+    def setUp(self):
+        _barrier.reset()
+
+    def test_no_problems(self):
+        for workers in (1, 2, 8):
+            with self.subTest(workers=workers):
+                cfg = MyConfig()
+                fill_from_str(
+                    cfg,
+                    "[first]\nmy_int = 3\n[second]\nmy_required = 4",
+                    Format.ini,
+                    {"SECOND__MY_FLOAT": "1.5"},
+                    validation_workers=workers,
+                )
+                self.assertEqual(3, cfg.first.my_int)
+                self.assertEqual(1.5, cfg.second.my_float)
+                self.assertEqual(4, cfg.second.my_required)
+
+    def test_validators_of_different_sections_run_concurrently(self):
+        # Each section's validator waits for the other one, which would time
+        # out (with 'BrokenBarrierError') if they ran one after another.
+        cfg = MyConfig()
+        fill_from_str(
+            cfg,
+            None,
+            None,
+            {
+                "FIRST__WAIT_FOR_SECOND": "yes",
+                "SECOND__WAIT_FOR_FIRST": "yes",
+                "SECOND__MY_REQUIRED": "1",
+            },
+            validation_workers=2,
+        )
+        self.assertFalse(_barrier.broken)
+
+    def test_invalid_validation_workers(self):
+        for workers in (0, -1):
+            with self.subTest(workers=workers):
+                with self.assertRaises(ValueError) as ctx:
+                    fill_from_str(
+                        MyConfig(),
+                        None,
+                        None,
+                        {"SECOND__MY_REQUIRED": "1"},
+                        validation_workers=workers,
+                    )
+
+                msg = str(ctx.exception)
+                self.assertIn("validation_workers", msg)
+                self.assertIn(str(workers), msg)
+
+    def test_first_error_in_section_order_is_raised(self):
+        # The second section's validator fails first (in time), but the
+        # first section's error is reported, as without concurrency.
+        with self.assertRaises(ValidationError) as ctx:
+            fill_from_str(
+                MyConfig(),
+                None,
+                None,
+                {
+                    "FIRST__MY_INT": "11",
+                    "SECOND__MY_FLOAT": "-1.0",
+                    "SECOND__MY_REQUIRED": "1",
+                },
+                validation_workers=2,
+            )
+
+        msg = str(ctx.exception)
+        self.assertIn("'first'", msg)
+        self.assertIn("Too big.", msg)
+        self.assertIsInstance(ctx.exception.__cause__, ValueError)
+
+    def test_validation_error_before_later_fill_error(self):
+        with self.assertRaises(ValidationError) as ctx:
+            fill_from_str(
+                MyConfig(),
+                None,
+                None,
+                {"FIRST__MY_INT": "11", "SECOND__MY_FLOAT": "nope"},
+                validation_workers=2,
+            )
+
+        self.assertIn("Too big.", str(ctx.exception))
+
+    def test_fill_error_after_successful_validation(self):
+        with self.assertRaises(ParsingError) as ctx:
+            fill_from_str(
+                MyConfig(),
+                None,
+                None,
+                {"SECOND__MY_FLOAT": "nope"},
+                validation_workers=2,
+            )
+
+        self.assertIn("'second'", str(ctx.exception))
+
+        with self.assertRaises(IncompleteSectionError) as ctx:
+            fill_from_str(MyConfig(), None, None, {}, validation_workers=2)
+
+        self.assertIn("my_required", str(ctx.exception))
+
+    def test_collect_errors_in_section_order(self):
+        with self.assertRaises(AggregateError) as ctx:
+            fill_from_str(
+                MyConfig(),
+                None,
+                None,
+                {
+                    "FIRST__MY_INT": "11",
+                    "SECOND__MY_FLOAT": "-1.0",
+                    "SECOND__MY_REQUIRED": "1",
+                },
+                collect_errors=True,
+                validation_workers=2,
+            )
+
+        problems = ctx.exception.problems
+        self.assertEqual(
+            [
+                ("first", None, "validator 'int_is_small'"),
+                ("second", None, "validator 'float_is_positive'"),
+            ],
+            [(x.section, x.entry, x.source) for x in problems],
+        )
+        self.assertTrue(all(isinstance(x.error, ValidationError) for x in problems))
+
+    def test_collect_errors_with_fill_problems(self):
+        # Sections with problems in their entries aren't validated.
+        with self.assertRaises(AggregateError) as ctx:
+            fill_from_str(
+                MyConfig(),
+                None,
+                None,
+                {"FIRST__MY_INT": "11", "SECOND__MY_FLOAT": "-1.0"},
+                collect_errors=True,
+                validation_workers=2,
+            )
+
+        problems = ctx.exception.problems
+        self.assertEqual(
+            [
+                ("first", None, "validator 'int_is_small'"),
+                ("second", "my_required", None),
+            ],
+            [(x.section, x.entry, x.source) for x in problems],
+        )
+        self.assertIsInstance(problems[1].error, IncompleteSectionError)
+
+    def test_collect_errors_no_problems(self):
+        cfg = MyConfig()
+        fill_from_str(
+            cfg,
+            None,
+            None,
+            {"SECOND__MY_REQUIRED": "2"},
+            collect_errors=True,
+            validation_workers=2,
+        )
+        self.assertEqual(2, cfg.second.my_required)
+
+    def test_collect_errors_doesnt_catch_base_exceptions(self):
+        with self.assertRaises(_Abort):
+            fill_from_str(
+                MyConfig(),
+                None,
+                None,
+                {
+                    "FIRST__MY_INT": "nope",
+                    "SECOND__ABORT": "yes",
+                    "SECOND__MY_REQUIRED": "1",
+                },
+                collect_errors=True,
+                validation_workers=2,
+            )
+
+    def test_observer_events(self):
+        observer = RecordingObserver(entry_threshold_ns=10**12)
+        fill_from_str(
+            MyConfig(),
+            None,
+            None,
+            {"SECOND__MY_REQUIRED": "2"},
+            observer=observer,
+            validation_workers=2,
+        )
+        self.assertEqual(
+            [
+                (FillPhase.env, None),
+                (FillPhase.fill_section, "first"),
+                (FillPhase.check_section, "first"),
+                (FillPhase.fill_section, "second"),
+                (FillPhase.check_section, "second"),
+                (FillPhase.validate_section, "first"),
+                (FillPhase.validate_section, "second"),
+                (FillPhase.total, None),
+            ],
+            [(x.phase, x.section) for x in observer.events],
+        )
+        self.assertTrue(all(x.duration_ns >= 0 for x in observer.events))
+
+    def test_observer_events_collecting_errors(self):
+        observer = RecordingObserver(entry_threshold_ns=10**12)
+
+        with self.assertRaises(AggregateError):
+            fill_from_str(
+                MyConfig(),
+                None,
+                None,
+                {"FIRST__MY_INT": "11"},
+                collect_errors=True,
+                observer=observer,
+                validation_workers=2,
+            )
+
+        # Not validated (and no 'validate_section' event) for the incomplete
+        # section 'second', like without concurrency.
+        self.assertEqual(
+            [
+                (FillPhase.env, None),
+                (FillPhase.fill_section, "first"),
+                (FillPhase.check_section, "first"),
+                (FillPhase.fill_section, "second"),
+                (FillPhase.check_section, "second"),
+                (FillPhase.validate_section, "first"),
+            ],
+            [(x.phase, x.section) for x in observer.events],
+        )
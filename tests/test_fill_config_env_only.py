@@ -1,20 +1,30 @@
+import os
 from datetime import datetime, timezone, timedelta
+from io import StringIO
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from unittest import TestCase
+from unittest.mock import patch
 from uuid import UUID
+from warnings import catch_warnings, simplefilter
 
 from nx_config import (
     Config,
     ConfigSection,
+    Format,
     SecretString,
     URL,
     IncompleteSectionError,
     ParsingError,
+    UnmatchedEnvVarWarning,
+    fill_config,
 )
 
 # noinspection PyProtectedMember
-from nx_config._core.fill_with_oracles import fill_config_w_oracles
+from nx_config._core.fill_with_oracles import (
+    fill_config_w_oracles,
+    refill_config_w_oracles,
+)
 from tests.typing_test_helpers import collection_type_holders
 
 
@@ -397,6 +407,73 @@ class FillConfigEnvOnlyTestCase(TestCase):
         self.assertEqual(aware, cfg.sec.dt1)
         self.assertEqual(naive, cfg.sec.dt2)
 
+    def test_iso_and_other_datetime_formats(self):
+        class MySection(ConfigSection):
+            dt: datetime
+            dts: Tuple[datetime, ...] = ()
+
+        class MyConfig(Config):
+            sec: MySection
+
+        utc = timezone.utc
+        minus_five = timezone(timedelta(hours=-5))
+        plus_one_thirty = timezone(timedelta(hours=1, minutes=30))
+
+        for value_str, expected in (
+            ("2021-05-04", datetime(2021, 5, 4)),
+            ("2021-05-04T09:15", datetime(2021, 5, 4, 9, 15)),
+            ("2021-05-04 09:15:07", datetime(2021, 5, 4, 9, 15, 7)),
+            ("2021-05-04T09:15:07.5", datetime(2021, 5, 4, 9, 15, 7, 500000)),
+            ("2021-05-04T09:15:07.000009Z", datetime(2021, 5, 4, 9, 15, 7, 9, utc)),
+            ("2021-05-04T09:15-05:00", datetime(2021, 5, 4, 9, 15, tzinfo=minus_five)),
+            (
+                "2021-05-04T09:15+0130",
+                datetime(2021, 5, 4, 9, 15, tzinfo=plus_one_thirty),
+            ),
+            # Not strict ISO-8601, handled by 'dateutil':
+            ("2021-5-4 9:15", datetime(2021, 5, 4, 9, 15)),
+            ("May 4th 2021 9:15", datetime(2021, 5, 4, 9, 15)),
+            ("2021-05-04T09:15:07.1234567", datetime(2021, 5, 4, 9, 15, 7, 123456)),
+            (" 2021-05-04 ", datetime(2021, 5, 4)),
+        ):
+            with self.subTest(value_str=value_str):
+                cfg = MyConfig()
+                fill_config_w_oracles(
+                    cfg,
+                    in_stream=None,
+                    fmt=None,
+                    env_prefix=None,
+                    env_map={
+                        "SEC__DT": value_str,
+                        "SEC__DTS": f"{value_str},{value_str}",
+                    },
+                )
+                self.assertEqual(expected, cfg.sec.dt)
+                self.assertEqual(expected.utcoffset(), cfg.sec.dt.utcoffset())
+                self.assertEqual((expected, expected), cfg.sec.dts)
+
+    def test_out_of_range_utc_offset(self):
+        class MySection(ConfigSection):
+            dt: datetime
+
+        class MyConfig(Config):
+            sec: MySection
+
+        # Rejected by 'datetime.timezone', but accepted by 'dateutil':
+        value_str = "2021-05-04T09:15+24:00"
+        cfg = MyConfig()
+        fill_config_w_oracles(
+            cfg,
+            in_stream=None,
+            fmt=None,
+            env_prefix=None,
+            env_map={"SEC__DT": value_str},
+        )
+        # noinspection PyPackageRequirements
+        from dateutil.parser import parse
+
+        self.assertEqual(repr(parse(value_str)), repr(cfg.sec.dt))
+
     def test_uuids_without_hyphens(self):
         class MySection(ConfigSection):
             my_uuid: UUID
@@ -482,7 +559,7 @@ class FillConfigEnvOnlyTestCase(TestCase):
 
         env_key = "MY_SECTION__MY_ENTRY"
 
-        for value_str in ("", "today at noon", "2021-13-01 25:61:62"):
+        for value_str in ("", "today at noon", "2021-13-01 25:61:62", "2021-02-29"):
             with self.subTest("Invalid strings", value_str=value_str):
                 with self.assertRaises(ParsingError) as ctx:
                     fill_config_w_oracles(
@@ -1098,3 +1175,147 @@ class FillConfigEnvOnlyTestCase(TestCase):
             cfg2, in_stream=None, fmt=None, env_prefix=prefix, env_map=env_map
         )
         self.assertEqual(prefix_value, cfg2.my_section.my_entry)
+
+    def test_env_map_is_scanned_once(self):
+        class MySection(ConfigSection):
+            my_int: int = 0
+            my_str: str = ""
+
+        class MyConfig(Config):
+            my_section: MySection
+
+        class CountingMap(dict):
+            items_calls = 0
+            getitem_calls = 0
+
+            def items(self):
+                CountingMap.items_calls += 1
+                return super().items()
+
+            def __getitem__(self, k):
+                CountingMap.getitem_calls += 1
+                return super().__getitem__(k)
+
+            def get(self, k, default=None):
+                CountingMap.getitem_calls += 1
+                return super().get(k, default)
+
+        env_map = CountingMap(
+            {"MY_SECTION__MY_INT": "42", "HOME": "/home/me", "PATH": "/bin"}
+        )
+        cfg = MyConfig()
+        fill_config_w_oracles(
+            cfg, in_stream=None, fmt=None, env_prefix=None, env_map=env_map
+        )
+
+        self.assertEqual(42, cfg.my_section.my_int)
+        self.assertEqual(1, CountingMap.items_calls)
+        self.assertEqual(0, CountingMap.getitem_calls)
+
+    def test_unmatched_env_vars_warning(self):
+        class MySection(ConfigSection):
+            my_entry: int = 0
+
+        class MyConfig(Config):
+            my_section: MySection
+
+        with self.subTest("Without prefix"):
+            with self.assertWarns(UnmatchedEnvVarWarning) as ctx:
+                fill_config_w_oracles(
+                    MyConfig(),
+                    in_stream=None,
+                    fmt=None,
+                    env_prefix=None,
+                    env_map={
+                        "MY_SECTION__MY_ENTRY": "1",
+                        "MY_SECTION__MY_ENTRYY": "2",
+                        "MY_SECTION__OTHER": "3",
+                        "MY_SECTION_MY_ENTRY": "4",
+                        "OTHER__MY_ENTRY": "5",
+                    },
+                )
+
+            msg = str(ctx.warning)
+            self.assertIn("MY_SECTION__MY_ENTRYY, MY_SECTION__OTHER", msg)
+            self.assertNotIn("MY_SECTION__MY_ENTRY,", msg)
+            self.assertNotIn("MY_SECTION_MY_ENTRY", msg)
+            self.assertNotIn("OTHER__MY_ENTRY", msg)
+
+        with self.subTest("With prefix"):
+            with self.assertWarns(UnmatchedEnvVarWarning) as ctx:
+                fill_config_w_oracles(
+                    MyConfig(),
+                    in_stream=None,
+                    fmt=None,
+                    env_prefix="PREFIX",
+                    env_map={
+                        "PREFIX__MY_SECTION__MY_ENTRY": "1",
+                        "PREFIX__MY_SECTON__MY_ENTRY": "2",
+                        "MY_SECTION__OTHER": "3",
+                    },
+                )
+
+            msg = str(ctx.warning)
+            self.assertIn("PREFIX__MY_SECTON__MY_ENTRY", msg)
+            self.assertNotIn("PREFIX__MY_SECTION__MY_ENTRY", msg)
+            self.assertNotIn("MY_SECTION__OTHER", msg)
+
+    def test_unmatched_env_vars_warning_points_to_caller(self):
+        class MySection(ConfigSection):
+            my_entry: int = 0
+
+        class MyConfig(Config):
+            my_section: MySection
+
+        env_map = {"MY_SECTION__OTHER": "1"}
+
+        with self.subTest("Internal function"):
+            with self.assertWarns(UnmatchedEnvVarWarning) as ctx:
+                fill_config_w_oracles(
+                    MyConfig(),
+                    in_stream=None,
+                    fmt=None,
+                    env_prefix=None,
+                    env_map=env_map,
+                )
+
+            self.assertEqual(__file__, ctx.filename)
+
+        with self.subTest("Public function"):
+            with patch.dict(os.environ, env_map):
+                with self.assertWarns(UnmatchedEnvVarWarning) as ctx:
+                    fill_config(MyConfig())
+
+            self.assertEqual(__file__, ctx.filename)
+
+        with self.subTest("Refill"):
+            with self.assertWarns(UnmatchedEnvVarWarning) as ctx:
+                refill_config_w_oracles(
+                    MyConfig(),
+                    StringIO(""),
+                    Format.ini,
+                    None,
+                    env_map,
+                    None,
+                    None,
+                    None,
+                )
+
+            self.assertEqual(__file__, ctx.filename)
+
+    def test_no_warning_if_all_env_vars_match(self):
+        class MySection(ConfigSection):
+            my_entry: int = 0
+
+        class MyConfig(Config):
+            my_section: MySection
+
+        with catch_warnings():
+            simplefilter("error")
+            fill_config_w_oracles(
+                MyConfig(),
+                in_stream=None,
+                fmt=None,
+                env_prefix="PREFIX",
+                env_map={"PREFIX__MY_SECTION__MY_ENTRY": "1", "MY_SECTION__X": "2"},
+            )
@@ -133,6 +133,32 @@ class FillFromINITestCase(TestCase):
         )
         self.assertEqual(13, cfg.sec.entry)
 
+    def test_interpolation_and_default_section(self):
+        class MySection(ConfigSection):
+            x: str = ""
+            y: int = 0
+            z: str = ""
+
+        class MyConfig(Config):
+            sec: MySection
+            other: MySection
+
+        cfg = MyConfig()
+        _fill_in(
+            cfg,
+            """
+            [DEFAULT]
+            y = 5
+            [sec]
+            x = a%%b
+            z = %(x)s/%(y)s
+            """,
+        )
+        self.assertEqual("a%b", cfg.sec.x)
+        self.assertEqual(5, cfg.sec.y)
+        self.assertEqual("a%b/5", cfg.sec.z)
+        self.assertEqual(0, cfg.other.y)
+
     def test_ultimate_empty_str_input(self):
         for tps in collection_type_holders:
             with self.subTest(types=tps):
@@ -1,9 +1,13 @@
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Optional, Mapping
+from typing import Optional, Mapping, FrozenSet, Tuple
 from unittest import TestCase
+from unittest.mock import patch
 from uuid import UUID
 
+# noinspection PyPackageRequirements
+import yaml
+
 # noinspection PyPackageRequirements
 from yaml import YAMLError
 
@@ -19,13 +23,24 @@ from nx_config import (
     validate,
     ValidationError,
     IncompleteSectionError,
+    YAMLLoader,
 )
 from tests.fill_test_helpers import fill_from_str
 from tests.typing_test_helpers import collection_type_holders
 
+_yaml_loaders = (None, YAMLLoader.pure_python) + (
+    (YAMLLoader.libyaml,) if yaml.__with_libyaml__ else ()
+)
 
-def _fill_in(cfg: Config, s: str, *, env_map: Optional[Mapping[str, str]] = None):
-    fill_from_str(cfg, s, Format.yaml, env_map)
+
+def _fill_in(
+    cfg: Config,
+    s: str,
+    *,
+    env_map: Optional[Mapping[str, str]] = None,
+    yaml_loader: Optional[YAMLLoader] = None,
+):
+    fill_from_str(cfg, s, Format.yaml, env_map, yaml_loader)
 
 
 class FillFromYAMLTestCase(TestCase):
@@ -292,6 +307,64 @@ class FillFromYAMLTestCase(TestCase):
 
         self.assertEqual(new_value, cfg.sec.entry)
 
+    def test_set_datetime_from_str(self):
+        class MySection(ConfigSection):
+            entry: datetime
+            entries: FrozenSet[datetime]
+
+        class MyConfig(Config):
+            sec: MySection
+
+        cfg = MyConfig()
+        _fill_in(
+            cfg,
+            """
+            sec:
+              entry: '2021-05-04T09:15:00Z'
+              entries: ['2021-05-04', 'May 5th 2021', 2021-05-06 10:00:00]
+            """,
+        )
+
+        self.assertEqual(
+            datetime(2021, 5, 4, 9, 15, tzinfo=timezone.utc), cfg.sec.entry
+        )
+        self.assertEqual(
+            frozenset(
+                (
+                    datetime(2021, 5, 4),
+                    datetime(2021, 5, 5),
+                    datetime(2021, 5, 6, 10),
+                )
+            ),
+            cfg.sec.entries,
+        )
+
+    def test_invalid_datetime_str(self):
+        class MySection(ConfigSection):
+            entry: datetime = datetime(2021, 5, 4)
+            entries: Tuple[datetime, ...] = ()
+
+        class MyConfig(Config):
+            sec: MySection
+
+        for yaml_str in (
+            "entry: 'not a date'",
+            "entries: ['2021-05-04', '2021-02-30']",
+        ):
+            with self.subTest(yaml_str=yaml_str):
+                with self.assertRaises(ValueError) as ctx:
+                    _fill_in(
+                        MyConfig(),
+                        f"""
+                        sec:
+                          {yaml_str}
+                        """,
+                    )
+
+                msg = str(ctx.exception)
+                self.assertIn("'sec'", msg)
+                self.assertIn("datetime", msg)
+
     def test_wrong_type_no_collection(self):
         for t, value in (
             (int, 3.14),
@@ -704,3 +777,74 @@ class FillFromYAMLTestCase(TestCase):
         self.assertEqual(frozenset(), cfg.sec.e6)
         self.assertEqual(frozenset(several), cfg.sec.e7)
         self.assertEqual(frozenset(("",)), cfg.sec.e8)
+
+    def test_yaml_loaders_give_same_results(self):
+        class MySection(ConfigSection):
+            e_int: int
+            e_str: str
+            e_datetime: datetime
+            e_tuple: Tuple[float, ...]
+            e_opt: Optional[Path] = Path("default")
+
+        class MyConfig(Config):
+            sec: MySection
+
+        for yaml_loader in _yaml_loaders:
+            with self.subTest(yaml_loader=yaml_loader):
+                cfg = MyConfig()
+                _fill_in(
+                    cfg,
+                    """
+                    sec:
+                      e_int: 42
+                      e_str: "Hello: world"
+                      e_datetime: 2021-05-04 09:15:00Z
+                      e_tuple: [1.5, 2.5]
+                      e_opt: null
+                    """,
+                    yaml_loader=yaml_loader,
+                )
+
+                self.assertEqual(42, cfg.sec.e_int)
+                self.assertEqual("Hello: world", cfg.sec.e_str)
+                self.assertEqual(
+                    datetime(2021, 5, 4, 9, 15, tzinfo=timezone.utc), cfg.sec.e_datetime
+                )
+                self.assertEqual((1.5, 2.5), cfg.sec.e_tuple)
+                self.assertIsNone(cfg.sec.e_opt)
+
+    def test_yaml_loaders_are_safe(self):
+        class MyConfig(Config):
+            pass
+
+        for yaml_loader in _yaml_loaders:
+            with self.subTest(yaml_loader=yaml_loader):
+                with self.assertRaises(ConstructorError):
+                    _fill_in(
+                        MyConfig(),
+                        """
+                        !!python/object/new:os.system [echo EXPLODE WORLD!]
+                        """,
+                        yaml_loader=yaml_loader,
+                    )
+
+    def test_yaml_loaders_without_libyaml(self):
+        class MySection(ConfigSection):
+            entry: int = 0
+
+        class MyConfig(Config):
+            sec: MySection
+
+        with patch.dict(yaml.__dict__):
+            yaml.__dict__.pop("CSafeLoader", None)
+
+            with self.subTest(yaml_loader=None):
+                cfg = MyConfig()
+                _fill_in(cfg, "sec: {entry: 42}")
+                self.assertEqual(42, cfg.sec.entry)
+
+            with self.subTest(yaml_loader=YAMLLoader.libyaml):
+                with self.assertRaises(ImportError) as ctx:
+                    _fill_in(MyConfig(), "sec: {}", yaml_loader=YAMLLoader.libyaml)
+
+                self.assertIn("libyaml", str(ctx.exception))
@@ -0,0 +1,163 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from nx_config import (
+    AggregateError,
+    Config,
+    ConfigSection,
+    FillObserver,
+    FillPhase,
+    Format,
+    ParsedFileCache,
+    fill_config_from_path,
+    validate,
+)
+from tests.fill_test_helpers import RecordingObserver, fill_from_str
+
+
+class FirstSection(ConfigSection):
+    my_int: int = 0
+    my_str: str = ""
+
+    @validate
+    def int_is_small(self):
+        if self.my_int > 10:
+            raise ValueError("Too big.")
+
+
+class SecondSection(ConfigSection):
+    my_float: float = 0.0
+
+
+class MyConfig(Config):
+    first: FirstSection
+    second: SecondSection
+
+
+def _phases(observer: RecordingObserver):
+    return [(x.phase, x.section, x.entry) for x in observer.events]
+
+
+_section_phases = [
+    (FillPhase.fill_entry, "first", "my_int"),
+    (FillPhase.fill_entry, "first", "my_str"),
+    (FillPhase.fill_section, "first", None),
+    (FillPhase.check_section, "first", None),
+    (FillPhase.validate_section, "first", None),
+    (FillPhase.fill_entry, "second", "my_float"),
+    (FillPhase.fill_section, "second", None),
+    (FillPhase.check_section, "second", None),
+    (FillPhase.validate_section, "second", None),
+]
+
+
+class FillConfigObserverTestCase(TestCase):
+    def test_default_observer_does_nothing(self):
+        cfg = MyConfig()
+        fill_from_str(cfg, None, None, {"FIRST__MY_INT": "3"}, observer=FillObserver())
+        self.assertEqual(3, cfg.first.my_int)
+
+    def test_events_without_input(self):
+        observer = RecordingObserver()
+        fill_from_str(MyConfig(), None, None, {}, observer=observer)
+        self.assertEqual(
+            [
+                (FillPhase.env, None, None),
+                *_section_phases,
+                (FillPhase.total, None, None),
+            ],
+            _phases(observer),
+        )
+
+        for event in observer.events:
+            self.assertIsInstance(event.duration_ns, int)
+            self.assertGreaterEqual(event.duration_ns, 0)
+
+        total = observer.events[-1].duration_ns
+        self.assertGreaterEqual(
+            total,
+            sum(
+                x.duration_ns
+                for x in observer.events[:-1]
+                if x.phase != FillPhase.fill_entry
+            ),
+        )
+
+    def test_events_with_input(self):
+        for fmt, s in (
+            (Format.yaml, "first: {my_int: 1}"),
+            (Format.ini, "[first]\nmy_int = 1\n"),
+        ):
+            with self.subTest(fmt=fmt):
+                observer = RecordingObserver()
+                cfg = MyConfig()
+                fill_from_str(
+                    cfg, s, fmt, {"SECOND__MY_FLOAT": "1.5"}, observer=observer
+                )
+                self.assertEqual((1, 1.5), (cfg.first.my_int, cfg.second.my_float))
+                self.assertEqual(
+                    [
+                        (FillPhase.parse, None, None),
+                        (FillPhase.env, None, None),
+                        *_section_phases,
+                        (FillPhase.total, None, None),
+                    ],
+                    _phases(observer),
+                )
+
+    def test_entry_threshold(self):
+        observer = RecordingObserver(entry_threshold_ns=10**12)
+        fill_from_str(MyConfig(), None, None, {}, observer=observer)
+        self.assertNotIn(FillPhase.fill_entry, [x.phase for x in observer.events])
+        self.assertIn(FillPhase.fill_section, [x.phase for x in observer.events])
+
+    def test_no_events_for_failed_phases(self):
+        observer = RecordingObserver()
+
+        with self.assertRaises(ValueError):
+            fill_from_str(
+                MyConfig(), None, None, {"FIRST__MY_INT": "11"}, observer=observer
+            )
+
+        self.assertEqual(
+            [(FillPhase.env, None, None), *_section_phases[:4]], _phases(observer)
+        )
+
+    def test_events_when_collecting_errors(self):
+        observer = RecordingObserver()
+
+        with self.assertRaises(AggregateError):
+            fill_from_str(
+                MyConfig(),
+                None,
+                None,
+                {"FIRST__MY_INT": "11", "SECOND__MY_FLOAT": "x"},
+                collect_errors=True,
+                observer=observer,
+            )
+
+        self.assertEqual(
+            [(FillPhase.env, None, None), *_section_phases[:-1]], _phases(observer)
+        )
+
+    def test_events_with_cache(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "config.yaml"
+            path.write_text("first:\n  my_int: 1\n")
+            cache = ParsedFileCache()
+
+            for _ in range(2):
+                observer = RecordingObserver()
+                fill_config_from_path(
+                    MyConfig(), path=path, cache=cache, observer=observer
+                )
+                self.assertEqual(
+                    [
+                        (FillPhase.parse, None, None),
+                        (FillPhase.env, None, None),
+                        *_section_phases,
+                        (FillPhase.total, None, None),
+                    ],
+                    _phases(observer),
+                )
@@ -0,0 +1,142 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from nx_config import (
+    AggregateError,
+    Config,
+    ConfigSection,
+    Format,
+    fill_configs,
+    validate,
+)
+
+# noinspection PyProtectedMember
+from nx_config._core.bulk_fill_with_oracles import fill_configs_w_oracles
+
+
+class MySection(ConfigSection):
+    my_int: int = 0
+    my_str: str = ""
+
+    @validate
+    def int_is_small(self):
+        if self.my_int > 10:
+            raise ValueError("Too big.")
+
+
+class MyConfig(Config):
+    sec: MySection
+
+
+class FillConfigsTestCase(TestCase):
+    def setUp(self):
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = Path(tmp_dir.name)
+
+    def write(self, name: str, content: str) -> Path:
+        path = self.tmp_dir / name
+        path.write_text(content)
+        return path
+
+    def fill(self, sources, **kwargs):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            kwargs = {
+                "fmt": None,
+                "env_prefix": None,
+                "env_map": {},
+                "yaml_loader": None,
+                "collect_errors": False,
+                "return_exceptions": False,
+                "executor": executor,
+                "max_workers": None,
+                "chunksize": 1,
+                **kwargs,
+            }
+            return fill_configs_w_oracles(MyConfig, sources, **kwargs)
+
+    def test_results_in_input_order(self):
+        sources = []
+
+        for idx in range(10):
+            if idx % 2:
+                sources.append(
+                    self.write(f"config{idx}.yaml", f"sec:\n  my_int: {idx}\n")
+                )
+            else:
+                sources.append(
+                    str(self.write(f"config{idx}.ini", f"[sec]\nmy_int = {idx}\n"))
+                )
+
+        for chunksize in (1, 3, 20):
+            with self.subTest(chunksize=chunksize):
+                results = self.fill(sources, chunksize=chunksize)
+                self.assertEqual(list(range(10)), [x.sec.my_int for x in results])
+                self.assertTrue(all(type(x) is MyConfig for x in results))
+
+    def test_streams(self):
+        results = self.fill(
+            [StringIO(f"sec:\n  my_int: {idx}\n") for idx in range(3)],
+            fmt=Format.yaml,
+        )
+        self.assertEqual([0, 1, 2], [x.sec.my_int for x in results])
+
+    def test_streams_without_format(self):
+        with self.assertRaises(ValueError):
+            self.fill([StringIO("")])
+
+    def test_env(self):
+        results = self.fill(
+            [self.write("config.yaml", "sec:\n  my_int: 1\n")],
+            env_prefix="PREFIX",
+            env_map={"PREFIX__SEC__MY_STR": "Hi"},
+        )
+        self.assertEqual((1, "Hi"), (results[0].sec.my_int, results[0].sec.my_str))
+
+    def test_errors(self):
+        sources = [
+            self.write("good.yaml", "sec:\n  my_int: 1\n"),
+            self.write("invalid.yaml", "sec:\n  my_int: 11\n"),
+            self.tmp_dir / "missing.yaml",
+            self.write("wrong.txt", ""),
+        ]
+
+        results = self.fill(sources, return_exceptions=True)
+        self.assertEqual(1, results[0].sec.my_int)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIsInstance(results[2], FileNotFoundError)
+        self.assertIsInstance(results[3], ValueError)
+        self.assertIn("unsupported extension", str(results[3]))
+
+        with self.assertRaises(ValueError) as ctx:
+            self.fill(sources)
+
+        self.assertIn("Too big.", str(ctx.exception))
+
+        results = self.fill(sources[:2], collect_errors=True, return_exceptions=True)
+        self.assertIsInstance(results[1], AggregateError)
+
+    def test_invalid_chunksize(self):
+        with self.assertRaises(ValueError):
+            self.fill([], chunksize=0)
+
+    def test_process_pool(self):
+        paths = [
+            self.write(f"config{idx}.yaml", f"sec:\n  my_int: {idx}\n")
+            for idx in range(6)
+        ]
+        paths.append(self.write("invalid.yaml", "sec:\n  my_int: 11\n"))
+
+        results = fill_configs(
+            MyConfig, paths, max_workers=2, chunksize=2, return_exceptions=True
+        )
+        self.assertEqual(list(range(6)), [x.sec.my_int for x in results[:-1]])
+        self.assertIsInstance(results[-1], ValueError)
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = fill_configs(MyConfig, paths[:2], executor=executor)
+
+        self.assertEqual([0, 1], [x.sec.my_int for x in results])
@@ -0,0 +1,108 @@
+from typing import Optional, Tuple
+from unittest import TestCase
+
+from nx_config import Config, ConfigSection, ParsingError
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_plan import get_fill_plan
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+
+class MySection(ConfigSection):
+    my_int: int = 0
+    my_tuple: Optional[Tuple[int, ...]] = None
+
+
+class OtherSection(ConfigSection):
+    my_str: str = ""
+
+
+class MyConfig(Config):
+    sec: MySection
+    other: OtherSection
+
+
+class FillPlanTestCase(TestCase):
+    def test_plan_is_cached_per_class_and_prefix(self):
+        plan = get_fill_plan(MyConfig, None)
+        self.assertIs(plan, get_fill_plan(MyConfig, None))
+
+        prefixed_plan = get_fill_plan(MyConfig, "PREFIX")
+        self.assertIsNot(plan, prefixed_plan)
+        self.assertIs(prefixed_plan, get_fill_plan(MyConfig, "PREFIX"))
+
+    def test_plans_not_shared_between_config_classes(self):
+        class MyOtherConfig(Config):
+            sec: MySection
+
+        plan = get_fill_plan(MyConfig, None)
+        other_plan = get_fill_plan(MyOtherConfig, None)
+        self.assertIsNot(plan, other_plan)
+        self.assertEqual(2, len(plan.sections))
+        self.assertEqual(1, len(other_plan.sections))
+
+    def test_plan_contents(self):
+        plan = get_fill_plan(MyConfig, "PREFIX")
+        self.assertEqual(("sec", "other"), tuple(x.section_name for x in plan.sections))
+
+        sec_plan = plan.sections[0]
+        self.assertEqual(
+            ("my_int", "my_tuple"), tuple(x.entry_name for x in sec_plan.entries)
+        )
+        self.assertEqual(
+            ("PREFIX__SEC__MY_INT", "PREFIX__SEC__MY_TUPLE"),
+            tuple(x.env_key for x in sec_plan.entries),
+        )
+        self.assertIs(MySection.my_int, sec_plan.entries[0].entry)
+
+    def test_invalid_prefix_is_not_cached(self):
+        class MyOtherConfig(Config):
+            sec: MySection
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                get_fill_plan(MyOtherConfig, "lower")
+
+    def test_repeated_fills_use_same_plan(self):
+        for value in ("1", "2", "3"):
+            with self.subTest(value=value):
+                cfg = MyConfig()
+                fill_config_w_oracles(
+                    cfg,
+                    in_stream=None,
+                    fmt=None,
+                    env_prefix="PREFIX",
+                    env_map={"PREFIX__SEC__MY_INT": value},
+                )
+                self.assertEqual(int(value), cfg.sec.my_int)
+
+    def test_fill_function_generated_once_per_section_class(self):
+        class MyOtherConfig(Config):
+            sec1: MySection
+            sec2: MySection
+
+        plan = get_fill_plan(MyOtherConfig, None)
+        prefixed_plan = get_fill_plan(MyOtherConfig, "PREFIX")
+        fill = plan.sections[0].fill
+        self.assertIs(fill, plan.sections[1].fill)
+        self.assertIs(fill, prefixed_plan.sections[0].fill)
+        self.assertIs(fill, get_fill_plan(MyConfig, None).sections[0].fill)
+        self.assertEqual(("SEC2__MY_INT", "SEC2__MY_TUPLE"), plan.sections[1].env_keys)
+
+    def test_fill_function_errors_name_env_key(self):
+        with self.assertRaises(ParsingError) as ctx:
+            fill_config_w_oracles(
+                MyConfig(),
+                in_stream=None,
+                fmt=None,
+                env_prefix="PREFIX",
+                env_map={"PREFIX__SEC__MY_TUPLE": "1, two"},
+            )
+
+        msg = str(ctx.exception)
+        self.assertIn("'sec'", msg)
+        self.assertIn("'my_tuple'", msg)
+        self.assertIn("'PREFIX__SEC__MY_TUPLE'", msg)
+        self.assertIn("'two'", msg)
@@ -0,0 +1,89 @@
+import gc
+import os
+from typing import Tuple, FrozenSet
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from nx_config import Config, ConfigSection, freeze_process_heap
+
+# noinspection PyProtectedMember
+from nx_config.process_heap import _after_fork_in_child
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+
+class MySection(ConfigSection):
+    my_int: int = 0
+    my_tuple: Tuple[int, ...] = ()
+    my_set: FrozenSet[str] = frozenset()
+
+
+class MyConfig(Config):
+    sec: MySection
+
+
+class FreezeProcessHeapTestCase(TestCase):
+    def setUp(self):
+        self.cfg = MyConfig()
+        fill_config_w_oracles(
+            self.cfg,
+            in_stream=None,
+            fmt=None,
+            env_prefix=None,
+            env_map={"SEC__MY_TUPLE": "1, 2, 3", "SEC__MY_SET": "a, b"},
+        )
+
+        if hasattr(gc, "unfreeze"):
+            self.addCleanup(gc.unfreeze)
+
+    @skipUnless(hasattr(gc, "freeze"), "gc.freeze requires Python 3.7+")
+    def test_objects_are_frozen(self):
+        other = [object()]
+        freeze_process_heap()
+        self.assertGreater(gc.get_freeze_count(), 0)
+        self.assertTrue(gc.isenabled())
+        # The whole heap is frozen, not only config objects:
+        self.assertNotIn(self.cfg, gc.get_objects())
+        self.assertNotIn(other, gc.get_objects())
+        # Frozen objects survive collections untouched:
+        gc.collect()
+        self.assertEqual(frozenset(("a", "b")), self.cfg.sec.my_set)
+
+    def test_no_collection(self):
+        with patch("gc.collect") as collect:
+            freeze_process_heap()
+
+        collect.assert_not_called()
+
+    @skipUnless(hasattr(os, "register_at_fork"), "Requires os.fork (and 3.7+)")
+    def test_gc_enabled_in_children_only(self):
+        gc.disable()
+        self.addCleanup(gc.enable)
+        freeze_process_heap()
+        self.assertGreater(gc.get_freeze_count(), 0)
+        self.assertFalse(gc.isenabled())
+        pid = os.fork()
+
+        if pid == 0:  # pragma: no cover
+            os._exit(0 if gc.isenabled() else 1)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(0, status)
+        self.assertFalse(gc.isenabled())
+
+        # Again, in this process (the hook is only registered once):
+        freeze_process_heap()
+        _after_fork_in_child()
+        self.assertTrue(gc.isenabled())
+
+    @skipUnless(hasattr(os, "register_at_fork"), "Requires os.fork (and 3.7+)")
+    def test_gc_left_alone_in_children_after_freezing_with_gc_enabled(self):
+        gc.disable()
+        self.addCleanup(gc.enable)
+        freeze_process_heap()
+        gc.enable()
+        freeze_process_heap()
+        gc.disable()
+        _after_fork_in_child()
+        self.assertFalse(gc.isenabled())
@@ -0,0 +1,93 @@
+import sys
+from inspect import cleandoc
+from pathlib import Path
+from subprocess import run, PIPE
+from typing import FrozenSet
+from unittest import TestCase, skipIf
+
+_repo_root = Path(__file__).parent.parent
+_lazily_imported = (
+    "yaml",
+    "dateutil",
+    "asyncio",
+    "concurrent",
+    "multiprocessing",
+    "pickle",
+)
+
+
+def _modules_imported_by(code: str) -> FrozenSet[str]:
+    completed = run(
+        [sys.executable, "-X", "importtime", "-c", cleandoc(code)],
+        stderr=PIPE,
+        universal_newlines=True,
+        cwd=str(_repo_root),
+        check=True,
+    )
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    return frozenset(
+        line.rsplit("|", 1)[1].strip()
+        for line in completed.stderr.splitlines()
+        if line.startswith("import time:")
+    )
+
+
+@skipIf(sys.version_info < (3, 7), "'-X importtime' requires python 3.7+")
+class ImportTimeTestCase(TestCase):
+    def assertNotImported(self, modules: FrozenSet[str]):
+        for lazy in _lazily_imported:
+            self.assertFalse(
+                any(x == lazy or x.startswith(f"{lazy}.") for x in modules),
+                f"'{lazy}' should only be imported when actually needed.",
+            )
+
+    def test_import_nx_config_is_lazy(self):
+        modules = _modules_imported_by("import nx_config")
+        self.assertIn("nx_config", modules)
+        self.assertNotImported(modules)
+
+    def test_fill_from_env_with_iso_datetime_is_lazy(self):
+        modules = _modules_imported_by("""
+            from datetime import datetime
+            from nx_config import Config, ConfigSection
+            from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+            class MySection(ConfigSection):
+                when: datetime
+
+            class MyConfig(Config):
+                sec: MySection
+
+            fill_config_w_oracles(
+                MyConfig(),
+                in_stream=None,
+                fmt=None,
+                env_prefix=None,
+                env_map={"SEC__WHEN": "2021-05-04T09:15:00Z"},
+            )
+            """)
+        self.assertNotImported(modules)
+
+    def test_lazy_modules_are_imported_when_needed(self):
+        modules = _modules_imported_by("""
+            from datetime import datetime
+            from io import StringIO
+            from nx_config import Config, ConfigSection, Format
+            from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+            class MySection(ConfigSection):
+                when: datetime
+
+            class MyConfig(Config):
+                sec: MySection
+
+            fill_config_w_oracles(
+                MyConfig(),
+                in_stream=StringIO("sec:\\n  when: May 4th 2021"),
+                fmt=Format.yaml,
+                env_prefix=None,
+                env_map={},
+            )
+            """)
+        self.assertIn("yaml", modules)
+        self.assertIn("dateutil", modules)
@@ -0,0 +1,177 @@
+from configparser import (
+    ConfigParser,
+    Error as ConfigParserError,
+    DuplicateSectionError,
+    DuplicateOptionError,
+    InterpolationDepthError,
+    InterpolationMissingOptionError,
+    InterpolationSyntaxError,
+    MissingSectionHeaderError,
+    ParsingError,
+)
+from inspect import cleandoc
+from io import StringIO
+from unittest import TestCase
+
+# noinspection PyProtectedMember
+from nx_config._core.ini_reader import read_ini
+
+_wanted = {
+    "sec": {"a": "a", "b": "b", "mixedcase": "mixedCase", "multi": "multi"},
+    "Other Sec": {"x": "x"},
+}
+
+_equivalent_inputs = (
+    """
+    [sec]
+    a = 1
+    b: 2
+    """,
+    """
+    [sec]
+    A=1
+      [not_a_section]
+    B  :  two words  
+    MixedCase = x = y : z
+    """,
+    """
+    # comment
+    ; other comment
+    [sec]
+    multi = first
+      second
+        third
+    # comment inside value
+    \t
+      fourth
+
+    a = 1
+    """,
+    """
+    [other]
+    a = 1
+    multi = x
+    [sec]
+    multi =
+      continued
+    [Other Sec]
+    x = y
+    [sec2]
+    x = z
+      continued
+    """,
+    """
+    [sec]
+    a = 1
+       # indented comment
+    b = [1, 2]
+    """,
+    """
+    [DEFAULT]
+    other = 1
+    [sec]
+    a=
+    """,
+    """
+    [DEFAULT]
+    b = default %(a)s
+    x = 1
+    [sec]
+    a = %(other)s and %(X)s, 100%%
+    mixedcase = %(b)s
+    other = o%%
+      ther
+    [other]
+    b = 2
+    [Other Sec]
+    [DEFAULT]
+    multi = %(b)s%%
+    """,
+)
+
+
+def _read_with_config_parser(s: str):
+    parser = ConfigParser()
+    parser.read_file(StringIO(s))
+    return {
+        sec_name: {
+            entry_name: parser[sec_name][entry_name]
+            for entry_name in options.values()
+            if entry_name in parser[sec_name]
+        }
+        for sec_name, options in _wanted.items()
+        if sec_name in parser
+    }
+
+
+class INIReaderTestCase(TestCase):
+    def test_same_results_as_config_parser(self):
+        for s in _equivalent_inputs:
+            s = cleandoc(s)
+
+            with self.subTest(ini=s):
+                self.assertEqual(
+                    _read_with_config_parser(s), read_ini(StringIO(s), _wanted)
+                )
+
+    def test_same_errors_as_config_parser(self):
+        for s, xcp_t in (
+            ("a = 1\n[sec]", MissingSectionHeaderError),
+            ("[sec]\na = 1\n[other]\n[sec]", DuplicateSectionError),
+            ("[other]\n[other]", DuplicateSectionError),
+            ("[sec]\na = 1\nA = 2", DuplicateOptionError),
+            ("[sec]\na = 1\nnot an option\n[other]\n= 2", ParsingError),
+            ("[other]\n[broken\nb = 2", ParsingError),
+            ("[DEFAULT]\nc = 1\n[sec]\n[DEFAULT]\nC = 2", DuplicateOptionError),
+            ("[sec]\na = 100%", InterpolationSyntaxError),
+            ("[sec]\na = %(b)\nb = 1", InterpolationSyntaxError),
+            ("[sec]\nb = %(c)s", InterpolationMissingOptionError),
+            ("[DEFAULT]\nb = %(c)s\n[sec]", InterpolationMissingOptionError),
+            ("[sec]\na = %(b)s\nb = %(a)s", InterpolationDepthError),
+        ):
+            with self.subTest(ini=s):
+                with self.assertRaises(xcp_t):
+                    _read_with_config_parser(s)
+
+                with self.assertRaises(xcp_t):
+                    read_ini(StringIO(s), _wanted)
+
+    def test_same_section_headers_as_config_parser(self):
+        # Section headers with a ']' inside are parsed differently depending
+        # on the python version: '[sec] trailing]' is the section 'sec' with
+        # python < 3.10 (so 'sec' below is a duplicate section), and the
+        # section 'sec] trailing' otherwise.
+        s = "[sec] trailing]\na = 1\n[sec]\na = 2"
+
+        try:
+            expected = _read_with_config_parser(s)
+        except DuplicateSectionError:
+            with self.assertRaises(DuplicateSectionError):
+                read_ini(StringIO(s), _wanted)
+        else:
+            self.assertEqual(expected, read_ini(StringIO(s), _wanted))
+
+    def test_parsing_error_lists_all_bad_lines(self):
+        with self.assertRaises(ParsingError) as ctx:
+            read_ini(StringIO("[sec]\nbad1\na = 1\nbad2\n"), _wanted)
+
+        self.assertEqual([2, 4], [x[0] for x in ctx.exception.errors])
+
+    def test_only_wanted_options_are_kept(self):
+        result = read_ini(
+            StringIO("[sec]\na = 1\nc = 3\n  more\n[other]\na = 1\n"),
+            {"sec": {"a": "a"}},
+        )
+        self.assertEqual({"sec": {"a": "1"}}, result)
+
+    def test_default_section_only_applies_to_sections_in_the_file(self):
+        result = read_ini(StringIO("[DEFAULT]\na = 1\nx = 2\n[sec]\nb = 3\n"), _wanted)
+        self.assertEqual({"sec": {"a": "1", "b": "3"}}, result)
+
+    def test_duplicate_unwanted_options_are_ignored(self):
+        result = read_ini(StringIO("[sec]\nc = 1\nc = 2\n[x]\ny=1\ny=2\n"), _wanted)
+        self.assertEqual({"sec": {}}, result)
+
+    def test_errors_are_config_parser_errors(self):
+        with self.assertRaises(ConfigParserError):
+            read_ini(StringIO("a = 1"), _wanted)
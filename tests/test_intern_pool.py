@@ -0,0 +1,181 @@
+import pickle
+from datetime import datetime
+from pathlib import Path
+from typing import FrozenSet, Mapping, Optional, Tuple
+from unittest import TestCase
+
+from nx_config import Config, ConfigSection, Format, InternPool
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+from tests.fill_test_helpers import fill_from_str
+
+_pool = InternPool(maxsize=64)
+
+
+class TenantSection(ConfigSection, intern_pool=_pool):
+    host: str = ""
+    path: Optional[Path] = None
+    since: Optional[datetime] = None
+    features: Tuple[str, ...] = ()
+    regions: FrozenSet[str] = frozenset()
+    ratio: float = 1.0
+    enabled: bool = False
+
+
+class OtherSection(ConfigSection):
+    host: str = ""
+
+
+class TenantConfig(Config):
+    tenant: TenantSection
+    other: OtherSection
+
+
+def _fill(env_map: Mapping[str, str]) -> TenantConfig:
+    cfg = TenantConfig()
+    fill_config_w_oracles(cfg, None, None, None, env_map=env_map)
+    return cfg
+
+
+_env_map = {
+    "TENANT__HOST": "db.example.com",
+    "TENANT__PATH": "/srv/data",
+    "TENANT__SINCE": "2021-05-04T09:15:00+02:00",
+    "TENANT__FEATURES": "a, b, c",
+    "TENANT__REGIONS": "eu, us",
+    "TENANT__RATIO": "0.5",
+    "TENANT__ENABLED": "yes",
+    "OTHER__HOST": "db.example.com",
+}
+
+
+class InternPoolTestCase(TestCase):
+    def setUp(self):
+        _pool.clear()
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError) as ctx:
+            InternPool(maxsize=0)
+
+        self.assertIn("0", str(ctx.exception))
+
+    def test_invalid_pool(self):
+        with self.assertRaises(TypeError) as ctx:
+
+            class _MySection(ConfigSection, intern_pool={}):
+                my_int: int = 0
+
+        self.assertIn("InternPool", str(ctx.exception))
+
+    def test_equal_values_are_shared(self):
+        first = _fill(_env_map)
+        second = _fill(_env_map)
+
+        for entry_name in ("host", "path", "since", "features", "regions", "ratio"):
+            with self.subTest(entry_name=entry_name):
+                self.assertIs(
+                    getattr(first.tenant, entry_name),
+                    getattr(second.tenant, entry_name),
+                )
+
+        self.assertEqual(6, len(_pool))
+        self.assertEqual(6, _pool.misses)
+        self.assertEqual(6, _pool.hits)
+        self.assertEqual(0.5, _pool.hit_rate)
+        self.assertGreater(_pool.bytes_saved, 0)
+
+    def test_shared_between_formats(self):
+        cfg = TenantConfig()
+        fill_from_str(
+            cfg,
+            """
+            tenant:
+              host: db.example.com
+              features: [a, b, c]
+              path: /srv/data
+            """,
+            Format.yaml,
+            None,
+        )
+        other = TenantConfig()
+        fill_from_str(
+            other,
+            "[tenant]\nhost = db.example.com\nfeatures = a,b,c\npath = /srv/data",
+            Format.ini,
+            None,
+        )
+        self.assertIs(cfg.tenant.host, other.tenant.host)
+        self.assertIs(cfg.tenant.features, other.tenant.features)
+        self.assertIs(cfg.tenant.path, other.tenant.path)
+
+    def test_equal_but_different_values_arent_shared(self):
+        first = _fill({"TENANT__RATIO": "0.0", "TENANT__SINCE": "2021-05-04T09:00Z"})
+        second = _fill(
+            {"TENANT__RATIO": "-0.0", "TENANT__SINCE": "2021-05-04T11:00+02:00"}
+        )
+        self.assertEqual("0.0", repr(first.tenant.ratio))
+        self.assertEqual("-0.0", repr(second.tenant.ratio))
+        self.assertEqual(first.tenant.since, second.tenant.since)
+        self.assertEqual(11, second.tenant.since.hour)
+        self.assertEqual(0, _pool.hits)
+
+    def test_none_and_bools_arent_interned(self):
+        _fill({"TENANT__PATH": "", "TENANT__ENABLED": "yes"})
+        self.assertEqual(0, len(_pool))
+        self.assertEqual(0, _pool.misses)
+        self.assertEqual(0.0, _pool.hit_rate)
+
+    def test_least_recently_used_values_are_dropped(self):
+        pool = InternPool(maxsize=2)
+
+        class MySection(ConfigSection, intern_pool=pool):
+            host: str = ""
+
+        class MyConfig(Config):
+            sec: MySection
+
+        def fill(host: str) -> MyConfig:
+            cfg = MyConfig()
+            fill_config_w_oracles(cfg, None, None, None, env_map={"SEC__HOST": host})
+            return cfg
+
+        first = fill("a.example")
+        fill("b.example")
+        self.assertIs(first.sec.host, fill("a.example").sec.host)
+        fill("c.example")  # Drops "b.example".
+        self.assertEqual(2, len(pool))
+        self.assertIs(first.sec.host, fill("a.example").sec.host)
+        self.assertEqual(2, pool.hits)
+        self.assertEqual(3, pool.misses)
+        self.assertEqual(2, pool.maxsize)
+
+    def test_clear(self):
+        _fill(_env_map)
+        _fill(_env_map)
+        _pool.clear()
+        self.assertEqual(0, len(_pool))
+        self.assertEqual((0, 0, 0), (_pool.hits, _pool.misses, _pool.bytes_saved))
+
+    def test_subclasses_use_the_same_pool(self):
+        class SubSection(TenantSection):
+            pass
+
+        class MySection(SubSection):
+            name: str = ""
+
+        class MyConfig(Config):
+            sec: MySection
+
+        cfg = MyConfig()
+        fill_config_w_oracles(
+            cfg, None, None, None, env_map={"SEC__NAME": "db.example.com"}
+        )
+        self.assertIs(cfg.sec.name, _fill(_env_map).tenant.host)
+
+    def test_unpickled_values_are_interned(self):
+        cfg = _fill(_env_map)
+        restored = pickle.loads(pickle.dumps(cfg))
+        self.assertIs(cfg.tenant.features, restored.tenant.features)
+        self.assertIs(cfg.tenant.since, restored.tenant.since)
+        self.assertIsNot(cfg.other.host, restored.other.host)
@@ -0,0 +1,261 @@
+import pickle
+from array import array
+from sys import byteorder, getsizeof
+from typing import Mapping, Optional, Tuple
+from unittest import TestCase
+
+from nx_config import (
+    Config,
+    ConfigSection,
+    FloatArray,
+    Format,
+    IntArray,
+    InternPool,
+)
+
+# noinspection PyProtectedMember
+from nx_config.numeric_array import _from_bytes
+from nx_config.test_utils import update_section
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+# noinspection PyProtectedMember
+from nx_config._core.fingerprint import section_fingerprint
+from tests.fill_test_helpers import fill_from_str
+
+_pool = InternPool()
+
+
+class ArraysSection(ConfigSection, intern_pool=_pool):
+    ids: IntArray = IntArray()
+    weights: FloatArray = FloatArray((0.5, 1.5))
+    maybe_ids: Optional[IntArray] = None
+
+
+class CompactArraysSection(ConfigSection, compact=True, intern_pool=_pool):
+    ids: IntArray = IntArray()
+    weights: FloatArray = FloatArray()
+
+
+class SparseArraysSection(ConfigSection, sparse=True):
+    ids: IntArray = IntArray()
+    weights: FloatArray = FloatArray()
+
+
+class ArraysConfig(Config):
+    arrays: ArraysSection
+    compact: CompactArraysSection
+    sparse: SparseArraysSection
+
+
+def _fill(env_map: Mapping[str, str]) -> ArraysConfig:
+    cfg = ArraysConfig()
+    fill_config_w_oracles(cfg, None, None, None, env_map=env_map)
+    return cfg
+
+
+class NumericArrayTestCase(TestCase):
+    def setUp(self):
+        _pool.clear()
+
+    def test_sequence(self):
+        ids = IntArray(range(5))
+        self.assertEqual(5, len(ids))
+        self.assertEqual(3, ids[3])
+        self.assertEqual(4, ids[-1])
+        self.assertEqual(IntArray((1, 3)), ids[1::2])
+        self.assertEqual([0, 1, 2, 3, 4], list(ids))
+        self.assertEqual([0, 1, 2, 3, 4], ids.tolist())
+        self.assertEqual("IntArray([0, 1, 2, 3, 4])", repr(ids))
+        self.assertEqual("FloatArray([1.0, 2.5])", repr(FloatArray((1, 2.5))))
+
+    def test_equality_and_hashing(self):
+        self.assertEqual(IntArray((1, 2)), IntArray([1, 2]))
+        self.assertNotEqual(IntArray((1, 2)), IntArray((2, 1)))
+        self.assertNotEqual(IntArray((1, 2)), FloatArray((1, 2)))
+        self.assertNotEqual(IntArray((1, 2)), (1, 2))
+        self.assertEqual(hash(IntArray((1, 2))), hash(IntArray((1, 2))))
+        self.assertEqual(hash(FloatArray((0.0,))), hash(FloatArray((-0.0,))))
+        self.assertEqual(1, len({IntArray((1, 2)), IntArray((1, 2))}))
+
+    def test_read_only(self):
+        ids = IntArray((1, 2))
+
+        with self.assertRaises(TypeError):
+            # noinspection PyUnresolvedReferences
+            ids[0] = 3
+
+        with self.assertRaises(TypeError):
+            ids.view[0] = 3
+
+        self.assertEqual(IntArray((1, 2)), ids)
+
+    def test_zero_copy_view(self):
+        ids = IntArray((1, 2, 3))
+        view = ids.view
+        self.assertTrue(view.readonly)
+        self.assertEqual("q", view.format)
+        self.assertEqual(8, view.itemsize)
+        self.assertIs(view.obj, ids.view.obj)
+        self.assertEqual("d", FloatArray().view.format)
+
+    def test_invalid_values(self):
+        with self.assertRaises(TypeError):
+            IntArray((1.5,))
+
+        with self.assertRaises(OverflowError):
+            IntArray((2**63,))
+
+    def test_pickling(self):
+        weights = FloatArray((0.5, -0.0, 2.0))
+        restored = pickle.loads(pickle.dumps(weights))
+        self.assertIs(FloatArray, type(restored))
+        self.assertEqual(weights, restored)
+        self.assertEqual("-0.0", repr(restored[1]))
+
+    def test_unpickling_other_byte_order(self):
+        ids = IntArray((1, 2))
+        _, (array_t, data, _) = ids.__reduce__()
+        other_byteorder = "big" if byteorder == "little" else "little"
+        swapped = array("q", data)
+        swapped.byteswap()
+        restored = _from_bytes(array_t, swapped.tobytes(), other_byteorder)
+        self.assertEqual(ids, restored)
+
+    def test_stored_unboxed(self):
+        n = 10000
+        self.assertLess(getsizeof(IntArray(range(n))), 8 * n + 1000)
+        self.assertLess(getsizeof(FloatArray(range(n))), 8 * n + 1000)
+
+    def test_fill_from_env(self):
+        cfg = _fill(
+            {
+                "ARRAYS__IDS": "1, 2,3 ,-4",
+                "ARRAYS__WEIGHTS": "1e3, -0.5, 7",
+                "ARRAYS__MAYBE_IDS": "",
+            }
+        )
+        self.assertEqual(IntArray((1, 2, 3, -4)), cfg.arrays.ids)
+        self.assertEqual(FloatArray((1000.0, -0.5, 7.0)), cfg.arrays.weights)
+        self.assertIsNone(cfg.arrays.maybe_ids)
+
+        cfg = _fill({"ARRAYS__WEIGHTS": "", "ARRAYS__MAYBE_IDS": "5"})
+        self.assertEqual(FloatArray(), cfg.arrays.weights)
+        self.assertEqual(IntArray((5,)), cfg.arrays.maybe_ids)
+
+    def test_fill_from_ini(self):
+        cfg = ArraysConfig()
+        fill_from_str(cfg, "[arrays]\nids = 1,2\nweights = 3", Format.ini, None)
+        self.assertEqual(IntArray((1, 2)), cfg.arrays.ids)
+        self.assertEqual(FloatArray((3.0,)), cfg.arrays.weights)
+
+    def test_fill_from_yaml(self):
+        cfg = ArraysConfig()
+        fill_from_str(
+            cfg,
+            """
+            arrays:
+              ids: [1, 2, 3]
+              weights: [1, 2.5]
+              maybe_ids: 4, 5
+            """,
+            Format.yaml,
+            None,
+        )
+        self.assertEqual(IntArray((1, 2, 3)), cfg.arrays.ids)
+        self.assertEqual(FloatArray((1.0, 2.5)), cfg.arrays.weights)
+        self.assertIs(float, type(cfg.arrays.weights[0]))
+        self.assertEqual(IntArray((4, 5)), cfg.arrays.maybe_ids)
+
+    def test_invalid_strings(self):
+        for env_value in ("1, x", "1.5", "1,,2", str(2**63)):
+            with self.subTest(env_value=env_value):
+                with self.assertRaises(ValueError) as ctx:
+                    _fill({"ARRAYS__IDS": env_value})
+
+                self.assertIn("IntArray", str(ctx.exception))
+
+    def test_invalid_yaml_lists(self):
+        for yaml_value in ("[1, a]", "[1.5]", f"[{2 ** 63}]"):
+            with self.subTest(yaml_value=yaml_value):
+                with self.assertRaises(ValueError) as ctx:
+                    fill_from_str(
+                        ArraysConfig(),
+                        f"""
+                        arrays:
+                          ids: {yaml_value}
+                        """,
+                        Format.yaml,
+                        None,
+                    )
+
+                self.assertIn("IntArray", str(ctx.exception))
+
+        with self.assertRaises(TypeError):
+            fill_from_str(
+                ArraysConfig(),
+                """
+                arrays:
+                  ids: 1
+                """,
+                Format.yaml,
+                None,
+            )
+
+    def test_type_hints(self):
+        with self.assertRaises(TypeError):
+
+            class _MySection(ConfigSection):
+                ids: Tuple[IntArray, ...] = ()
+
+        with self.assertRaises(TypeError):
+
+            class _MyOtherSection(ConfigSection):
+                ids: IntArray = (1, 2)
+
+        with self.assertRaises(TypeError):
+            update_section(ArraysSection(), ids=FloatArray((1, 2)))
+
+    def test_printing(self):
+        cfg = _fill({"ARRAYS__IDS": "1, 2"})
+        self.assertIn("ids=IntArray([1, 2])", repr(cfg.arrays))
+        self.assertIn("ids=IntArray([1, 2])", str(cfg.arrays))
+
+    def test_equal_arrays_are_interned(self):
+        first = _fill({"ARRAYS__IDS": "1, 2", "ARRAYS__WEIGHTS": "0.0"})
+        second = _fill({"ARRAYS__IDS": "1,2", "ARRAYS__WEIGHTS": "0"})
+        third = _fill({"ARRAYS__WEIGHTS": "-0.0"})
+        self.assertIs(first.arrays.ids, second.arrays.ids)
+        self.assertIs(first.arrays.weights, second.arrays.weights)
+        self.assertEqual("-0.0", repr(third.arrays.weights[0]))
+        self.assertGreater(_pool.bytes_saved, 16)
+
+    def test_pickling_configs(self):
+        cfg = _fill({"ARRAYS__IDS": "1, 2, 3", "ARRAYS__WEIGHTS": "-0.0"})
+        restored = pickle.loads(pickle.dumps(cfg))
+        self.assertEqual(dict(cfg.arrays), dict(restored.arrays))
+
+    def test_fingerprints(self):
+        def fingerprint(env_map: Mapping[str, str]) -> bytes:
+            return section_fingerprint(_fill(env_map).arrays)
+
+        self.assertEqual(
+            fingerprint({"ARRAYS__IDS": "1, 2"}), fingerprint({"ARRAYS__IDS": "1,2"})
+        )
+        self.assertNotEqual(
+            fingerprint({"ARRAYS__IDS": "1, 2"}), fingerprint({"ARRAYS__IDS": "1, 3"})
+        )
+        self.assertNotEqual(
+            fingerprint({"ARRAYS__WEIGHTS": "0.0"}),
+            fingerprint({"ARRAYS__WEIGHTS": "-0.0"}),
+        )
+
+    def test_compact_and_sparse_sections(self):
+        cfg = _fill({"COMPACT__IDS": "7, 8", "SPARSE__WEIGHTS": "0.5"})
+        self.assertEqual(IntArray((7, 8)), cfg.compact.ids)
+        self.assertEqual(FloatArray((0.5,)), cfg.sparse.weights)
+        self.assertIs(cfg.compact.ids, _fill({"COMPACT__IDS": "7,8"}).compact.ids)
+        restored = pickle.loads(pickle.dumps(cfg))
+        self.assertEqual(dict(cfg.compact), dict(restored.compact))
+        self.assertEqual(dict(cfg.sparse), dict(restored.sparse))
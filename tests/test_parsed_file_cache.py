@@ -0,0 +1,140 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from nx_config import Config, ConfigSection, ParsedFileCache, fill_config_from_path
+
+
+class SmallConfig(Config):
+    class SmallSection(ConfigSection):
+        entry: int = 0
+
+    sec: SmallSection
+
+
+class OtherConfig(Config):
+    class OtherSection(ConfigSection):
+        other: int = 0
+
+    sec: OtherSection
+
+
+class ParsedFileCacheTestCase(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write(self, name: str, content: str) -> Path:
+        path = Path(self.tmp_dir.name) / name
+        path.write_text(content)
+        return path
+
+    def fill(self, path: Path, cache: ParsedFileCache, config_t=SmallConfig):
+        cfg = config_t()
+        fill_config_from_path(cfg, path=path, cache=cache)
+        return cfg
+
+    def test_invalid_maxsize(self):
+        for maxsize in (0, -1):
+            with self.subTest(maxsize=maxsize):
+                with self.assertRaises(ValueError):
+                    ParsedFileCache(maxsize=maxsize)
+
+    def test_hits_and_misses(self):
+        for ext, content in (
+            (".yaml", "sec:\n  entry: 42\n"),
+            (".ini", "[sec]\nentry = 42\n"),
+        ):
+            with self.subTest(ext=ext):
+                path = self.write(f"config{ext}", content)
+                cache = ParsedFileCache()
+                self.assertEqual((0, 0, 0), (cache.hits, cache.misses, len(cache)))
+
+                for i in range(3):
+                    self.assertEqual(42, self.fill(path, cache).sec.entry)
+                    self.assertEqual((i, 1, 1), (cache.hits, cache.misses, len(cache)))
+
+    def test_env_still_applied_on_hits(self):
+        path = self.write("config.yaml", "sec:\n  entry: 42\n")
+        cache = ParsedFileCache()
+        self.fill(path, cache)
+        os.environ["SEC__ENTRY"] = "7"
+
+        try:
+            self.assertEqual(7, self.fill(path, cache).sec.entry)
+        finally:
+            del os.environ["SEC__ENTRY"]
+
+        self.assertEqual(1, cache.hits)
+
+    def test_modified_file_is_parsed_again(self):
+        path = self.write("config.yaml", "sec:\n  entry: 42\n")
+        cache = ParsedFileCache()
+        self.fill(path, cache)
+        mtime_ns = path.stat().st_mtime_ns
+
+        # Same size, only the modification time differs:
+        path.write_text("sec:\n  entry: 43\n")
+        os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+        self.assertEqual(43, self.fill(path, cache).sec.entry)
+        self.assertEqual((0, 2, 1), (cache.hits, cache.misses, len(cache)))
+
+        # Same modification time, only the size differs:
+        path.write_text("sec:\n  entry: 4444\n")
+        os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+        self.assertEqual(4444, self.fill(path, cache).sec.entry)
+        self.assertEqual((0, 3, 1), (cache.hits, cache.misses, len(cache)))
+
+    def test_least_recently_used_is_evicted(self):
+        paths = [
+            self.write(f"config{i}.yaml", f"sec:\n  entry: {i}\n") for i in range(3)
+        ]
+        cache = ParsedFileCache(maxsize=2)
+        self.assertEqual(2, cache.maxsize)
+
+        self.fill(paths[0], cache)
+        self.fill(paths[1], cache)
+        self.fill(paths[0], cache)
+        self.fill(paths[2], cache)  # Evicts 'paths[1]'
+        self.assertEqual((1, 3, 2), (cache.hits, cache.misses, len(cache)))
+
+        self.assertEqual(0, self.fill(paths[0], cache).sec.entry)
+        self.assertEqual(2, self.fill(paths[2], cache).sec.entry)
+        self.assertEqual((3, 3), (cache.hits, cache.misses))
+        self.assertEqual(1, self.fill(paths[1], cache).sec.entry)
+        self.assertEqual((3, 4), (cache.hits, cache.misses))
+
+    def test_clear(self):
+        path = self.write("config.yaml", "sec:\n  entry: 42\n")
+        cache = ParsedFileCache()
+        self.fill(path, cache)
+        self.fill(path, cache)
+        cache.clear()
+        self.assertEqual((0, 0, 0), (cache.hits, cache.misses, len(cache)))
+        self.assertEqual(42, self.fill(path, cache).sec.entry)
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+
+    def test_yaml_shared_between_config_classes(self):
+        path = self.write("config.yaml", "sec:\n  entry: 1\n  other: 2\n")
+        cache = ParsedFileCache()
+        self.assertEqual(1, self.fill(path, cache, SmallConfig).sec.entry)
+        self.assertEqual(2, self.fill(path, cache, OtherConfig).sec.other)
+        self.assertEqual((1, 1, 1), (cache.hits, cache.misses, len(cache)))
+
+    def test_ini_keyed_by_config_class(self):
+        path = self.write("config.ini", "[sec]\nentry = 1\nother = 2\n")
+        cache = ParsedFileCache()
+        self.assertEqual(1, self.fill(path, cache, SmallConfig).sec.entry)
+        self.assertEqual(2, self.fill(path, cache, OtherConfig).sec.other)
+        self.assertEqual((0, 2, 2), (cache.hits, cache.misses, len(cache)))
+
+    def test_parse_errors_are_not_cached(self):
+        path = self.write("config.yaml", "sec: [\n")
+        cache = ParsedFileCache()
+
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                self.fill(path, cache)
+
+        self.assertEqual((0, 2, 0), (cache.hits, cache.misses, len(cache)))
@@ -0,0 +1,86 @@
+import pickle
+from copy import deepcopy
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import FrozenSet, Optional, Tuple
+from unittest import TestCase
+from uuid import UUID
+
+from nx_config import Config, ConfigSection, SecretString, URL
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+# noinspection PyProtectedMember
+from nx_config._core.unset import Unset
+
+
+class MySection(ConfigSection):
+    my_int: int = 42
+    my_str: str = "Hello"
+    my_secret: SecretString
+    my_url: URL = "https://www.example.com"
+    my_path: Path = Path("/tmp")
+    my_uuid: UUID = UUID("8a3d5a1f-9a0e-4b1a-8a52-4d9c1e3c2a7b")
+    my_datetime: datetime = datetime(2021, 5, 4, 9, 15, tzinfo=timezone.utc)
+    my_tuple: Tuple[int, ...] = (1, 2)
+    my_frozenset: FrozenSet[str] = frozenset(("a", "b"))
+    my_optional: Optional[float] = None
+
+
+class OtherSection(ConfigSection):
+    my_bool: bool = False
+
+
+class MyConfig(Config):
+    sec: MySection
+    other: OtherSection
+
+
+def _filled() -> MyConfig:
+    cfg = MyConfig()
+    fill_config_w_oracles(
+        cfg,
+        in_stream=None,
+        fmt=None,
+        env_prefix=None,
+        env_map={"SEC__MY_SECRET": "abc", "OTHER__MY_BOOL": "yes"},
+    )
+    return cfg
+
+
+class PicklingTestCase(TestCase):
+    def test_config_round_trip(self):
+        cfg = _filled()
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                copied = pickle.loads(pickle.dumps(cfg, protocol=protocol))
+                self.assertIs(MyConfig, type(copied))
+                self.assertIs(MySection, type(copied.sec))
+                # Not comparing 'repr's, the order of the elements of equal
+                # frozensets can differ.
+                self.assertEqual(dict(cfg.sec), dict(copied.sec))
+                self.assertEqual(dict(cfg.other), dict(copied.other))
+                self.assertEqual(True, copied.other.my_bool)
+
+    def test_copies_are_still_immutable(self):
+        copied = pickle.loads(pickle.dumps(_filled()))
+
+        with self.assertRaises(AttributeError):
+            copied.sec = MySection()
+
+        with self.assertRaises(AttributeError):
+            copied.sec.my_int = 0
+
+    def test_deepcopy(self):
+        cfg = _filled()
+        copied = deepcopy(cfg)
+        self.assertIsNot(cfg.sec, copied.sec)
+        self.assertEqual(dict(cfg.sec), dict(copied.sec))
+
+    def test_unset_stays_unique(self):
+        section = MySection()
+        self.assertIs(Unset, section.my_secret)
+        self.assertIs(Unset, pickle.loads(pickle.dumps(section)).my_secret)
+        self.assertIs(Unset, pickle.loads(pickle.dumps(Unset)))
@@ -0,0 +1,573 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Event
+from time import sleep
+from typing import Tuple
+from unittest import TestCase
+from unittest.mock import patch
+
+from nx_config import Config, ConfigSection, ReloadableConfig, validate
+from nx_config.test_utils import update_section
+
+
+class MySection(ConfigSection):
+    my_int: int
+    my_str: str = ""
+
+    @validate
+    def int_is_small(self):
+        if self.my_int > 10:
+            raise ValueError("Too big.")
+
+
+class MyConfig(Config):
+    sec: MySection
+
+
+class ReloadableConfigTestCase(TestCase):
+    def setUp(self):
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = Path(tmp_dir.name) / "config.yaml"
+        self.write(1)
+
+    def write(self, my_int, my_str: str = "") -> Path:
+        # Bumps the modification time explicitly, so that changes are detected
+        # even on file systems with coarse timestamps.
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns + 1_000_000_000
+        except FileNotFoundError:
+            mtime_ns = None
+
+        self.path.write_text(f"sec:\n  my_int: {my_int}\n  my_str: '{my_str}'\n")
+
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+        return self.path
+
+    def test_initial_fill(self):
+        handle = ReloadableConfig(MyConfig, path=str(self.path))
+        self.assertIsInstance(handle.current, MyConfig)
+        self.assertEqual(1, handle.current.sec.my_int)
+        self.assertEqual(self.path, handle.path)
+
+    def test_initial_fill_errors_are_raised(self):
+        self.write(11)
+
+        with self.assertRaises(ValueError):
+            ReloadableConfig(MyConfig, path=self.path)
+
+    def test_invalid_poll_interval(self):
+        for poll_interval in (0, -1.0):
+            with self.subTest(poll_interval=poll_interval):
+                with self.assertRaises(ValueError):
+                    ReloadableConfig(
+                        MyConfig, path=self.path, poll_interval=poll_interval
+                    )
+
+    def test_check_reloads_only_changed_file(self):
+        reloaded = []
+        handle = ReloadableConfig(MyConfig, path=self.path, on_reload=reloaded.append)
+        old = handle.current
+        self.assertFalse(handle.check())
+        self.assertIs(old, handle.current)
+
+        self.write(2)
+        self.assertTrue(handle.check())
+        self.assertEqual(2, handle.current.sec.my_int)
+        self.assertEqual([handle.current], reloaded)
+        self.assertFalse(handle.check())
+
+        # Old snapshots are unaffected:
+        self.assertEqual(1, old.sec.my_int)
+
+    def test_reload_forces_new_config(self):
+        handle = ReloadableConfig(MyConfig, path=self.path)
+        old = handle.current
+        self.assertTrue(handle.reload())
+        self.assertIsNot(old, handle.current)
+        self.assertEqual(1, handle.current.sec.my_int)
+
+    def test_failed_reload_keeps_old_config(self):
+        errors = []
+        handle = ReloadableConfig(MyConfig, path=self.path, on_error=errors.append)
+        old = handle.current
+
+        for content, error_t in ((11, ValueError), ("not an int", TypeError)):
+            with self.subTest(content=content):
+                self.write(content)
+                self.assertFalse(handle.check())
+                self.assertIs(old, handle.current)
+                self.assertIsInstance(errors[-1], error_t)
+
+        # Failed contents aren't retried until the file changes again:
+        self.assertFalse(handle.check())
+        self.assertEqual(2, len(errors))
+
+        self.write(3)
+        self.assertTrue(handle.check())
+        self.assertEqual(3, handle.current.sec.my_int)
+
+    def test_errors_without_callback(self):
+        handle = ReloadableConfig(MyConfig, path=self.path)
+        old = handle.current
+        self.write(11)
+        self.assertFalse(handle.check())
+        self.assertIs(old, handle.current)
+
+    def test_failing_callbacks(self):
+        errors = []
+
+        def fail_on_reload(_cfg):
+            raise RuntimeError("Reload callback failed.")
+
+        def fail_on_error(xcp):
+            errors.append(xcp)
+            raise RuntimeError("Error callback failed.")
+
+        handle = ReloadableConfig(
+            MyConfig, path=self.path, on_reload=fail_on_reload, on_error=fail_on_error
+        )
+        self.write(2)
+
+        with self.assertLogs("nx_config.reloadable_config", level="ERROR") as logs:
+            self.assertTrue(handle.check())
+
+        self.assertEqual(2, handle.current.sec.my_int)
+        self.assertEqual(["Reload callback failed."], [str(x) for x in errors])
+        self.assertIn("Error callback failed.", logs.output[0])
+
+    def test_failing_callbacks_dont_stop_watching(self):
+        reloads = []
+        reloaded = (Event(), Event())
+
+        def on_reload(cfg):
+            reloads.append(cfg.sec.my_int)
+            reloaded[len(reloads) - 1].set()
+            raise RuntimeError("Reload callback failed.")
+
+        handle = ReloadableConfig(
+            MyConfig, path=self.path, poll_interval=0.01, on_reload=on_reload
+        )
+
+        with handle:
+            self.write(2)
+            self.assertTrue(reloaded[0].wait(timeout=10.0))
+            self.write(3)
+            self.assertTrue(reloaded[1].wait(timeout=10.0))
+
+        self.assertEqual([2, 3], reloads)
+
+    def test_missing_file_reported_once(self):
+        errors = []
+        handle = ReloadableConfig(MyConfig, path=self.path, on_error=errors.append)
+        old = handle.current
+        self.path.unlink()
+
+        for _ in range(2):
+            self.assertFalse(handle.check())
+            self.assertIs(old, handle.current)
+
+        self.assertEqual(1, len(errors))
+        self.assertIsInstance(errors[0], FileNotFoundError)
+
+        self.write(4)
+        self.assertTrue(handle.check())
+        self.assertEqual(4, handle.current.sec.my_int)
+
+    def test_atomic_replace_is_detected(self):
+        handle = ReloadableConfig(MyConfig, path=self.path)
+        new_path = self.path.with_name("new.yaml")
+        new_path.write_text("sec:\n  my_int: 5\n")
+        os.replace(new_path, self.path)
+        self.assertTrue(handle.check())
+        self.assertEqual(5, handle.current.sec.my_int)
+
+    def test_background_watching(self):
+        reloaded = Event()
+        handle = ReloadableConfig(
+            MyConfig,
+            path=self.path,
+            poll_interval=0.01,
+            on_reload=lambda _: reloaded.set(),
+        )
+
+        with handle:
+            handle.start()  # No-op
+            self.write(6)
+            self.assertTrue(reloaded.wait(timeout=10.0))
+
+        self.assertEqual(6, handle.current.sec.my_int)
+        handle.stop()  # No-op
+
+
+validation_counts = {"first": 0, "second": 0}
+
+
+class FirstSection(ConfigSection):
+    my_int: int = 0
+    my_list: Tuple[int, ...] = ()
+
+    @validate
+    def count(self):
+        validation_counts["first"] += 1
+
+
+class SecondSection(ConfigSection):
+    my_float: float = 0.0
+
+    @validate
+    def count(self):
+        validation_counts["second"] += 1
+
+
+class TwoSectionConfig(Config):
+    first: FirstSection
+    second: SecondSection
+
+
+class IncrementalReloadTestCase(TestCase):
+    def setUp(self):
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = Path(tmp_dir.name)
+        validation_counts.update(first=0, second=0)
+
+    def write(self, name: str, content: str) -> Path:
+        path = self.tmp_dir / name
+
+        try:
+            mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+        except FileNotFoundError:
+            mtime_ns = None
+
+        path.write_text(content)
+
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        return path
+
+    def test_only_changed_sections_are_refilled(self):
+        for name, contents in (
+            (
+                "config.yaml",
+                (
+                    "first:\n  my_int: 1\nsecond:\n  my_float: 1.5\n",
+                    "first:\n  my_int: 1\nsecond:\n  my_float: 2.5\n",
+                    "first:\n  my_int: 2\n  my_list: [1]\nsecond:\n  my_float: 2.5\n",
+                ),
+            ),
+            (
+                "config.ini",
+                (
+                    "[first]\nmy_int = 1\n[second]\nmy_float = 1.5\n",
+                    "[first]\nmy_int = 1\n[second]\nmy_float = 2.5\n",
+                    "[first]\nmy_int = 2\nmy_list = 1\n[second]\nmy_float = 2.5\n",
+                ),
+            ),
+        ):
+            with self.subTest(name=name):
+                validation_counts.update(first=0, second=0)
+                path = self.write(name, contents[0])
+                handle = ReloadableConfig(TwoSectionConfig, path=path, incremental=True)
+                self.assertEqual(("first", "second"), handle.changed_sections)
+                self.assertEqual({"first": 1, "second": 1}, validation_counts)
+                old = handle.current
+
+                self.write(name, contents[1])
+                self.assertTrue(handle.check())
+                self.assertEqual(("second",), handle.changed_sections)
+                self.assertEqual({"first": 1, "second": 2}, validation_counts)
+                self.assertIs(old.first, handle.current.first)
+                self.assertEqual(2.5, handle.current.second.my_float)
+                self.assertEqual(1.5, old.second.my_float)
+
+                self.write(name, contents[2])
+                self.assertTrue(handle.check())
+                self.assertEqual(("first",), handle.changed_sections)
+                self.assertEqual(
+                    (2, (1,)),
+                    (handle.current.first.my_int, handle.current.first.my_list),
+                )
+
+                self.assertTrue(handle.reload())
+                self.assertEqual((), handle.changed_sections)
+                self.assertEqual({"first": 2, "second": 2}, validation_counts)
+
+    def test_env_changes_are_detected(self):
+        path = self.write("config.yaml", "first:\n  my_int: 1\n")
+        handle = ReloadableConfig(TwoSectionConfig, path=path, incremental=True)
+
+        with patch.dict(os.environ, {"SECOND__MY_FLOAT": "3.5"}):
+            self.assertTrue(handle.reload())
+            self.assertEqual(("second",), handle.changed_sections)
+            self.assertEqual(3.5, handle.current.second.my_float)
+
+        self.assertTrue(handle.reload())
+        self.assertEqual(("second",), handle.changed_sections)
+        self.assertEqual(0.0, handle.current.second.my_float)
+
+    def test_equal_values_of_different_types_are_changes(self):
+        path = self.write("config.yaml", "first:\n  my_int: 1\n")
+        handle = ReloadableConfig(TwoSectionConfig, path=path, incremental=True)
+
+        # 'True == 1', but the new value must still be type-checked (and set):
+        self.write("config.yaml", "first:\n  my_int: true\n")
+        self.assertTrue(handle.check())
+        self.assertEqual(("first",), handle.changed_sections)
+        self.assertIs(True, handle.current.first.my_int)
+
+    def test_rollback(self):
+        for incremental in (False, True):
+            with self.subTest(incremental=incremental):
+                path = self.write("config.yaml", "first:\n  my_int: 1\n")
+                handle = ReloadableConfig(
+                    TwoSectionConfig, path=path, incremental=incremental, history=2
+                )
+                good = handle.current
+                self.write("config.yaml", "first:\n  my_int: 2\n")
+                self.assertTrue(handle.check())
+                self.assertIs(good, handle.rollback())
+                self.assertIs(good, handle.current)
+                self.assertEqual((), handle.changed_sections)
+                # Not reloaded until the file changes again:
+                self.assertFalse(handle.check())
+
+                # Reloading after a rollback doesn't reuse sections of the
+                # config that was rolled back:
+                self.assertTrue(handle.reload())
+                self.assertEqual(2, handle.current.first.my_int)
+
+                if incremental:
+                    self.assertEqual(("first", "second"), handle.changed_sections)
+
+    def test_reload_after_publish_doesnt_reuse_sections(self):
+        path = self.write("config.yaml", "first:\n  my_int: 1\n")
+        handle = ReloadableConfig(TwoSectionConfig, path=path, incremental=True)
+        published = TwoSectionConfig()
+        update_section(published.first, my_int=5)
+
+        for publish in (
+            lambda: handle.publish(published),
+            lambda: handle.update(lambda _: published),
+        ):
+            publish()
+            self.assertTrue(handle.reload())
+            self.assertEqual(1, handle.current.first.my_int)
+            self.assertIsNot(published.second, handle.current.second)
+            self.assertEqual(("first", "second"), handle.changed_sections)
+
+    def test_not_incremental(self):
+        path = self.write("config.yaml", "first:\n  my_int: 1\n")
+        handle = ReloadableConfig(TwoSectionConfig, path=path)
+        old = handle.current
+        self.assertTrue(handle.reload())
+        self.assertIsNot(old.first, handle.current.first)
+        self.assertEqual((), handle.changed_sections)
+        self.assertEqual({"first": 2, "second": 2}, validation_counts)
+
+
+class SubscriptionTestCase(TestCase):
+    def setUp(self):
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = Path(tmp_dir.name) / "config.yaml"
+        self.write(1, [])
+
+    def write(self, my_int, my_list, my_float: float = 0.0):
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns + 1_000_000_000
+        except FileNotFoundError:
+            mtime_ns = None
+
+        self.path.write_text(
+            f"first:\n  my_int: {my_int}\n  my_list: {my_list}\n"
+            f"second:\n  my_float: {my_float}\n"
+        )
+
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_entry_and_section_subscriptions(self):
+        for incremental in (False, True):
+            with self.subTest(incremental=incremental):
+                self.write(1, [])
+                handle = ReloadableConfig(
+                    TwoSectionConfig, path=self.path, incremental=incremental
+                )
+                calls = []
+                handle.subscribe(
+                    "first",
+                    lambda *args: calls.append(("my_int", args)),
+                    entry="my_int",
+                )
+                handle.subscribe(
+                    "first",
+                    lambda *args: calls.append(("my_list", args)),
+                    entry="my_list",
+                )
+                handle.subscribe("second", lambda *args: calls.append(("second", args)))
+
+                self.assertTrue(handle.reload())
+                self.assertEqual([], calls)
+
+                self.write(2, [])
+                old = handle.current
+                self.assertTrue(handle.check())
+                self.assertEqual([("my_int", (1, 2))], calls)
+
+                calls.clear()
+                self.write(2, [1, 2], 1.5)
+                self.assertTrue(handle.check())
+                self.assertEqual(
+                    [
+                        ("my_list", ((), (1, 2))),
+                        ("second", (old.second, handle.current.second)),
+                    ],
+                    calls,
+                )
+
+    def test_changes_of_type_are_changes(self):
+        handle = ReloadableConfig(TwoSectionConfig, path=self.path)
+        calls = []
+        handle.subscribe("first", lambda *args: calls.append(args), entry="my_int")
+        handle.subscribe("first", lambda *args: calls.append(args))
+        self.write("true", [])
+        self.assertTrue(handle.check())
+        self.assertEqual(2, len(calls))
+        self.assertEqual((1, True), calls[0])
+        self.assertIs(True, calls[0][1])
+
+    def test_rollback_notifies_subscribers(self):
+        handle = ReloadableConfig(TwoSectionConfig, path=self.path, history=1)
+        calls = []
+        handle.subscribe("first", lambda *args: calls.append(args), entry="my_int")
+        handle.subscribe("second", lambda *args: calls.append(args))
+        self.write(2, [])
+        self.assertTrue(handle.check())
+        self.assertEqual([(1, 2)], calls)
+
+        calls.clear()
+        handle.rollback()
+        self.assertEqual(1, handle.current.first.my_int)
+        self.assertEqual([(2, 1)], calls)
+
+    def test_unsubscribe(self):
+        handle = ReloadableConfig(TwoSectionConfig, path=self.path)
+        calls = []
+        unsubscribe = handle.subscribe("first", calls.append, entry="my_int")
+        other_calls = []
+        handle.subscribe("first", lambda *args: other_calls.append(args))
+        unsubscribe()
+        unsubscribe()  # No-op
+        self.write(2, [])
+        self.assertTrue(handle.check())
+        self.assertEqual([], calls)
+        self.assertEqual(1, len(other_calls))
+
+    def test_unknown_section_or_entry(self):
+        handle = ReloadableConfig(TwoSectionConfig, path=self.path)
+
+        for section, entry in (("third", None), ("first", "my_float")):
+            with self.subTest(section=section, entry=entry):
+                with self.assertRaises(ValueError) as ctx:
+                    handle.subscribe(section, print, entry=entry)
+
+                msg = str(ctx.exception)
+                self.assertIn(section if entry is None else entry, msg)
+                self.assertIn("TwoSectionConfig", msg)
+
+    def test_callback_errors_are_reported(self):
+        errors = []
+        handle = ReloadableConfig(
+            TwoSectionConfig, path=self.path, on_error=errors.append
+        )
+        calls = []
+
+        def fail(_old, _new):
+            raise RuntimeError("Oops.")
+
+        handle.subscribe("first", fail)
+        handle.subscribe("first", lambda *args: calls.append(args), entry="my_int")
+        self.write(2, [])
+        self.assertTrue(handle.check())
+        self.assertEqual(2, handle.current.first.my_int)
+        self.assertEqual([(1, 2)], calls)
+        self.assertEqual(1, len(errors))
+        self.assertIsInstance(errors[0], RuntimeError)
+
+    def test_invalid_debounce(self):
+        with self.assertRaises(ValueError) as ctx:
+            ReloadableConfig(TwoSectionConfig, path=self.path, debounce=-0.1)
+
+        self.assertIn("debounce", str(ctx.exception))
+
+    def test_debounced_bursts_cause_single_reload(self):
+        reloads = []
+        reloaded = Event()
+        calls = []
+
+        def on_reload(cfg):
+            reloads.append(cfg)
+            reloaded.set()
+
+        handle = ReloadableConfig(
+            TwoSectionConfig,
+            path=self.path,
+            poll_interval=0.01,
+            on_reload=on_reload,
+            debounce=0.5,
+        )
+        handle.subscribe("first", lambda *args: calls.append(args), entry="my_int")
+
+        with handle:
+            # Well within the debounce window, but slow enough for the watcher
+            # to see each write:
+            for my_int in (2, 3, 4):
+                self.write(my_int, [])
+                sleep(0.1)
+
+            self.assertTrue(reloaded.wait(timeout=10.0))
+
+        self.assertEqual([4], [x.first.my_int for x in reloads])
+        self.assertEqual([(1, 4)], calls)
+
+    def test_debounce_with_missing_file(self):
+        errors = []
+        handle = ReloadableConfig(
+            TwoSectionConfig,
+            path=self.path,
+            poll_interval=0.01,
+            on_error=errors.append,
+            debounce=0.01,
+        )
+        self.path.unlink()
+
+        with handle:
+            for _ in range(1000):
+                if errors:
+                    break
+
+                sleep(0.01)
+
+            # More polls, without reporting the same error again:
+            sleep(0.1)
+
+        self.assertEqual(1, len(errors))
+        self.assertIsInstance(errors[0], FileNotFoundError)
+
+    def test_stop_while_debouncing(self):
+        handle = ReloadableConfig(
+            TwoSectionConfig, path=self.path, poll_interval=0.01, debounce=60.0
+        )
+        old = handle.current
+
+        with handle:
+            self.write(2, [])
+            # Wait for the watcher to notice the change (and start waiting):
+            sleep(0.2)
+
+        self.assertIs(old, handle.current)
@@ -1,9 +1,10 @@
+import sys
 from datetime import timedelta
 from sys import getsizeof
 from typing import Optional
 from unittest import TestCase
 
-from nx_config import ConfigSection, validate
+from nx_config import Config, ConfigSection, validate
 
 
 class EmptySection(ConfigSection):
@@ -271,3 +272,63 @@ class SectionTestCase(TestCase):
             fifth: Optional[str] = "Hello"
 
         self.assertEqual(5, len(MySection()))
+
+    def test_generated_init_sets_all_defaults(self):
+        class MySection(ConfigSection):
+            my_int: int = 42
+            my_str: Optional[str] = None
+            my_unset: float
+
+        sec = MySection()
+        self.assertEqual(42, sec.my_int)
+        self.assertIsNone(sec.my_str)
+        self.assertEqual("Unset", repr(sec.my_unset))
+        self.assertEqual(
+            f"{MySection.__qualname__}.__init__", MySection.__init__.__qualname__
+        )
+
+    def test_subclass_without_entries_keeps_inherited_init(self):
+        class MySection(ConfigSection):
+            my_int: int = 42
+
+        class MySubSection(MySection):
+            pass
+
+        self.assertIs(MySection.__init__, MySubSection.__init__)
+        self.assertEqual(42, MySubSection().my_int)
+
+    def test_reading_entries_runs_no_python_code(self):
+        class MySection(ConfigSection):
+            my_int: int = 42
+
+        class MyConfig(Config):
+            my_section: MySection
+
+        cfg = MyConfig()
+        python_calls = []
+
+        def profile(frame, event, _arg):
+            if event == "call":
+                python_calls.append(frame.f_code.co_name)
+
+        sys.setprofile(profile)
+
+        try:
+            value = cfg.my_section.my_int
+        finally:
+            sys.setprofile(None)
+
+        self.assertEqual(42, value)
+        self.assertEqual([], python_calls)
+
+    def test_entry_from_class(self):
+        class MySection(ConfigSection):
+            my_int: int = 42
+
+        entry = MySection.my_int
+        self.assertEqual(42, entry.default)
+        self.assertEqual("my_int", entry.entry_name)
+        self.assertEqual("Config entry 'my_int'.", entry.__doc__)
+
+        with self.assertRaises(AttributeError):
+            del MySection().my_int
@@ -0,0 +1,332 @@
+import pickle
+import sys
+from datetime import datetime, timedelta, timezone
+from multiprocessing import get_context
+from subprocess import PIPE, run
+from threading import Thread, Timer
+from time import sleep
+from pathlib import Path
+from typing import FrozenSet, Optional, Tuple
+from unittest import TestCase, skipIf
+from uuid import UUID, uuid4
+
+from nx_config import (
+    Config,
+    ConfigSection,
+    FloatArray,
+    IntArray,
+    SecretString,
+    SharedConfig,
+)
+
+# noinspection PyProtectedMember
+from nx_config.shared_config import _header_size
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+
+class FirstSection(ConfigSection):
+    my_int: int = 0
+    my_float: float = 0.0
+    my_bool: bool = False
+    my_str: str = ""
+    my_secret: Optional[SecretString] = None
+
+
+class SecondSection(ConfigSection):
+    my_path: Path = Path("/tmp")
+    my_uuid: Optional[UUID] = None
+    my_datetime: Optional[datetime] = None
+    my_tuple: Tuple[int, ...] = ()
+    my_set: FrozenSet[str] = frozenset()
+    my_ids: IntArray = IntArray()
+    my_weights: FloatArray = FloatArray()
+
+
+class MyConfig(Config):
+    first: FirstSection
+    second: SecondSection
+
+
+class OtherSection(ConfigSection):
+    my_int: int = 0
+
+
+class OtherConfig(Config):
+    first: OtherSection
+
+
+def _filled(env_map) -> MyConfig:
+    cfg = MyConfig()
+    fill_config_w_oracles(
+        cfg, in_stream=None, fmt=None, env_prefix=None, env_map=env_map
+    )
+    return cfg
+
+
+def _values(cfg: Config):
+    return {
+        section_name: dict(getattr(cfg, section_name))
+        for section_name in type(cfg).__annotations__
+    }
+
+
+def _read_in_child(name: str, queue):
+    with SharedConfig.attach(MyConfig, name=name) as shared:
+        queue.put((shared.version, _values(shared.current)))
+
+
+_uuid = uuid4()
+_env_map = {
+    "FIRST__MY_INT": "42",
+    "FIRST__MY_FLOAT": "1.5",
+    "FIRST__MY_BOOL": "yes",
+    "FIRST__MY_STR": "hello",
+    "FIRST__MY_SECRET": "s3cr3t",
+    "SECOND__MY_PATH": "/var/lib/app",
+    "SECOND__MY_UUID": str(_uuid),
+    "SECOND__MY_DATETIME": "2021-02-03T04:05:06+01:30",
+    "SECOND__MY_TUPLE": "1, 2, 3",
+    "SECOND__MY_SET": "a, b",
+    "SECOND__MY_IDS": "1, 2, 3",
+    "SECOND__MY_WEIGHTS": "0.5, -0.0",
+}
+
+
+@skipIf(sys.version_info < (3, 8), "SharedConfig requires Python 3.8+")
+class SharedConfigTestCase(TestCase):
+    def setUp(self):
+        self.cfg = _filled(_env_map)
+        self.shared = SharedConfig.create(self.cfg)
+        self.addCleanup(self.shared.__exit__, None, None, None)
+
+    def attach(self) -> SharedConfig:
+        attached = SharedConfig.attach(MyConfig, name=self.shared.name)
+        self.addCleanup(attached.close)
+        return attached
+
+    def test_round_trip(self):
+        attached = self.attach()
+        cfg = attached.current
+        self.assertIsInstance(cfg, MyConfig)
+        self.assertIsNot(self.cfg, cfg)
+        self.assertEqual(_values(self.cfg), _values(cfg))
+        self.assertEqual(
+            datetime(2021, 2, 3, 4, 5, 6, tzinfo=timezone(timedelta(hours=1.5))),
+            cfg.second.my_datetime,
+        )
+        self.assertEqual(_uuid, cfg.second.my_uuid)
+        self.assertEqual(1, attached.version)
+
+        with self.assertRaises(AttributeError):
+            # noinspection PyPropertyAccess
+            cfg.first.my_int = 3
+
+    def test_current_is_only_rebuilt_after_publish(self):
+        attached = self.attach()
+        old = attached.current
+        self.assertIs(old, attached.current)
+
+        self.shared.publish(_filled({"FIRST__MY_INT": "7"}))
+        self.assertEqual(2, self.shared.version)
+        self.assertEqual(2, attached.version)
+        new = attached.current
+        self.assertIsNot(old, new)
+        self.assertIs(new, attached.current)
+        self.assertEqual(7, new.first.my_int)
+        self.assertEqual(Path("/tmp"), new.second.my_path)
+        # Old snapshots are unaffected:
+        self.assertEqual(42, old.first.my_int)
+
+    def test_other_process(self):
+        ctx = get_context("spawn")
+        queue = ctx.SimpleQueue()
+        self.shared.publish(_filled({"FIRST__MY_STR": "from parent"}))
+        process = ctx.Process(target=_read_in_child, args=(self.shared.name, queue))
+        process.start()
+        version, values = queue.get()
+        process.join()
+        self.assertEqual(0, process.exitcode)
+        self.assertEqual(2, version)
+        self.assertEqual(_values(self.shared.current), values)
+        self.assertEqual("from parent", values["first"]["my_str"])
+
+    def test_attach_with_other_class(self):
+        with self.assertRaises(ValueError) as ctx:
+            SharedConfig.attach(OtherConfig, name=self.shared.name)
+
+        self.assertIn("OtherConfig", str(ctx.exception))
+
+    def test_attach_to_missing_segment(self):
+        with self.assertRaises(FileNotFoundError):
+            SharedConfig.attach(MyConfig, name=f"{self.shared.name}_missing")
+
+    def test_only_creator_can_publish(self):
+        attached = self.attach()
+
+        with self.assertRaises(RuntimeError) as ctx:
+            attached.publish(self.cfg)
+
+        self.assertIn(self.shared.name, str(ctx.exception))
+
+    def test_publish_wrong_type(self):
+        other = OtherConfig()
+        fill_config_w_oracles(
+            other, in_stream=None, fmt=None, env_prefix=None, env_map={}
+        )
+
+        with self.assertRaises(TypeError) as ctx:
+            # noinspection PyTypeChecker
+            self.shared.publish(other)
+
+        self.assertIn("OtherConfig", str(ctx.exception))
+        self.assertEqual(1, self.shared.version)
+
+    def test_config_too_large(self):
+        with self.assertRaises(ValueError) as ctx:
+            self.shared.publish(_filled({"FIRST__MY_STR": "x" * 100_000}))
+
+        self.assertIn("too large", str(ctx.exception))
+        self.assertEqual(1, self.shared.version)
+        self.assertEqual(42, self.attach().current.first.my_int)
+
+        with self.assertRaises(ValueError):
+            SharedConfig.create(self.cfg, size=32)
+
+    def test_only_values_are_accepted(self):
+        class Evil:
+            def __reduce__(self):
+                return print, ("Evil.",)
+
+        payload = pickle.dumps(((), Evil()))
+
+        with SharedConfig.create(self.cfg) as shared:
+            buf = shared._shm.buf
+            buf[:16] = (4).to_bytes(8, "little") + len(payload).to_bytes(8, "little")
+            buf[_header_size : _header_size + len(payload)] = payload
+
+            with self.assertRaises(pickle.UnpicklingError) as ctx:
+                SharedConfig.attach(MyConfig, name=shared.name)
+
+            self.assertIn("builtins.print", str(ctx.exception))
+
+    def test_attached_context_manager_doesnt_unlink(self):
+        with SharedConfig.attach(MyConfig, name=self.shared.name) as attached:
+            self.assertEqual(42, attached.current.first.my_int)
+
+        self.assertEqual(42, self.attach().current.first.my_int)
+
+    def test_read_waits_for_publish_in_progress(self):
+        attached = self.attach()
+        old = attached.current
+        buf = self.shared._shm.buf
+
+        def finish_publish():
+            buf[:8] = (4).to_bytes(8, "little")
+
+        # An odd version means that the next version is being written, which
+        # is finished (with the same payload) by the timer:
+        buf[:8] = (3).to_bytes(8, "little")
+        timer = Timer(0.05, finish_publish)
+        timer.start()
+        self.addCleanup(timer.join)
+        new = attached.current
+        self.assertIsNot(old, new)
+        self.assertEqual(_values(old), _values(new))
+        self.assertEqual(2, attached.version)
+
+    def test_read_gives_up_if_publish_never_finishes(self):
+        attached = SharedConfig.attach(
+            MyConfig, name=self.shared.name, read_timeout=0.05
+        )
+        self.addCleanup(attached.close)
+        buf = self.shared._shm.buf
+        # As if the publisher died after starting to write version 2:
+        buf[:8] = (3).to_bytes(8, "little")
+        self.addCleanup(buf.__setitem__, slice(0, 8), (2).to_bytes(8, "little"))
+
+        with self.assertRaises(TimeoutError) as ctx:
+            _ = attached.current
+
+        self.assertIn(self.shared.name, str(ctx.exception))
+
+    def test_invalid_read_timeout(self):
+        with self.assertRaises(ValueError):
+            SharedConfig.create(self.cfg, read_timeout=0)
+
+        with self.assertRaises(ValueError) as ctx:
+            SharedConfig.attach(MyConfig, name=self.shared.name, read_timeout=-1)
+
+        self.assertIn("read_timeout", str(ctx.exception))
+        self.assertEqual(42, self.attach().current.first.my_int)
+
+    def test_unrelated_process_doesnt_unlink(self):
+        # An unrelated process has its own resource tracker, which unlinks
+        # the segments registered with it when the process exits.
+        script = (
+            "from nx_config import SharedConfig\n"
+            "from tests.test_shared_config import MyConfig\n"
+            f"SharedConfig.attach(MyConfig, name='{self.shared.name}').close()\n"
+        )
+        result = run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).parent.parent,
+            stderr=PIPE,
+            timeout=60,
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+        sleep(0.2)  # The tracker of the other process exits after it.
+        self.assertEqual(42, self.attach().current.first.my_int)
+        self.assertNotIn(b"leaked", result.stderr)
+
+    def test_only_creator_can_unlink(self):
+        attached = self.attach()
+
+        with self.assertRaises(RuntimeError) as ctx:
+            attached.unlink()
+
+        self.assertIn(self.shared.name, str(ctx.exception))
+        self.assertEqual(42, self.attach().current.first.my_int)
+
+    def test_attaching_with_creators_tracker(self):
+        # Attaching from the creating process (or its 'multiprocessing'
+        # children) unregisters the segment from the creator's tracker, which
+        # is made up for when unlinking.
+        script = (
+            "from nx_config import SharedConfig\n"
+            "from tests.test_shared_config import MyConfig, _env_map, _filled\n"
+            "with SharedConfig.create(_filled(_env_map)) as shared:\n"
+            "    SharedConfig.attach(MyConfig, name=shared.name).close()\n"
+        )
+        result = run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).parent.parent,
+            stderr=PIPE,
+            timeout=60,
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertEqual(b"", result.stderr)
+
+    def test_concurrent_publishing_and_reading(self):
+        attached = self.attach()
+        configs = [
+            _filled({"FIRST__MY_INT": str(x), "FIRST__MY_STR": str(x) * x})
+            for x in range(1, 6)
+        ]
+
+        def publish_all():
+            for _ in range(50):
+                for cfg in configs:
+                    self.shared.publish(cfg)
+
+        writer = Thread(target=publish_all)
+        writer.start()
+
+        while writer.is_alive():
+            cfg = attached.current
+            self.assertEqual(str(cfg.first.my_int) * cfg.first.my_int, cfg.first.my_str)
+
+        writer.join()
+        self.assertEqual(5, attached.current.first.my_int)
+        self.assertEqual(251, attached.version)
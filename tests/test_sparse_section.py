@@ -0,0 +1,218 @@
+import pickle
+from pathlib import Path
+from typing import Mapping, Optional, Tuple
+from unittest import TestCase
+
+from nx_config import (
+    AggregateError,
+    Config,
+    ConfigHolder,
+    ConfigSection,
+    FillObserver,
+    Format,
+    IncompleteSectionError,
+    InternPool,
+)
+from nx_config.test_utils import update_section
+
+# noinspection PyProtectedMember
+from nx_config._core.fill_with_oracles import fill_config_w_oracles
+
+# noinspection PyProtectedMember
+from nx_config._core.naming_utils import section_overrides_attr
+from tests.fill_test_helpers import NullObserver, fill_from_str
+
+
+class SparseSection(ConfigSection, sparse=True):
+    my_int: int = 42
+    my_str: str = "Hello"
+    my_float: float = 0.0
+    my_path: Optional[Path] = None
+    my_tuple: Tuple[int, ...] = (1, 2)
+    my_required: float
+
+
+class OrdinarySection(ConfigSection):
+    my_int: int = 42
+    my_str: str = "Hello"
+    my_float: float = 0.0
+    my_path: Optional[Path] = None
+    my_tuple: Tuple[int, ...] = (1, 2)
+    my_required: float
+
+
+class SparseConfig(Config):
+    sparse: SparseSection
+    ordinary: OrdinarySection
+
+
+def _overrides(section: ConfigSection) -> Optional[dict]:
+    return getattr(section, section_overrides_attr)
+
+
+def _fill(
+    s: str,
+    env_map: Mapping[str, str],
+    collect_errors: bool = False,
+    observer: Optional[FillObserver] = None,
+) -> SparseConfig:
+    cfg = SparseConfig()
+    fill_from_str(cfg, s, Format.ini, env_map, None, collect_errors, observer)
+    return cfg
+
+
+_ini = """
+[sparse]
+my_str = World
+my_required = 1.5
+[ordinary]
+my_str = World
+my_required = 1.5
+"""
+
+
+class SparseSectionTestCase(TestCase):
+    def test_storage(self):
+        self.assertEqual((section_overrides_attr,), SparseSection.__slots__)
+        self.assertIsNone(_overrides(SparseSection()))
+
+    def test_defaults(self):
+        sec = SparseSection()
+        self.assertEqual(42, sec.my_int)
+        self.assertEqual("Hello", sec.my_str)
+        self.assertIsNone(sec.my_path)
+        self.assertIs(SparseSection.my_tuple.default, sec.my_tuple)
+        self.assertEqual("Unset", repr(sec.my_required))
+
+    def test_mapping_and_printing(self):
+        cfg = _fill(_ini, {})
+        self.assertEqual(dict(cfg.ordinary), dict(cfg.sparse))
+        self.assertEqual(6, len(cfg.sparse))
+        self.assertEqual("World", cfg.sparse["my_str"])
+        self.assertEqual(
+            str(cfg.ordinary).replace("OrdinarySection", "SparseSection"),
+            str(cfg.sparse),
+        )
+
+    def test_fill_stores_only_overridden_entries(self):
+        cfg = _fill(_ini, {"SPARSE__MY_INT": "42", "SPARSE__MY_PATH": "/tmp"})
+        self.assertEqual(
+            {
+                "my_int": 42,
+                "my_str": "World",
+                "my_path": Path("/tmp"),
+                "my_required": 1.5,
+            },
+            _overrides(cfg.sparse),
+        )
+        self.assertEqual((1, 2), cfg.sparse.my_tuple)
+        self.assertEqual(0.0, cfg.sparse.my_float)
+
+    def test_fill_without_overrides(self):
+        cfg = _fill("", {"SPARSE__MY_REQUIRED": "1", "ORDINARY__MY_REQUIRED": "1"})
+        self.assertEqual({"my_required": 1.0}, _overrides(cfg.sparse))
+
+        with self.assertRaises(IncompleteSectionError):
+            _fill("", {"ORDINARY__MY_REQUIRED": "1.0"})
+
+    def test_fill_collecting_errors(self):
+        with self.assertRaises(AggregateError) as ctx:
+            _fill(
+                _ini,
+                {"SPARSE__MY_INT": "nope", "SPARSE__MY_FLOAT": "x"},
+                collect_errors=True,
+                observer=NullObserver(),
+            )
+
+        problems = ctx.exception.problems
+        self.assertEqual(
+            [("sparse", "my_int"), ("sparse", "my_float")],
+            [(x.section, x.entry) for x in problems],
+        )
+
+    def test_update_section(self):
+        cfg = _fill(_ini, {})
+        overrides = _overrides(cfg.sparse)
+        update_section(cfg.sparse, my_int=3, my_float=2.5)
+        self.assertEqual(3, cfg.sparse.my_int)
+        self.assertEqual(2.5, cfg.sparse.my_float)
+        self.assertEqual("World", cfg.sparse.my_str)
+        # Replaced, not modified in place:
+        self.assertEqual({"my_str": "World", "my_required": 1.5}, overrides)
+
+        sec = SparseSection()
+        update_section(sec, my_str="Bye")
+        self.assertEqual({"my_str": "Bye"}, _overrides(sec))
+
+        with self.assertRaises(TypeError):
+            update_section(cfg.sparse, my_int="3")
+
+    def test_pickling_keeps_only_values_differing_from_defaults(self):
+        cfg = _fill(_ini, {"SPARSE__MY_INT": "42", "SPARSE__MY_FLOAT": "-0.0"})
+        restored = pickle.loads(pickle.dumps(cfg))
+        self.assertIsInstance(restored.sparse, SparseSection)
+        self.assertEqual(dict(cfg.sparse), dict(restored.sparse))
+        self.assertEqual(
+            {"my_str": "World", "my_float": -0.0, "my_required": 1.5},
+            _overrides(restored.sparse),
+        )
+        self.assertEqual("-0.0", repr(restored.sparse.my_float))
+
+        restored = pickle.loads(pickle.dumps(SparseSection()))
+        self.assertIsNone(_overrides(restored))
+
+    def test_config_holder_dedupes_sparse_sections(self):
+        holder = ConfigHolder(_fill(_ini, {}), history=1)
+        holder.publish(_fill(_ini, {"ORDINARY__MY_INT": "1"}))
+        self.assertIs(holder.snapshots[0].config.sparse, holder.current.sparse)
+        holder.publish(_fill(_ini, {"SPARSE__MY_INT": "1"}))
+        self.assertIsNot(holder.snapshots[0].config.sparse, holder.current.sparse)
+
+    def test_with_intern_pool(self):
+        pool = InternPool()
+
+        class MySection(ConfigSection, sparse=True, intern_pool=pool):
+            my_str: str = ""
+
+        class MyConfig(Config):
+            sec: MySection
+
+        configs = [MyConfig(), MyConfig()]
+
+        for cfg in configs:
+            fill_config_w_oracles(
+                cfg, None, None, None, env_map={"SEC__MY_STR": "".join("abc")}
+            )
+
+        self.assertIs(configs[0].sec.my_str, configs[1].sec.my_str)
+        self.assertEqual(1, pool.hits)
+
+    def test_subclasses(self):
+        class SubSection(SparseSection):
+            pass
+
+        class OtherSection(SparseSection, sparse=False):
+            pass
+
+        self.assertEqual((), SubSection.__slots__)
+        self.assertEqual(42, SubSection().my_int)
+        self.assertEqual(42, OtherSection().my_int)
+
+    def test_cannot_be_compact_and_sparse(self):
+        with self.assertRaises(ValueError) as ctx:
+
+            class _MySection(ConfigSection, compact=True, sparse=True):
+                my_int: int = 0
+
+        self.assertIn("compact", str(ctx.exception))
+        self.assertIn("sparse", str(ctx.exception))
+
+        with self.assertRaises(ValueError):
+
+            class _MySubSection(SparseSection, compact=True):
+                pass
+
+        class MySubSection(SparseSection, sparse=False, compact=True):
+            my_int: int = 0
+
+        self.assertEqual(0, MySubSection().my_int)